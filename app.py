@@ -2,91 +2,287 @@
 CV Generator API - Aplicación Principal
 
 Este módulo es el punto de entrada principal de la aplicación FastAPI para generar y gestionar CVs.
-Configura la aplicación FastAPI, el sistema de logging, y los middlewares necesarios.
+`create_app` configura la aplicación FastAPI, el sistema de logging, y los middlewares necesarios.
+
+Importar el módulo no tiene efectos: la configuración, el logging, las rutas
+y sus dependencias se cargan al crear la aplicación, y la conexión a la base
+de datos se abre en el ciclo de vida. `app` se crea en el primer acceso, por
+lo que `uvicorn app:app` y `from app import app` siguen funcionando.
 """
 
+import asyncio
+import importlib
 import logging
 import os
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.staticfiles import StaticFiles
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.templating import Jinja2Templates
-from dotenv import load_dotenv
-
-# Cargar variables de entorno
-load_dotenv()
-
-# Configuración del sistema de logging
-logging.basicConfig(
-    level=logging.INFO if os.getenv("DEBUG", "False").lower() == "true" else logging.WARNING,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
+
+from config import Settings, get_settings, set_settings
+
+# Referencia para medir el tiempo hasta que la aplicación está lista
+_IMPORT_START = time.perf_counter()
+
 logger = logging.getLogger(__name__)
 
 # Obtener la ruta base del proyecto
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-logger.info(f"Directorio base: {BASE_DIR}")
-
-# Crear la aplicación FastAPI
-app = FastAPI(
-    title=os.getenv("APP_NAME", "CV Generator API"),
-    version=os.getenv("APP_VERSION", "1.0.0"),
-    description="API para generar CVs en formato PDF y HTML",
-    docs_url="/docs",
-    redoc_url="/redoc"
-)
-
-# Configurar CORS para permitir peticiones desde cualquier origen
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # En producción, especificar los orígenes permitidos
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Montar archivos estáticos
-static_path = os.path.join(BASE_DIR, "static")
-logger.info(f"Directorio de archivos estáticos: {static_path}")
-app.mount("/static", StaticFiles(directory=static_path), name="static")
-
-# Configurar templates
-templates_path = os.path.join(BASE_DIR, "templates")
-logger.info(f"Directorio de templates: {templates_path}")
-templates = Jinja2Templates(directory=templates_path)
-
-# Middleware para logging de requests
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    logger.info(f"Request path: {request.url.path}")
-    response = await call_next(request)
-    logger.info(f"Response status: {response.status_code}")
-    return response
-
-# Importar y registrar las rutas
-from routes.user_routes import router
-app.include_router(router)
-logger.info("Rutas registradas:")
-for route in app.routes:
-    if hasattr(route, 'methods'):
-        logger.info(f"  {route.path} [{route.methods}]")
-
-# Manejador de errores global
-@app.exception_handler(HTTPException)
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 3)
+
+
+def _timed_import(name: str, report: dict):
+    """
+    Importa un módulo y registra en el reporte de arranque cuánto tardó.
+
+    El tiempo incluye solo los módulos que aún no se habían importado.
+
+    Args:
+        name (str): Nombre del módulo
+        report (dict): Reporte de arranque de la aplicación
+
+    Returns:
+        module: Módulo importado
+    """
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    report["imports_ms"][name] = _elapsed_ms(start)
+    return module
+
+
+async def _build_suggestion_index():
+    """
+    Construye el índice de autocompletado con los perfiles existentes.
+    """
+    from db.repository import get_repository
+    from utils.suggest_index import SUGGEST_SOURCE_FIELDS, get_suggestion_index
+
+    index = get_suggestion_index()
+    if index is None:
+        return
+    try:
+        profiles = get_repository().iter_profiles(get_settings().export_batch_size, fields=SUGGEST_SOURCE_FIELDS)
+        await index.build(profiles)
+    except Exception as e:
+        logger.error(f"Error al construir el índice de sugerencias: {str(e)}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ciclo de vida de la aplicación.
+
+    Al iniciar conecta el repositorio de perfiles (en MongoDB precalentando
+    el pool), verifica sus índices, construye el índice de autocompletado y
+    arranca el listener que invalida la caché de perfiles, los workers de la
+    cola de trabajos de PDF, la reconstrucción periódica del índice de
+    autocompletado y, con varios workers, las instantáneas de métricas. Al
+    apagar detiene las tareas periódicas y el listener, espera hasta
+    `SERVER_GRACEFUL_TIMEOUT` segundos a que terminen los trabajos de PDF,
+    detiene el pool de generación de PDF y cierra el repositorio.
+
+    La duración de cada paso del arranque se agrega al reporte de arranque.
+    """
+    from db.repository import get_repository
+    from utils.pdf_jobs import get_pdf_job_queue
+    from utils.pdf_utils import shutdown_pdf_executor
+
+    report = app.state.startup
+    start = time.perf_counter()
+    step = start
+    repository = get_repository()
+    await repository.connect()
+    report["lifespan_ms"]["connect"] = _elapsed_ms(step)
+    step = time.perf_counter()
+    await repository.ensure_indexes()
+    report["lifespan_ms"]["ensure_indexes"] = _elapsed_ms(step)
+    step = time.perf_counter()
+    await _build_suggestion_index()
+    report["lifespan_ms"]["suggestion_index"] = _elapsed_ms(step)
+    step = time.perf_counter()
+    profile_change_listener = repository.start_change_listener()
+    pdf_job_queue = get_pdf_job_queue()
+    await pdf_job_queue.start()
+    report["lifespan_ms"]["pdf_jobs"] = _elapsed_ms(step)
+    settings = get_settings()
+    suggestion_refresh = None
+    if settings.suggest_enabled and settings.suggest_refresh_interval > 0:
+        from utils.suggest_index import refresh_loop
+        suggestion_refresh = asyncio.get_running_loop().create_task(
+            refresh_loop(_build_suggestion_index, settings.suggest_refresh_interval)
+        )
+    metrics_snapshots = None
+    if settings.metrics_enabled and settings.metrics_multiprocess_dir:
+        from utils.metrics import snapshot_loop
+        metrics_snapshots = asyncio.get_running_loop().create_task(
+            snapshot_loop(settings.metrics_multiprocess_dir, settings.metrics_snapshot_interval)
+        )
+    report["lifespan_ms"]["total"] = _elapsed_ms(start)
+    report["ready_ms"] = _elapsed_ms(_IMPORT_START)
+    logger.info(f"Aplicación lista en {report['ready_ms']:.0f} ms (creación {report['create_app_ms']:.0f} ms, "
+                f"arranque {report['lifespan_ms']['total']:.0f} ms)")
+    yield
+    if profile_change_listener is not None:
+        profile_change_listener.cancel()
+    if suggestion_refresh is not None:
+        suggestion_refresh.cancel()
+    if metrics_snapshots is not None:
+        from utils.metrics import REGISTRY
+        metrics_snapshots.cancel()
+        REGISTRY.write_snapshot(settings.metrics_multiprocess_dir, exiting=True)
+    await pdf_job_queue.stop(settings.server_graceful_timeout)
+    shutdown_pdf_executor()
+    await repository.close()
+
+
+def check_duplicate_routes(app: FastAPI):
+    """
+    Verifica que cada método y ruta estén registrados una sola vez.
+
+    Una ruta duplicada nunca se atiende (gana la primera) y alarga la lista
+    que se recorre en cada petición.
+
+    Args:
+        app (FastAPI): Aplicación con las rutas registradas
+
+    Raises:
+        RuntimeError: Si hay rutas duplicadas
+    """
+    seen = set()
+    duplicates = []
+    for route in app.routes:
+        for method in sorted(getattr(route, "methods", None) or ()):
+            key = (method, route.path)
+            if key in seen:
+                duplicates.append(f"{method} {route.path}")
+            seen.add(key)
+    if duplicates:
+        raise RuntimeError(f"Rutas registradas más de una vez: {', '.join(duplicates)}")
+
+
 async def http_exception_handler(request, exc):
     """
     Manejador global de excepciones HTTP.
     Registra los errores en el log y devuelve una respuesta JSON apropiada.
     """
     logger.error(f"Error HTTP {exc.status_code}: {exc.detail}")
-    return {
-        "error": True,
-        "status_code": exc.status_code,
-        "message": exc.detail
-    }
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={
+            "error": True,
+            "status_code": exc.status_code,
+            "message": exc.detail
+        },
+        headers=getattr(exc, "headers", None)
+    )
+
+
+def create_app(settings: Optional[Settings] = None) -> FastAPI:
+    """
+    Crea la aplicación FastAPI con sus middlewares y rutas.
+
+    Las rutas y los middlewares se importan aquí, y el tiempo de importación
+    de cada uno queda en el reporte de arranque (`GET /health/startup`), junto
+    con la duración de la creación y del arranque de la aplicación.
+
+    Args:
+        settings (Settings, optional): Configuración a usar; si se omite se
+            lee del entorno. Reemplaza la configuración del proceso, por lo
+            que se debe crear una sola aplicación por proceso.
+
+    Returns:
+        FastAPI: Aplicación configurada
+
+    Raises:
+        RuntimeError: Si hay rutas registradas más de una vez
+    """
+    start = time.perf_counter()
+    if settings is not None:
+        set_settings(settings)
+    settings = get_settings()
+    report = {"imports_ms": {}, "lifespan_ms": {}, "create_app_ms": None, "ready_ms": None}
+
+    # Configuración del sistema de logging (escritura en un hilo aparte)
+    logging_utils = _timed_import("utils.logging_utils", report)
+    logging_utils.setup_logging()
+
+    # Crear la aplicación FastAPI
+    app = FastAPI(
+        title=settings.app_name,
+        version=settings.app_version,
+        description="API para generar CVs en formato PDF y HTML",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        lifespan=lifespan
+    )
+    app.state.startup = report
+
+    # Configurar CORS para permitir peticiones desde cualquier origen
+    from fastapi.middleware.cors import CORSMiddleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # En producción, especificar los orígenes permitidos
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Montar archivos estáticos; los de static/dist (ver utils.static_assets) se
+    # sirven precomprimidos y con caché inmutable
+    static_assets = _timed_import("utils.static_assets", report)
+    app.mount("/static", static_assets.PrecompressedStaticFiles(directory=static_assets.STATIC_DIR), name="static")
+
+    # Compresión de las respuestas; va dentro del registro de accesos y las
+    # métricas para que ambos reflejen los bytes enviados y el tiempo de comprimir
+    if settings.compression_enabled:
+        app.add_middleware(_timed_import("utils.compression", report).CompressionMiddleware)
+
+    # Registro de accesos en JSON, con muestreo de las respuestas exitosas
+    if settings.access_log_enabled:
+        app.add_middleware(logging_utils.AccessLogMiddleware)
+
+    # Métricas de Prometheus; se agrega al final para medir también los demás middlewares
+    if settings.metrics_enabled:
+        app.add_middleware(_timed_import("utils.metrics", report).MetricsMiddleware)
+
+    # Importar y registrar las rutas. Las de trabajos de PDF van primero para que
+    # /profiles/{profile_id}/pdf-jobs no se interprete como una sección del perfil
+    app.include_router(_timed_import("routes.pdf_job_routes", report).router)
+    app.include_router(_timed_import("routes.user_routes", report).router)
+    app.include_router(_timed_import("routes.health_routes", report).router)
+    if settings.metrics_enabled:
+        app.include_router(_timed_import("routes.metrics_routes", report).router)
+    check_duplicate_routes(app)
+    logger.info(f"{len(app.routes)} rutas registradas")
+    for route in app.routes:
+        if hasattr(route, 'methods'):
+            logger.debug(f"  {route.path} [{route.methods}]")
+
+    # Manejador de errores global
+    app.add_exception_handler(HTTPException, http_exception_handler)
+
+    report["create_app_ms"] = _elapsed_ms(start)
+    return app
+
+
+def __getattr__(name: str):
+    """
+    Crea la aplicación del módulo (`app.app`) en el primer acceso.
+    """
+    if name == "app":
+        application = create_app()
+        globals()["app"] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Punto de entrada para ejecución directa
 if __name__ == "__main__":
     import uvicorn
-    # Ejecutar el servidor con recarga automática en desarrollo
-    uvicorn.run("app:app", host="127.0.0.1", port=8000, reload=True)
+    # Ejecutar el servidor con recarga automática en desarrollo; en producción
+    # se usa server.py
+    uvicorn.run("app:create_app", factory=True, host="127.0.0.1", port=8000, reload=True)
@@ -0,0 +1,289 @@
+"""
+Benchmark en proceso de las rutas de la API.
+
+Ejecuta la aplicación ASGI dentro del mismo proceso con `httpx.ASGITransport`
+sobre el backend SQLite (sin red), de modo que las mediciones reflejan el
+costo propio de la aplicación. Para cada escenario reporta el throughput y
+los percentiles p50/p95/p99 de latencia, y guarda los resultados en JSON para
+compararlos entre commits.
+
+Uso:
+    python benchmarks/bench_api.py --requests 500 --concurrency 20 --profile-size 5
+    python benchmarks/bench_api.py --compare benchmarks/results/anterior.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+RESULTS_DIR = os.path.join(BASE_DIR, "benchmarks", "results")
+
+SCENARIOS = ["create", "get", "list", "update", "view", "download", "delete"]
+
+UPDATED_SUMMARY = "Resumen actualizado en el benchmark: experiencia en APIs y bases de datos."
+
+
+def build_profile(index: int, size: int) -> dict:
+    """
+    Construye un perfil de prueba con `size` elementos en cada lista.
+
+    Args:
+        index (int): Número del perfil, usado para que el correo sea único
+        size (int): Número de experiencias, estudios, habilidades e idiomas
+
+    Returns:
+        dict: Datos del perfil
+    """
+    return {
+        "name": f"Perfil Benchmark {index}",
+        "email": f"bench{index}@example.com",
+        "phone": "+573001234567",
+        "location": "Bogotá, Colombia",
+        "summary": "Desarrollador Full Stack con experiencia en Python, FastAPI y bases de datos. " * 2,
+        "experiences": [
+            {
+                "company": f"Empresa {item}",
+                "position": "Desarrollador Backend",
+                "start_date": "2020-01",
+                "end_date": "2023-12",
+                "description": "Diseño e implementación de servicios web con FastAPI y MongoDB. " * 3
+            }
+            for item in range(size)
+        ],
+        "education": [
+            {
+                "institution": f"Universidad {item}",
+                "degree": "Ingeniería de Sistemas",
+                "field": "Computación",
+                "start_date": "2015-01",
+                "end_date": "2019-12"
+            }
+            for item in range(size)
+        ],
+        "skills": [{"name": f"Habilidad {item}", "level": "Avanzado"} for item in range(size)],
+        "languages": [{"name": f"Idioma {item}", "level": "B2"} for item in range(size)],
+    }
+
+
+def percentile(values: list, fraction: float) -> float:
+    """
+    Calcula un percentil por el método del rango más cercano.
+
+    Args:
+        values (list): Valores ordenados de menor a mayor
+        fraction (float): Percentil entre 0 y 1
+
+    Returns:
+        float: Valor del percentil
+    """
+    if not values:
+        return 0.0
+    rank = max(int(round(fraction * len(values) + 0.5)) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+async def run_scenario(request_factory, total: int, concurrency: int) -> dict:
+    """
+    Ejecuta `total` peticiones con `concurrency` clientes concurrentes.
+
+    Args:
+        request_factory: Función que recibe el número de petición y retorna
+            la corrutina de la petición
+        total (int): Número de peticiones
+        concurrency (int): Peticiones en curso a la vez
+
+    Returns:
+        dict: Peticiones, errores, throughput y percentiles en milisegundos
+    """
+    latencies = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for number in counter:
+            start = time.perf_counter()
+            try:
+                response = await request_factory(number)
+                failed = response.status_code >= 400
+            except Exception:
+                failed = True
+            latencies.append((time.perf_counter() - start) * 1000)
+            errors += failed
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": total,
+        "errors": errors,
+        "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+    }
+
+
+async def run_benchmark(args) -> dict:
+    """
+    Levanta la aplicación con su ciclo de vida y ejecuta los escenarios pedidos.
+
+    Returns:
+        dict: Resultados por escenario
+    """
+    import httpx
+    from app import app
+
+    api = "/api/v1/profiles"
+    results = {}
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            # Perfiles base para las lecturas y actualizaciones, y otros para eliminar
+            seed = [build_profile(1_000_000 + index, args.profile_size) for index in range(args.seed)]
+            response = await client.post(f"{api}:bulk", json=seed)
+            ids = [result["id"] for result in response.json()["results"] if result.get("id")]
+            doomed = [build_profile(2_000_000 + index, args.profile_size) for index in range(args.requests)]
+            response = await client.post(f"{api}:bulk", json=doomed)
+            doomed_ids = [result["id"] for result in response.json()["results"] if result.get("id")]
+
+            factories = {
+                "create": lambda n: client.post(api, json=build_profile(n, args.profile_size)),
+                "get": lambda n: client.get(f"{api}/{ids[n % len(ids)]}"),
+                "list": lambda n: client.get(api, params={"limit": args.page_size}),
+                "update": lambda n: client.put(f"{api}/{ids[n % len(ids)]}", json={"summary": f"{UPDATED_SUMMARY} ({n})"}),
+                "view": lambda n: client.get(f"{api}/{ids[n % len(ids)]}/view"),
+                "download": lambda n: client.get(f"{api}/{ids[n % len(ids)]}/download"),
+                "delete": lambda n: client.delete(f"{api}/{doomed_ids[n]}"),
+            }
+
+            for name in args.scenarios:
+                total = args.requests
+                if name == "create":
+                    # Los correos del calentamiento no deben chocar con los medidos
+                    await run_scenario(lambda n: factories[name](total + n), args.warmup, args.concurrency)
+                elif name != "delete":
+                    await run_scenario(factories[name], args.warmup, args.concurrency)
+                results[name] = await run_scenario(factories[name], total, args.concurrency)
+                print(format_row(name, results[name]), flush=True)
+
+    return results
+
+
+def format_row(name: str, result: dict) -> str:
+    return (f"{name:<10} {result['throughput_rps']:>10.1f} {result['p50_ms']:>9.2f} "
+            f"{result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f} {result['errors']:>7}")
+
+
+def git_commit() -> str:
+    """
+    Obtiene el commit actual del repositorio, si está disponible.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BASE_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "desconocido"
+
+
+def print_comparison(previous: dict, current: dict):
+    """
+    Muestra la variación de throughput y p95 respecto a un resultado anterior.
+    """
+    print(f"\nComparación con {previous['meta'].get('commit', '?')}:")
+    print(f"{'escenario':<10} {'rps':>10} {'p95':>10}")
+    for name, result in current["results"].items():
+        before = previous["results"].get(name)
+        if not before:
+            continue
+        rps = (result["throughput_rps"] / before["throughput_rps"] - 1) * 100 if before["throughput_rps"] else 0.0
+        p95 = (result["p95_ms"] / before["p95_ms"] - 1) * 100 if before["p95_ms"] else 0.0
+        print(f"{name:<10} {rps:>+9.1f}% {p95:>+9.1f}%")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark en proceso de la API de CVs")
+    parser.add_argument("--requests", type=int, default=200, help="Peticiones medidas por escenario")
+    parser.add_argument("--concurrency", type=int, default=10, help="Peticiones en curso a la vez")
+    parser.add_argument("--warmup", type=int, default=20, help="Peticiones de calentamiento por escenario")
+    parser.add_argument("--profile-size", type=int, default=3, help="Elementos por lista en cada perfil")
+    parser.add_argument("--seed", type=int, default=100, help="Perfiles creados antes de medir")
+    parser.add_argument("--page-size", type=int, default=50, help="Tamaño de página del escenario list")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--backend", choices=["sqlite", "mongo"], default="sqlite",
+                        help="Backend de la base de datos; mongo usa MONGODB_URL")
+    parser.add_argument("--sqlite-path", default=":memory:", help="Archivo SQLite del benchmark")
+    parser.add_argument("--no-pdf-cache", action="store_true", help="Generar el PDF en cada descarga")
+    parser.add_argument("--no-profile-cache", action="store_true", help="Deshabilitar la caché de perfiles")
+    parser.add_argument("--access-log", action="store_true", help="Incluir el log de accesos (se escribe en stderr)")
+    parser.add_argument("--output", help="Archivo JSON de resultados (por defecto en benchmarks/results)")
+    parser.add_argument("--compare", help="Resultados JSON anteriores para comparar")
+    parser.add_argument("--log-level", default="WARNING", help="Nivel de logging de la aplicación")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # La configuración y el logging se fijan antes de importar la aplicación
+    logging.basicConfig(level=args.log_level)
+    os.environ["DATABASE_BACKEND"] = args.backend
+    os.environ["SQLITE_PATH"] = args.sqlite_path
+    if args.no_pdf_cache:
+        os.environ["PDF_CACHE_ENABLED"] = "false"
+    if args.no_profile_cache:
+        os.environ["PROFILE_CACHE_ENABLED"] = "false"
+    if not args.access_log:
+        os.environ["ACCESS_LOG_ENABLED"] = "false"
+
+    print(f"{'escenario':<10} {'rps':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errores':>7}")
+    results = asyncio.run(run_benchmark(args))
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backend": args.backend,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "profile_size": args.profile_size,
+            "pdf_cache": not args.no_pdf_cache,
+            "profile_cache": not args.no_profile_cache,
+            "access_log": args.access_log,
+        },
+        "results": results,
+    }
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}-{report['meta']['commit']}.json")
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"\nResultados guardados en {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            print_comparison(json.load(file), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark de la serialización de las respuestas de perfiles.
+
+Compara, dentro del mismo proceso y sobre SQLite en memoria, la ruta estándar
+de FastAPI (validación con `response_model` y `jsonable_encoder`) con la
+serialización rápida de `utils.json_response`, para el listado con distintos
+tamaños de página y para la lectura de un perfil.
+
+Uso:
+    python benchmarks/bench_serialization.py --page-sizes 50 200 500 --profile-size 5
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.join(BASE_DIR, "benchmarks"))
+
+from bench_api import build_profile, percentile  # noqa: E402
+
+FAST_ROUTES = frozenset({"get_profile", "get_profiles", "search_profiles"})
+
+
+async def measure(client, url: str, params: dict, requests: int) -> dict:
+    """
+    Mide peticiones secuenciales a una URL.
+
+    Returns:
+        dict: Percentiles en milisegundos y tamaño de la respuesta
+    """
+    latencies = []
+    size = 0
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.get(url, params=params)
+        latencies.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+        size = len(response.content)
+    latencies.sort()
+    return {
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "bytes": size,
+    }
+
+
+async def run(args) -> dict:
+    import httpx
+    from app import app
+    from config import get_settings
+    import utils.json_response as json_response
+
+    if args.no_orjson:
+        json_response.orjson = None
+    settings = get_settings()
+    results = {}
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            total = max(args.page_sizes)
+            profiles = [build_profile(index, args.profile_size) for index in range(total)]
+            response = await client.post("/api/v1/profiles:bulk", json=profiles)
+            profile_id = response.json()["results"][0]["id"]
+
+            cases = [(f"list limit={size}", "/api/v1/profiles", {"limit": size}) for size in args.page_sizes]
+            cases.append(("get profile", f"/api/v1/profiles/{profile_id}", {}))
+
+            print(f"{'caso':<18} {'estándar p50':>13} {'rápida p50':>11} {'mejora':>8} {'bytes':>9}")
+            for name, url, params in cases:
+                case = {}
+                for mode, routes in (("standard", frozenset()), ("fast", FAST_ROUTES)):
+                    settings.fast_json_routes = routes
+                    await measure(client, url, params, args.warmup)
+                    case[mode] = await measure(client, url, params, args.requests)
+                speedup = case["standard"]["p50_ms"] / case["fast"]["p50_ms"] if case["fast"]["p50_ms"] else 0.0
+                case["speedup_p50"] = round(speedup, 2)
+                results[name] = case
+                print(f"{name:<18} {case['standard']['p50_ms']:>13.2f} {case['fast']['p50_ms']:>11.2f} "
+                      f"{speedup:>7.2f}x {case['fast']['bytes']:>9}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la serialización de perfiles")
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--profile-size", type=int, default=5, help="Elementos por lista en cada perfil")
+    parser.add_argument("--requests", type=int, default=50, help="Peticiones medidas por caso y modo")
+    parser.add_argument("--warmup", type=int, default=5, help="Peticiones de calentamiento por caso y modo")
+    parser.add_argument("--no-orjson", action="store_true", help="Usar json de la biblioteca estándar")
+    parser.add_argument("--output", help="Archivo JSON de resultados")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    os.environ["DATABASE_BACKEND"] = "sqlite"
+    os.environ["SQLITE_PATH"] = ":memory:"
+    os.environ["ACCESS_LOG_ENABLED"] = "false"
+    os.environ["PROFILES_MAX_PAGE_SIZE"] = str(max(args.page_sizes))
+
+    results = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"\nResultados guardados en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
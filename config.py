@@ -0,0 +1,246 @@
+"""
+Configuración de la aplicación CV Generator.
+
+Este módulo centraliza los parámetros configurables de la aplicación. Cada
+valor se lee de una variable de entorno (o del archivo .env) y tiene un valor
+por defecto razonable para desarrollo.
+"""
+
+import os
+from dataclasses import dataclass, field
+from dotenv import load_dotenv
+
+# Obtener la ruta base del proyecto
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _to_bool(value) -> bool:
+    """
+    Convierte el valor de una variable de entorno a booleano.
+    """
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+
+def _to_set(value) -> frozenset:
+    """
+    Convierte una lista separada por comas en un conjunto de valores.
+    """
+    return frozenset(item.strip() for item in str(value).split(",") if item.strip())
+
+
+def _env(name: str, default, cast=str):
+    """
+    Declara un campo de configuración leído de la variable de entorno `name`.
+
+    Args:
+        name (str): Nombre de la variable de entorno
+        default: Valor por defecto si la variable no está definida
+        cast: Función de conversión del valor leído
+
+    Returns:
+        dataclasses.Field: Campo con la fábrica de valor correspondiente
+    """
+    return field(default_factory=lambda: cast(os.getenv(name, default)))
+
+
+@dataclass
+class Settings:
+    """
+    Parámetros de configuración de la aplicación.
+
+    Attributes:
+        app_name (str): Título de la API en la documentación
+        app_version (str): Versión de la API
+        debug (bool): Modo de desarrollo; sube el nivel de los logs a INFO
+        database_backend (str): Almacenamiento de perfiles ("mongo" o "sqlite")
+        sqlite_path (str): Archivo de la base SQLite (":memory:" para no persistir)
+        mongodb_url (str): URL de conexión de MongoDB
+        mongodb_database (str): Nombre de la base de datos
+        mongo_max_pool_size (int): Conexiones máximas del pool por proceso
+        mongo_min_pool_size (int): Conexiones que el pool mantiene abiertas
+        mongo_max_idle_time_ms (int): Tiempo máximo inactiva de una conexión (0 = sin límite)
+        mongo_server_selection_timeout_ms (int): Espera máxima para seleccionar un servidor
+        mongo_connect_timeout_ms (int): Espera máxima para abrir una conexión
+        mongo_socket_timeout_ms (int): Espera máxima de una operación en el socket (0 = sin límite)
+        mongo_warmup_connections (int): Conexiones que se abren al iniciar la aplicación
+        pdf_cache_enabled (bool): Reutilizar en `/download` los PDFs guardados en disco;
+            los trabajos de PDF usan el almacén siempre
+        pdf_cache_dir (str): Directorio del almacén de PDFs generados
+        pdf_cache_max_bytes (int): Presupuesto máximo en disco del almacén de PDFs,
+            compartido por todos los workers
+        pdf_render_executor (str): Tipo de pool para generar PDFs ("process" o "thread")
+        pdf_render_workers (int): Número de workers del pool (0 = número de CPUs)
+        profiles_page_size (int): Tamaño por defecto de las páginas de perfiles
+        profiles_max_page_size (int): Tamaño máximo permitido de una página de perfiles
+        export_batch_size (int): Documentos por lote del cursor en la exportación
+        bulk_max_profiles (int): Número máximo de perfiles por creación masiva
+        bulk_insert_chunk_size (int): Perfiles por llamada a `insert_many`
+        write_coalescing_enabled (bool): Agrupar creaciones y actualizaciones concurrentes
+        write_coalescing_window_ms (float): Ventana de espera de cada lote de escrituras
+        write_coalescing_max_batch (int): Operaciones que disparan el envío inmediato del lote
+        zip_max_profiles (int): Número máximo de CVs por archivo ZIP
+        zip_render_concurrency (int): PDFs generándose a la vez por ZIP (0 = workers del pool)
+        http_cache_control (str): Cabecera Cache-Control de las vistas de un perfil
+        templates_auto_reload (bool): Recompilar las plantillas cuando cambian (desarrollo)
+        profile_cache_enabled (bool): Guardar en memoria los perfiles leídos por ID
+        profile_cache_max_entries (int): Número máximo de perfiles en la caché
+        profile_cache_ttl (float): Segundos que un perfil permanece en la caché
+        profile_cache_change_stream (bool): Invalidar la caché con el change stream de MongoDB
+        suggest_enabled (bool): Mantener el índice en memoria para el autocompletado
+        suggest_max_results (int): Número máximo de sugerencias por consulta
+        suggest_scan_limit (int): Valores revisados como máximo por consulta
+        suggest_refresh_interval (float): Segundos entre reconstrucciones del índice
+            de sugerencias con los perfiles guardados (0 = solo al iniciar)
+        metrics_enabled (bool): Medir las peticiones y exponer `/metrics`
+        metrics_multiprocess_dir (str): Directorio compartido por los workers para
+            combinar sus métricas; vacío para reportar solo las del proceso
+        metrics_snapshot_interval (float): Segundos entre instantáneas de métricas de cada worker
+        access_log_enabled (bool): Registrar las peticiones en el log de accesos JSON
+        access_log_sample_rate (float): Fracción de respuestas exitosas registradas (0 a 1)
+        access_log_slow_ms (float): Duración a partir de la cual una petición siempre se registra
+        fast_json_routes (frozenset): Rutas que devuelven los perfiles guardados sin revalidarlos
+        pdf_jobs_store (str): Almacén del estado de los trabajos de PDF ("memory", solo con un worker, o "mongo")
+        pdf_jobs_workers (int): Trabajos de PDF procesados a la vez (0 = workers del pool)
+        pdf_jobs_max_pending (int): Trabajos de PDF en cola como máximo
+        pdf_jobs_ttl (float): Segundos que se conserva un trabajo de PDF terminado
+        static_cache_control (str): Cabecera Cache-Control de los archivos estáticos sin hash
+        compression_enabled (bool): Comprimir las respuestas con brotli o gzip
+        compression_min_size (int): Tamaño mínimo en bytes de una respuesta para comprimirla
+        compression_gzip_level (int): Nivel de compresión gzip (1 a 9)
+        compression_brotli_quality (int): Calidad de compresión brotli (0 a 11)
+        compression_content_types (frozenset): Tipos de contenido que se comprimen
+        admission_enabled (bool): Limitar las peticiones en curso por clase de ruta
+        admission_render_max_concurrent (int): Peticiones de vista HTML y PDF en curso (0 = sin límite)
+        admission_render_max_queue (int): Peticiones de vista HTML y PDF en espera como máximo
+        admission_render_queue_timeout (float): Segundos máximos de espera de las peticiones de vista HTML y PDF
+        admission_bulk_max_concurrent (int): Peticiones masivas (creación, exportación y ZIP) en curso (0 = sin límite)
+        admission_bulk_max_queue (int): Peticiones masivas (creación, exportación y ZIP) en espera como máximo
+        admission_bulk_queue_timeout (float): Segundos máximos de espera de las peticiones masivas (creación, exportación y ZIP)
+        admission_crud_max_concurrent (int): Peticiones de perfiles restantes en curso (0 = sin límite)
+        admission_crud_max_queue (int): Peticiones de perfiles restantes en espera como máximo
+        admission_crud_queue_timeout (float): Segundos máximos de espera de las peticiones de perfiles restantes
+        server_host (str): Dirección en la que escucha `server.py`
+        server_port (int): Puerto en el que escucha `server.py`
+        server_workers (int): Procesos de `server.py` (0 = número de CPUs)
+        server_loop (str): Event loop de uvicorn ("auto" usa uvloop si está instalado)
+        server_http (str): Parser HTTP de uvicorn ("auto" usa httptools si está instalado)
+        server_backlog (int): Conexiones pendientes de aceptar como máximo
+        server_keep_alive (int): Segundos que se mantiene abierta una conexión inactiva
+        server_graceful_timeout (float): Segundos para terminar las peticiones y PDFs en curso al apagar
+    """
+    app_name: str = _env("APP_NAME", "CV Generator API")
+    app_version: str = _env("APP_VERSION", "1.0.0")
+    debug: bool = _env("DEBUG", "false", _to_bool)
+    database_backend: str = _env("DATABASE_BACKEND", "mongo", lambda value: value.strip().lower())
+    sqlite_path: str = _env("SQLITE_PATH", os.path.join(BASE_DIR, "temp", "profiles.sqlite3"))
+    mongodb_url: str = _env("MONGODB_URL", "")
+    mongodb_database: str = _env("MONGODB_DATABASE", "cv_database")
+    mongo_max_pool_size: int = _env("MONGO_MAX_POOL_SIZE", 100, int)
+    mongo_min_pool_size: int = _env("MONGO_MIN_POOL_SIZE", 0, int)
+    mongo_max_idle_time_ms: int = _env("MONGO_MAX_IDLE_TIME_MS", 0, int)
+    mongo_server_selection_timeout_ms: int = _env("MONGO_SERVER_SELECTION_TIMEOUT_MS", 30000, int)
+    mongo_connect_timeout_ms: int = _env("MONGO_CONNECT_TIMEOUT_MS", 20000, int)
+    mongo_socket_timeout_ms: int = _env("MONGO_SOCKET_TIMEOUT_MS", 0, int)
+    mongo_warmup_connections: int = _env("MONGO_WARMUP_CONNECTIONS", 1, int)
+    pdf_cache_enabled: bool = _env("PDF_CACHE_ENABLED", "true", _to_bool)
+    pdf_cache_dir: str = _env("PDF_CACHE_DIR", os.path.join(BASE_DIR, "temp", "pdf_cache"))
+    pdf_cache_max_bytes: int = _env("PDF_CACHE_MAX_BYTES", 256 * 1024 * 1024, int)
+    pdf_render_executor: str = _env("PDF_RENDER_EXECUTOR", "process")
+    pdf_render_workers: int = _env("PDF_RENDER_WORKERS", 0, int)
+    profiles_page_size: int = _env("PROFILES_PAGE_SIZE", 50, int)
+    profiles_max_page_size: int = _env("PROFILES_MAX_PAGE_SIZE", 500, int)
+    export_batch_size: int = _env("EXPORT_BATCH_SIZE", 1000, int)
+    bulk_max_profiles: int = _env("BULK_MAX_PROFILES", 10000, int)
+    bulk_insert_chunk_size: int = _env("BULK_INSERT_CHUNK_SIZE", 1000, int)
+    write_coalescing_enabled: bool = _env("WRITE_COALESCING_ENABLED", "false", _to_bool)
+    write_coalescing_window_ms: float = _env("WRITE_COALESCING_WINDOW_MS", 5, float)
+    write_coalescing_max_batch: int = _env("WRITE_COALESCING_MAX_BATCH", 100, int)
+    zip_max_profiles: int = _env("ZIP_MAX_PROFILES", 1000, int)
+    zip_render_concurrency: int = _env("ZIP_RENDER_CONCURRENCY", 0, int)
+    http_cache_control: str = _env("HTTP_CACHE_CONTROL", "no-cache")
+    templates_auto_reload: bool = _env("TEMPLATES_AUTO_RELOAD", "false", _to_bool)
+    profile_cache_enabled: bool = _env("PROFILE_CACHE_ENABLED", "true", _to_bool)
+    profile_cache_max_entries: int = _env("PROFILE_CACHE_MAX_ENTRIES", 10000, int)
+    profile_cache_ttl: float = _env("PROFILE_CACHE_TTL", 30, float)
+    profile_cache_change_stream: bool = _env("PROFILE_CACHE_CHANGE_STREAM", "false", _to_bool)
+    suggest_enabled: bool = _env("SUGGEST_ENABLED", "true", _to_bool)
+    suggest_max_results: int = _env("SUGGEST_MAX_RESULTS", 20, int)
+    suggest_scan_limit: int = _env("SUGGEST_SCAN_LIMIT", 5000, int)
+    suggest_refresh_interval: float = _env("SUGGEST_REFRESH_INTERVAL", 0, float)
+    metrics_enabled: bool = _env("METRICS_ENABLED", "true", _to_bool)
+    metrics_multiprocess_dir: str = _env("METRICS_MULTIPROCESS_DIR", "")
+    metrics_snapshot_interval: float = _env("METRICS_SNAPSHOT_INTERVAL", 5, float)
+    access_log_enabled: bool = _env("ACCESS_LOG_ENABLED", "true", _to_bool)
+    access_log_sample_rate: float = _env("ACCESS_LOG_SAMPLE_RATE", 1.0, float)
+    access_log_slow_ms: float = _env("ACCESS_LOG_SLOW_MS", 1000, float)
+    fast_json_routes: frozenset = _env("FAST_JSON_ROUTES", "get_profile,get_profiles,search_profiles", _to_set)
+    pdf_jobs_store: str = _env("PDF_JOBS_STORE", "memory", lambda value: value.strip().lower())
+    pdf_jobs_workers: int = _env("PDF_JOBS_WORKERS", 0, int)
+    pdf_jobs_max_pending: int = _env("PDF_JOBS_MAX_PENDING", 1000, int)
+    pdf_jobs_ttl: float = _env("PDF_JOBS_TTL", 3600, float)
+    static_cache_control: str = _env("STATIC_CACHE_CONTROL", "no-cache")
+    compression_enabled: bool = _env("COMPRESSION_ENABLED", "true", _to_bool)
+    compression_min_size: int = _env("COMPRESSION_MIN_SIZE", 1024, int)
+    compression_gzip_level: int = _env("COMPRESSION_GZIP_LEVEL", 6, int)
+    compression_brotli_quality: int = _env("COMPRESSION_BROTLI_QUALITY", 4, int)
+    compression_content_types: frozenset = _env(
+        "COMPRESSION_CONTENT_TYPES",
+        "application/json,application/x-ndjson,text/html,text/css,text/csv,text/plain,"
+        "application/javascript,image/svg+xml",
+        _to_set
+    )
+    admission_enabled: bool = _env("ADMISSION_ENABLED", "true", _to_bool)
+    admission_render_max_concurrent: int = _env("ADMISSION_RENDER_MAX_CONCURRENT", 8, int)
+    admission_render_max_queue: int = _env("ADMISSION_RENDER_MAX_QUEUE", 32, int)
+    admission_render_queue_timeout: float = _env("ADMISSION_RENDER_QUEUE_TIMEOUT", 5, float)
+    admission_bulk_max_concurrent: int = _env("ADMISSION_BULK_MAX_CONCURRENT", 2, int)
+    admission_bulk_max_queue: int = _env("ADMISSION_BULK_MAX_QUEUE", 4, int)
+    admission_bulk_queue_timeout: float = _env("ADMISSION_BULK_QUEUE_TIMEOUT", 30, float)
+    admission_crud_max_concurrent: int = _env("ADMISSION_CRUD_MAX_CONCURRENT", 0, int)
+    admission_crud_max_queue: int = _env("ADMISSION_CRUD_MAX_QUEUE", 100, int)
+    admission_crud_queue_timeout: float = _env("ADMISSION_CRUD_QUEUE_TIMEOUT", 1, float)
+    server_host: str = _env("SERVER_HOST", "0.0.0.0")
+    server_port: int = _env("SERVER_PORT", 8000, int)
+    server_workers: int = _env("SERVER_WORKERS", 0, int)
+    server_loop: str = _env("SERVER_LOOP", "auto")
+    server_http: str = _env("SERVER_HTTP", "auto")
+    server_backlog: int = _env("SERVER_BACKLOG", 2048, int)
+    server_keep_alive: int = _env("SERVER_KEEP_ALIVE", 5, int)
+    server_graceful_timeout: float = _env("SERVER_GRACEFUL_TIMEOUT", 30, float)
+
+
+_settings = None
+
+
+def get_settings() -> Settings:
+    """
+    Obtiene la configuración activa, cargándola del entorno la primera vez.
+
+    Returns:
+        Settings: Configuración de la aplicación
+    """
+    global _settings
+    if _settings is None:
+        load_dotenv()
+        _settings = Settings()
+    return _settings
+
+
+def set_settings(settings: Settings) -> Settings:
+    """
+    Reemplaza la configuración activa, p. ej. la que recibe `create_app`.
+
+    Debe llamarse antes de usar los componentes que leen la configuración al
+    crearse (repositorio, cachés, pools).
+
+    Args:
+        settings (Settings): Configuración a usar
+
+    Returns:
+        Settings: La configuración activa
+    """
+    global _settings
+    _settings = settings
+    return _settings
@@ -0,0 +1,148 @@
+"""
+Caché en memoria de perfiles.
+
+Este módulo implementa una caché LRU con tiempo de expiración (TTL) que se
+coloca delante de `get_profile_by_id`. Las actualizaciones y eliminaciones
+invalidan la entrada del perfil afectado, y opcionalmente un listener de
+change streams de MongoDB invalida las entradas modificadas desde otros
+workers o procesos.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileCache:
+    """
+    Caché LRU con TTL de perfiles indexados por ID.
+
+    Attributes:
+        max_entries (int): Número máximo de perfiles almacenados
+        ttl (float): Segundos que un perfil permanece válido en la caché
+        hits (int): Lecturas servidas desde la caché
+        misses (int): Lecturas que tuvieron que ir a la base de datos
+        invalidations (int): Entradas invalidadas por escrituras
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        # Se incrementa en cada invalidación; una lectura iniciada antes de una
+        # invalidación no puede volver a guardar una versión obsoleta
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Generación actual de la caché, usada como token en `set`.
+        """
+        return self._generation
+
+    def get(self, profile_id: str) -> Optional[dict]:
+        """
+        Obtiene un perfil de la caché si existe y no ha expirado.
+
+        Args:
+            profile_id (str): ID del perfil
+
+        Returns:
+            dict: Copia del perfil o None si no está en la caché
+        """
+        entry = self._entries.get(profile_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[profile_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(profile_id)
+        self.hits += 1
+        return dict(entry[1])
+
+    def set(self, profile_id: str, profile: dict, generation: int):
+        """
+        Guarda un perfil en la caché.
+
+        Args:
+            profile_id (str): ID del perfil
+            profile (dict): Datos del perfil
+            generation (int): Valor de `generation` antes de leer el perfil; si
+                hubo invalidaciones desde entonces el perfil no se guarda
+        """
+        if generation != self._generation:
+            return
+        self._entries[profile_id] = (time.monotonic() + self.ttl, dict(profile))
+        self._entries.move_to_end(profile_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, profile_id: str):
+        """
+        Elimina un perfil de la caché.
+
+        Args:
+            profile_id (str): ID del perfil
+        """
+        self._generation += 1
+        if self._entries.pop(profile_id, None) is not None:
+            self.invalidations += 1
+
+    def clear(self):
+        """
+        Vacía la caché.
+        """
+        self._generation += 1
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Obtiene los contadores de la caché.
+
+        Returns:
+            dict: Aciertos, fallos, tasa de aciertos, invalidaciones y tamaño
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+        }
+
+
+async def watch_profile_changes(collection, cache: ProfileCache, retry_delay: float = 5.0):
+    """
+    Invalida la caché con los cambios publicados en el change stream de la colección.
+
+    Se ejecuta hasta ser cancelada. Si el change stream se interrumpe, se
+    vacía la caché (pudo perderse algún cambio) y se vuelve a abrir.
+
+    Args:
+        collection: Colección de Motor a observar
+        cache (ProfileCache): Caché a invalidar
+        retry_delay (float): Segundos de espera antes de reabrir el stream
+    """
+    pipeline = [{"$match": {"operationType": {"$in": ["update", "replace", "delete"]}}}]
+    while True:
+        try:
+            async with collection.watch(pipeline) as stream:
+                logger.info("Escuchando cambios de perfiles para invalidar la caché")
+                async for change in stream:
+                    cache.invalidate(str(change["documentKey"]["_id"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error en el change stream de perfiles: {str(e)}")
+            cache.clear()
+            await asyncio.sleep(retry_delay)
@@ -5,35 +5,400 @@ Este módulo maneja la conexión a MongoDB Atlas y proporciona funciones
 para realizar operaciones CRUD (Create, Read, Update, Delete) en los perfiles de CV.
 """
 
-import os
+import asyncio
 import logging
+import re
+import time
 from motor.motor_asyncio import AsyncIOMotorClient
 from bson import ObjectId
-from dotenv import load_dotenv
+from pymongo import ASCENDING, IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
 from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 
-# Cargar variables de entorno
-load_dotenv()
+from config import get_settings
+from db.cache import ProfileCache, watch_profile_changes
+from db.monitoring import PoolStatsListener
+from models.user_models import LANGUAGE_LEVELS
+from utils.metrics import db_timer
 
 # Configuración del logger
 logger = logging.getLogger(__name__)
 
-# Obtener la URL de conexión de MongoDB desde las variables de entorno
-MONGODB_URL = os.getenv("MONGODB_URL")
-if not MONGODB_URL:
-    raise ValueError("La URL de MongoDB no está configurada en las variables de entorno")
-
-try:
-    # Crear cliente de MongoDB
-    client = AsyncIOMotorClient(MONGODB_URL)
-    # Seleccionar base de datos y colección
-    db = client.cv_database
-    profiles_collection = db.profiles
-    
-    logger.info("Conexión exitosa a MongoDB Atlas")
-except Exception as e:
-    logger.error(f"Error al conectar a MongoDB: {str(e)}")
-    raise
+# Número de elementos de `$slice` que equivale a "hasta el final del arreglo"
+_MAX_SLICE = 2 ** 31 - 1
+
+# Cliente, base de datos y colección; se inicializan en `connect_to_mongo`
+client = None
+db = None
+profiles_collection = None
+
+# Contadores del pool de conexiones, reportados en el endpoint de readiness
+pool_stats = PoolStatsListener()
+
+
+async def connect_to_mongo():
+    """
+    Crea el cliente de MongoDB con la configuración del pool y precalienta conexiones.
+
+    Se invoca al iniciar la aplicación. El precalentamiento abre
+    `mongo_warmup_connections` conexiones en paralelo para que las primeras
+    peticiones no paguen el costo de establecerlas.
+
+    Raises:
+        ValueError: Si la URL de MongoDB no está configurada
+        Exception: Si la configuración del cliente no es válida
+    """
+    global client, db, profiles_collection
+    settings = get_settings()
+    if not settings.mongodb_url:
+        raise ValueError("La URL de MongoDB no está configurada en las variables de entorno")
+
+    options = {
+        "maxPoolSize": settings.mongo_max_pool_size,
+        "minPoolSize": settings.mongo_min_pool_size,
+        "serverSelectionTimeoutMS": settings.mongo_server_selection_timeout_ms,
+        "connectTimeoutMS": settings.mongo_connect_timeout_ms,
+        "event_listeners": [pool_stats],
+    }
+    # 0 significa sin límite, que en PyMongo se expresa omitiendo la opción
+    if settings.mongo_max_idle_time_ms:
+        options["maxIdleTimeMS"] = settings.mongo_max_idle_time_ms
+    if settings.mongo_socket_timeout_ms:
+        options["socketTimeoutMS"] = settings.mongo_socket_timeout_ms
+
+    try:
+        client = AsyncIOMotorClient(settings.mongodb_url, **options)
+        db = client[settings.mongodb_database]
+        profiles_collection = db.profiles
+    except Exception as e:
+        logger.error(f"Error al conectar a MongoDB: {str(e)}")
+        raise
+
+    # Si el precalentamiento falla la aplicación arranca igual; /health/ready
+    # reportará la instancia como no disponible hasta que MongoDB responda
+    try:
+        warmup = max(settings.mongo_warmup_connections, 1)
+        await asyncio.gather(*(client.admin.command("ping") for _ in range(warmup)))
+        logger.info(f"Conexión exitosa a MongoDB Atlas ({pool_stats.stats()['open']} conexiones abiertas)")
+    except Exception as e:
+        logger.error(f"Error al precalentar las conexiones a MongoDB: {str(e)}")
+
+
+async def close_mongo_connection():
+    """
+    Cierra el cliente de MongoDB y sus conexiones.
+    """
+    global client, db, profiles_collection
+    if client is not None:
+        client.close()
+        logger.info("Conexión a MongoDB cerrada")
+    client = db = profiles_collection = None
+
+
+async def ping_database() -> float:
+    """
+    Mide la latencia de un `ping` al servidor de MongoDB.
+
+    Returns:
+        float: Latencia en milisegundos
+
+    Raises:
+        Exception: Si el cliente no está conectado o el servidor no responde
+    """
+    if client is None:
+        raise RuntimeError("El cliente de MongoDB no está inicializado")
+    start = time.perf_counter()
+    await client.admin.command("ping")
+    return (time.perf_counter() - start) * 1000
+
+# Índices de la colección de perfiles, creados al iniciar la aplicación
+PROFILE_INDEXES = [
+    IndexModel([("email", ASCENDING)], unique=True, name="email_unique"),
+    IndexModel([("updated_at", ASCENDING)], name="updated_at"),
+    IndexModel([("location", ASCENDING)], name="location"),
+    IndexModel([("skills.name", ASCENDING)], name="skills_name"),
+    IndexModel([("languages.name", ASCENDING), ("languages.level", ASCENDING)], name="languages_name_level"),
+]
+
+
+async def ensure_indexes():
+    """
+    Crea los índices declarados en `PROFILE_INDEXES` si no existen.
+
+    Si la creación conjunta falla (por ejemplo, por correos duplicados que
+    impiden el índice único), se intenta cada índice por separado para crear
+    los demás. Los errores se registran sin detener la aplicación.
+    """
+    try:
+        names = await profiles_collection.create_indexes(PROFILE_INDEXES)
+        logger.info(f"Índices de perfiles verificados: {', '.join(names)}")
+        return
+    except OperationFailure as e:
+        logger.warning(f"Error al crear los índices de perfiles, se crearán uno a uno: {str(e)}")
+    except Exception as e:
+        logger.error(f"No se pudieron verificar los índices de perfiles: {str(e)}")
+        return
+
+    for index in PROFILE_INDEXES:
+        try:
+            await profiles_collection.create_indexes([index])
+        except Exception as e:
+            logger.error(f"Error al crear el índice {index.document['name']}: {str(e)}")
+
+def _write_error(error: dict, default_message: str) -> Exception:
+    """
+    Convierte un error de escritura de un lote en la excepción de su operación.
+
+    Args:
+        error (dict): Elemento de `writeErrors` de un BulkWriteError
+        default_message (str): Mensaje si el error no trae uno
+
+    Returns:
+        Exception: DuplicateKeyError para las violaciones de un índice único
+    """
+    message = error.get("errmsg", default_message)
+    if error.get("code") == 11000:
+        return DuplicateKeyError(message, 11000, error)
+    return Exception(message)
+
+
+class WriteCoalescer:
+    """
+    Agrupa las escrituras concurrentes en operaciones por lotes.
+
+    Las creaciones y actualizaciones que llegan dentro de una ventana de
+    tiempo corta se envían juntas con un solo `insert_many` o `bulk_write`.
+    Cada llamador recibe el resultado de su propia operación.
+
+    Attributes:
+        window (float): Tiempo máximo de espera de un lote, en segundos
+        max_batch (int): Número de operaciones que dispara el envío inmediato
+    """
+
+    def __init__(self, window_ms: float, max_batch: int):
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._inserts = []
+        self._updates = []
+        self._timer = None
+        self._tasks = set()
+
+    def _schedule(self, pending: int):
+        """
+        Programa el envío del lote según la ventana o el tamaño máximo.
+        """
+        loop = asyncio.get_running_loop()
+        if pending >= self.max_batch:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._start_flush)
+
+    def _start_flush(self):
+        """
+        Toma las operaciones pendientes y las envía en una tarea aparte.
+        """
+        task = asyncio.get_running_loop().create_task(self._send(*self._take_pending()))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _take_pending(self) -> tuple:
+        """
+        Retira las operaciones pendientes y cancela el temporizador del lote.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        inserts, self._inserts = self._inserts, []
+        updates, self._updates = self._updates, []
+        return inserts, updates
+
+    async def insert(self, document: dict) -> str:
+        """
+        Encola la creación de un documento.
+
+        Args:
+            document (dict): Documento a insertar
+
+        Returns:
+            str: ID del documento creado
+
+        Raises:
+            Exception: Si el documento no se pudo insertar
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._inserts.append((document, future))
+        self._schedule(len(self._inserts))
+        return await future
+
+    async def update(self, object_id: ObjectId, fields: dict) -> bool:
+        """
+        Encola la actualización (`$set`) de un documento.
+
+        Args:
+            object_id (ObjectId): ID del documento a actualizar
+            fields (dict): Campos a actualizar
+
+        Returns:
+            bool: True si el documento existe y se actualizó
+
+        Raises:
+            DuplicateKeyError: Si la actualización viola un índice único
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._updates.append((object_id, fields, future))
+        self._schedule(len(self._updates))
+        return await future
+
+    async def flush(self):
+        """
+        Envía inmediatamente las operaciones pendientes.
+        """
+        await self._send(*self._take_pending())
+
+    async def _send(self, inserts: list, updates: list):
+        """
+        Envía un lote de operaciones y resuelve a cada llamador.
+        """
+        if inserts:
+            try:
+                await self._flush_inserts(inserts)
+            except Exception as e:
+                for _, future in inserts:
+                    if not future.done():
+                        future.set_exception(e)
+        if updates:
+            try:
+                await self._flush_updates(updates)
+            except Exception as e:
+                logger.error(f"Error al enviar lote de actualizaciones: {str(e)}")
+                for _, _, future in updates:
+                    if not future.done():
+                        future.set_result(False)
+
+    @staticmethod
+    async def _flush_inserts(inserts: list):
+        errors = {}
+        try:
+            await profiles_collection.insert_many([doc for doc, _ in inserts], ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                errors[error["index"]] = _write_error(error, "Error al insertar")
+        except Exception as e:
+            errors = {index: e for index in range(len(inserts))}
+
+        logger.debug(f"Lote de {len(inserts)} creaciones enviado")
+        for index, (document, future) in enumerate(inserts):
+            if future.done():
+                continue
+            if index in errors:
+                future.set_exception(errors[index])
+            else:
+                future.set_result(str(document["_id"]))
+
+    @staticmethod
+    async def _flush_updates(updates: list):
+        # Con ordered=False MongoDB puede aplicar las operaciones en cualquier
+        # orden, así que las de un mismo documento se combinan en una sola, en
+        # el orden de llegada (los campos posteriores reemplazan a los previos)
+        merged = {}
+        for oid, fields, _ in updates:
+            merged.setdefault(oid, {}).update(fields)
+        ids = list(merged)
+        operations = [UpdateOne({"_id": oid}, {"$set": fields}) for oid, fields in merged.items()]
+        failed = {}
+        try:
+            result = await profiles_collection.bulk_write(operations, ordered=False)
+            matched = result.matched_count
+        except BulkWriteError as e:
+            failed = {ids[error["index"]]: _write_error(error, "Error al actualizar")
+                      for error in e.details.get("writeErrors", [])}
+            matched = e.details.get("nMatched", 0)
+
+        # bulk_write solo informa totales; si no todos coincidieron se
+        # consulta qué documentos existen para resolver cada operación
+        if matched + len(failed) >= len(operations):
+            existing = None
+        else:
+            cursor = profiles_collection.find({"_id": {"$in": ids}}, {"_id": 1})
+            existing = {doc["_id"] async for doc in cursor}
+
+        logger.debug(f"Lote de {len(updates)} actualizaciones enviado en {len(operations)} operaciones")
+        for oid, _, future in updates:
+            if future.done():
+                continue
+            if isinstance(failed.get(oid), DuplicateKeyError):
+                future.set_exception(failed[oid])
+            else:
+                future.set_result(oid not in failed and (existing is None or oid in existing))
+
+
+_write_coalescer = None
+
+
+def get_write_coalescer() -> Optional[WriteCoalescer]:
+    """
+    Obtiene el agrupador de escrituras si está habilitado en la configuración.
+
+    Returns:
+        WriteCoalescer: Agrupador de escrituras o None si está deshabilitado
+    """
+    global _write_coalescer
+    settings = get_settings()
+    if not settings.write_coalescing_enabled:
+        return None
+    if _write_coalescer is None:
+        _write_coalescer = WriteCoalescer(
+            settings.write_coalescing_window_ms,
+            settings.write_coalescing_max_batch
+        )
+    return _write_coalescer
+
+_profile_cache = None
+
+
+def get_profile_cache() -> Optional[ProfileCache]:
+    """
+    Obtiene la caché de perfiles si está habilitada en la configuración.
+
+    Returns:
+        ProfileCache: Caché de perfiles o None si está deshabilitada
+    """
+    global _profile_cache
+    settings = get_settings()
+    if not settings.profile_cache_enabled:
+        return None
+    if _profile_cache is None:
+        _profile_cache = ProfileCache(settings.profile_cache_max_entries, settings.profile_cache_ttl)
+    return _profile_cache
+
+
+def invalidate_cached_profile(profile_id: str):
+    """
+    Elimina un perfil de la caché tras modificarlo o eliminarlo.
+
+    Args:
+        profile_id (str): ID del perfil
+    """
+    cache = get_profile_cache()
+    if cache is not None:
+        cache.invalidate(profile_id)
+
+
+def start_profile_change_listener() -> Optional[asyncio.Task]:
+    """
+    Inicia el listener de change streams que invalida la caché de perfiles.
+
+    Returns:
+        asyncio.Task: Tarea del listener, o None si la caché o el listener
+            están deshabilitados
+    """
+    cache = get_profile_cache()
+    if cache is None or not get_settings().profile_cache_change_stream:
+        return None
+    return asyncio.get_running_loop().create_task(
+        watch_profile_changes(profiles_collection, cache)
+    )
 
 async def create_profile_db(profile_data: dict) -> str:
     """
@@ -49,13 +414,59 @@ async def create_profile_db(profile_data: dict) -> str:
         Exception: Si hay un error al crear el perfil
     """
     try:
-        result = await profiles_collection.insert_one(profile_data)
+        coalescer = get_write_coalescer()
+        if coalescer is not None:
+            with db_timer("mongo", "create_profile"):
+                profile_id = await coalescer.insert(profile_data)
+            logger.info(f"Perfil creado con ID: {profile_id}")
+            return profile_id
+        with db_timer("mongo", "create_profile"):
+            result = await profiles_collection.insert_one(profile_data)
         logger.info(f"Perfil creado con ID: {result.inserted_id}")
         return str(result.inserted_id)
     except Exception as e:
         logger.error(f"Error al crear perfil: {str(e)}")
         raise
 
+async def create_profiles_db(profiles: List[dict], chunk_size: int) -> List[dict]:
+    """
+    Crea varios perfiles con `insert_many` no ordenado, en lotes de `chunk_size`.
+
+    Un error en un perfil no impide que se inserten los demás.
+
+    Args:
+        profiles (List[dict]): Datos de los perfiles a crear
+        chunk_size (int): Número máximo de perfiles por llamada a `insert_many`
+
+    Returns:
+        List[dict]: Un resultado por perfil, en el mismo orden de entrada, con
+            la clave `id` si se creó o `error` si falló
+    """
+    results = []
+    for start in range(0, len(profiles), chunk_size):
+        chunk = profiles[start:start + chunk_size]
+        errors = {}
+        try:
+            # insert_many asigna el _id de cada documento antes de enviarlo
+            with db_timer("mongo", "create_profiles"):
+                await profiles_collection.insert_many(chunk, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                errors[error["index"]] = error.get("errmsg", "Error al insertar el perfil")
+        except Exception as e:
+            logger.error(f"Error al crear lote de perfiles: {str(e)}")
+            errors = {index: "Error al insertar el perfil" for index in range(len(chunk))}
+
+        for index, profile in enumerate(chunk):
+            if index in errors:
+                results.append({"error": errors[index]})
+            else:
+                results.append({"id": str(profile["_id"])})
+
+    created = sum(1 for result in results if "id" in result)
+    logger.info(f"Creación masiva: {created} de {len(profiles)} perfiles creados")
+    return results
+
 async def get_profile_by_id(profile_id: str) -> dict:
     """
     Obtiene un perfil específico por su ID.
@@ -66,32 +477,163 @@ async def get_profile_by_id(profile_id: str) -> dict:
     Returns:
         dict: Datos del perfil encontrado o None si no existe
     """
+    cache = get_profile_cache()
+    if cache is not None:
+        cached = cache.get(profile_id)
+        if cached is not None:
+            return cached
+        generation = cache.generation
+
     try:
-        profile = await profiles_collection.find_one({"_id": ObjectId(profile_id)})
+        with db_timer("mongo", "get_profile"):
+            profile = await profiles_collection.find_one({"_id": ObjectId(profile_id)})
         if profile:
             profile["_id"] = str(profile["_id"])
+            if cache is not None:
+                cache.set(profile_id, profile, generation)
         return profile
     except Exception as e:
         logger.error(f"Error al obtener perfil {profile_id}: {str(e)}")
         return None
 
-async def get_all_profiles() -> list:
+async def _find_page(query: dict, limit: int, after: Optional[str],
+                     fields: Optional[List[str]]) -> Tuple[list, Optional[str]]:
+    """
+    Obtiene una página de perfiles que cumplen `query`, ordenados por `_id`.
+
+    Args:
+        query (dict): Filtro de MongoDB
+        limit (int): Número máximo de perfiles a retornar
+        after (str, optional): ID del último perfil de la página anterior
+        fields (List[str], optional): Campos a retornar; todos si es None
+
+    Returns:
+        tuple: Lista de perfiles de la página e ID para pedir la siguiente
+            página, o None si no hay más perfiles
+    """
+    if after:
+        query = {**query, "_id": {"$gt": ObjectId(after)}}
+    projection = {field: 1 for field in fields} if fields else None
+    # Se pide un perfil extra para saber si existe una página siguiente
+    cursor = profiles_collection.find(query, projection).sort("_id", 1).limit(limit + 1)
+    profiles = []
+    async for profile in cursor:
+        profile["_id"] = str(profile["_id"])
+        profiles.append(profile)
+    next_cursor = None
+    if len(profiles) > limit:
+        profiles = profiles[:limit]
+        next_cursor = profiles[-1]["_id"]
+    return profiles, next_cursor
+
+async def get_all_profiles(limit: int, after: Optional[str] = None,
+                           fields: Optional[List[str]] = None) -> Tuple[list, Optional[str]]:
     """
-    Obtiene todos los perfiles almacenados.
+    Obtiene una página de perfiles usando paginación por cursor sobre `_id`.
+
+    Args:
+        limit (int): Número máximo de perfiles a retornar
+        after (str, optional): ID del último perfil de la página anterior
+        fields (List[str], optional): Campos a retornar; todos si es None
 
     Returns:
-        list: Lista de perfiles encontrados
+        tuple: Lista de perfiles de la página e ID para pedir la siguiente
+            página, o None si no hay más perfiles
+    """
+    try:
+        with db_timer("mongo", "list_profiles"):
+            return await _find_page({}, limit, after, fields)
+    except Exception as e:
+        logger.error(f"Error al obtener perfiles: {str(e)}")
+        return [], None
+
+async def search_profiles(limit: int, after: Optional[str] = None,
+                          fields: Optional[List[str]] = None,
+                          skills: Optional[List[str]] = None,
+                          language: Optional[str] = None,
+                          min_language_level: Optional[str] = None,
+                          location: Optional[str] = None) -> Tuple[list, Optional[str]]:
+    """
+    Busca perfiles por habilidades, idioma y ubicación usando los índices de la colección.
+
+    Args:
+        limit (int): Número máximo de perfiles a retornar
+        after (str, optional): ID del último perfil de la página anterior
+        fields (List[str], optional): Campos a retornar; todos si es None
+        skills (List[str], optional): Habilidades que el perfil debe tener todas
+        language (str, optional): Idioma que el perfil debe tener
+        min_language_level (str, optional): Nivel mínimo del idioma (p. ej. B2)
+        location (str, optional): Prefijo de la ubicación (p. ej. "Bogotá")
+
+    Returns:
+        tuple: Lista de perfiles de la página e ID para pedir la siguiente
+            página, o None si no hay más perfiles
+    """
+    query = {}
+    if skills:
+        query["skills.name"] = {"$all": skills}
+    if language:
+        if min_language_level:
+            levels = LANGUAGE_LEVELS[LANGUAGE_LEVELS.index(min_language_level):]
+            query["languages"] = {"$elemMatch": {"name": language, "level": {"$in": levels}}}
+        else:
+            query["languages.name"] = language
+    if location:
+        # Una expresión anclada al inicio puede resolverse con el índice de location
+        query["location"] = {"$regex": f"^{re.escape(location)}"}
+
+    try:
+        with db_timer("mongo", "search_profiles"):
+            return await _find_page(query, limit, after, fields)
+    except Exception as e:
+        logger.error(f"Error al buscar perfiles: {str(e)}")
+        return [], None
+
+async def iter_profiles(batch_size: int, updated_since: Optional[datetime] = None,
+                        after: Optional[str] = None, ids: Optional[List[str]] = None,
+                        location: Optional[str] = None, limit: int = 0,
+                        fields: Optional[List[str]] = None) -> AsyncIterator[dict]:
+    """
+    Recorre los perfiles en orden de `_id` directamente desde el cursor de Motor.
+
+    A diferencia de `get_all_profiles`, los perfiles no se acumulan en memoria:
+    el cursor los trae del servidor en lotes de `batch_size` documentos.
+
+    Args:
+        batch_size (int): Número de documentos por lote del cursor
+        updated_since (datetime, optional): Solo perfiles actualizados desde esta fecha
+        after (str, optional): ID del último perfil ya procesado, para reanudar
+        ids (List[str], optional): Solo los perfiles con estos IDs
+        location (str, optional): Solo los perfiles con esta ubicación
+        limit (int, optional): Número máximo de perfiles; 0 para no limitar
+        fields (List[str], optional): Campos a retornar; todos si es None
+
+    Yields:
+        dict: Datos de cada perfil
+
+    Raises:
+        Exception: Si hay un error al leer del cursor
     """
+    query = {}
+    if updated_since:
+        query["updated_at"] = {"$gte": updated_since}
+    if after:
+        query["_id"] = {"$gt": ObjectId(after)}
+    if ids is not None:
+        query.setdefault("_id", {})["$in"] = [ObjectId(profile_id) for profile_id in ids]
+    if location:
+        query["location"] = location
+    projection = {field: 1 for field in fields} if fields else None
+    cursor = profiles_collection.find(query, projection).sort("_id", 1).batch_size(batch_size).limit(limit)
     try:
-        profiles = []
-        cursor = profiles_collection.find({})
         async for profile in cursor:
             profile["_id"] = str(profile["_id"])
-            profiles.append(profile)
-        return profiles
+            yield profile
     except Exception as e:
-        logger.error(f"Error al obtener perfiles: {str(e)}")
-        return []
+        logger.error(f"Error al recorrer perfiles: {str(e)}")
+        raise
+    finally:
+        await cursor.close()
 
 async def update_profile_db(profile_id: str, profile_data: dict) -> bool:
     """
@@ -103,23 +645,136 @@ async def update_profile_db(profile_id: str, profile_data: dict) -> bool:
 
     Returns:
         bool: True si la actualización fue exitosa, False en caso contrario
+
+    Raises:
+        DuplicateKeyError: Si el nuevo email ya es de otro perfil
     """
     try:
         profile_data["updated_at"] = datetime.now()
-        result = await profiles_collection.update_one(
-            {"_id": ObjectId(profile_id)},
-            {"$set": profile_data}
-        )
-        success = result.modified_count > 0
+        coalescer = get_write_coalescer()
+        with db_timer("mongo", "update_profile"):
+            if coalescer is not None:
+                success = await coalescer.update(ObjectId(profile_id), profile_data)
+            else:
+                result = await profiles_collection.update_one(
+                    {"_id": ObjectId(profile_id)},
+                    {"$set": profile_data}
+                )
+                success = result.modified_count > 0
+        invalidate_cached_profile(profile_id)
         if success:
             logger.info(f"Perfil {profile_id} actualizado exitosamente")
         else:
             logger.warning(f"No se encontró el perfil {profile_id} para actualizar")
         return success
+    except DuplicateKeyError as e:
+        logger.warning(f"Email duplicado al actualizar perfil {profile_id}: {str(e)}")
+        raise
     except Exception as e:
         logger.error(f"Error al actualizar perfil {profile_id}: {str(e)}")
         return False
 
+async def push_profile_item_db(profile_id: str, section: str, item: dict) -> bool:
+    """
+    Agrega un elemento al final de una sección del perfil con `$push`.
+
+    Args:
+        profile_id (str): ID del perfil
+        section (str): Lista del perfil (p. ej. "experiences")
+        item (dict): Elemento validado a agregar
+
+    Returns:
+        bool: True si el perfil existe y se actualizó
+    """
+    try:
+        with db_timer("mongo", "push_profile_item"):
+            result = await profiles_collection.update_one(
+                {"_id": ObjectId(profile_id)},
+                {"$push": {section: item}, "$set": {"updated_at": datetime.now()}}
+            )
+        invalidate_cached_profile(profile_id)
+        return result.matched_count > 0
+    except Exception as e:
+        logger.error(f"Error al agregar elemento a {section} del perfil {profile_id}: {str(e)}")
+        return False
+
+def _item_filter(profile_id: str, section: str, index: int, expected_items: Optional[list]) -> dict:
+    """
+    Construye el filtro de un elemento de una sección, con la precondición de
+    que la sección contenga exactamente `expected_items` si se indica.
+    """
+    query = {"_id": ObjectId(profile_id), f"{section}.{index}": {"$exists": True}}
+    if expected_items is not None:
+        query[section] = expected_items
+    return query
+
+async def set_profile_item_db(profile_id: str, section: str, index: int, item: dict,
+                              expected_items: Optional[list] = None) -> bool:
+    """
+    Reemplaza un elemento de una sección del perfil con un `$set` posicional.
+
+    Args:
+        profile_id (str): ID del perfil
+        section (str): Lista del perfil
+        index (int): Posición del elemento
+        item (dict): Elemento validado que reemplaza al actual
+        expected_items (list, optional): Elementos que debe tener la sección
+            para aplicar el cambio
+
+    Returns:
+        bool: True si el perfil y el elemento existen y se actualizó
+    """
+    try:
+        with db_timer("mongo", "set_profile_item"):
+            result = await profiles_collection.update_one(
+                _item_filter(profile_id, section, index, expected_items),
+                {"$set": {f"{section}.{index}": item, "updated_at": datetime.now()}}
+            )
+        invalidate_cached_profile(profile_id)
+        return result.matched_count > 0
+    except Exception as e:
+        logger.error(f"Error al reemplazar elemento {index} de {section} del perfil {profile_id}: {str(e)}")
+        return False
+
+async def remove_profile_item_db(profile_id: str, section: str, index: int,
+                                 expected_items: Optional[list] = None) -> bool:
+    """
+    Elimina un elemento de una sección del perfil por su posición.
+
+    `$pull` elimina por valor (y todos los duplicados), por lo que se usa un
+    pipeline de actualización que une los tramos anterior y posterior al
+    elemento; la operación es atómica sobre el documento.
+
+    Args:
+        profile_id (str): ID del perfil
+        section (str): Lista del perfil
+        index (int): Posición del elemento
+        expected_items (list, optional): Elementos que debe tener la sección
+            para aplicar el cambio
+
+    Returns:
+        bool: True si el perfil y el elemento existían
+    """
+    items = f"${section}"
+    pipeline = [{"$set": {
+        section: {"$concatArrays": [
+            {"$slice": [items, index]},
+            {"$slice": [items, index + 1, _MAX_SLICE]}
+        ]},
+        "updated_at": datetime.now()
+    }}]
+    try:
+        with db_timer("mongo", "remove_profile_item"):
+            result = await profiles_collection.update_one(
+                _item_filter(profile_id, section, index, expected_items),
+                pipeline
+            )
+        invalidate_cached_profile(profile_id)
+        return result.matched_count > 0
+    except Exception as e:
+        logger.error(f"Error al eliminar elemento {index} de {section} del perfil {profile_id}: {str(e)}")
+        return False
+
 async def delete_profile_db(profile_id: str) -> bool:
     """
     Elimina un perfil de la base de datos.
@@ -131,8 +786,10 @@ async def delete_profile_db(profile_id: str) -> bool:
         bool: True si la eliminación fue exitosa, False en caso contrario
     """
     try:
-        result = await profiles_collection.delete_one({"_id": ObjectId(profile_id)})
+        with db_timer("mongo", "delete_profile"):
+            result = await profiles_collection.delete_one({"_id": ObjectId(profile_id)})
         success = result.deleted_count > 0
+        invalidate_cached_profile(profile_id)
         if success:
             logger.info(f"Perfil {profile_id} eliminado exitosamente")
         else:
@@ -0,0 +1,84 @@
+"""
+Monitoreo del pool de conexiones de MongoDB.
+
+Este módulo define un listener de eventos de PyMongo que lleva la cuenta de
+las conexiones del pool, para reportarlas en el endpoint de readiness.
+"""
+
+import threading
+
+from pymongo.monitoring import ConnectionPoolListener
+
+
+class PoolStatsListener(ConnectionPoolListener):
+    """
+    Listener que cuenta las conexiones abiertas y en uso del pool.
+
+    PyMongo invoca los eventos desde sus propios hilos, por lo que los
+    contadores se protegen con un lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.open = 0
+        self.checked_out = 0
+        self.created_total = 0
+        self.checkout_failures = 0
+        self.pool_clears = 0
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.pool_clears += 1
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        with self._lock:
+            self.open += 1
+            self.created_total += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.open -= 1
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.checkout_failures += 1
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.checked_out += 1
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.checked_out -= 1
+
+    def stats(self) -> dict:
+        """
+        Obtiene los contadores del pool.
+
+        Returns:
+            dict: Conexiones abiertas, en uso y disponibles, y contadores acumulados
+        """
+        with self._lock:
+            return {
+                "open": self.open,
+                "in_use": self.checked_out,
+                "idle": self.open - self.checked_out,
+                "created_total": self.created_total,
+                "checkout_failures": self.checkout_failures,
+                "pool_clears": self.pool_clears,
+            }
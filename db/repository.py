@@ -0,0 +1,362 @@
+"""
+Capa de repositorio de perfiles.
+
+Este módulo define la interfaz `ProfileRepository` con las operaciones que usan
+las rutas (crear, obtener, listar, buscar, recorrer, actualizar y eliminar
+perfiles, y editar elementos de sus listas) y la implementación sobre MongoDB.
+La implementación activa se elige con la variable `DATABASE_BACKEND`: "mongo"
+(por defecto) o "sqlite", una base embebida sin red útil para ejecuciones
+locales y mediciones.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+
+from config import get_settings
+
+
+class DuplicateProfileError(Exception):
+    """
+    Ya existe otro perfil con el mismo email (índice único `email`).
+    """
+
+
+class ProfileRepository(ABC):
+    """
+    Operaciones de almacenamiento de perfiles.
+
+    Los perfiles se entregan como diccionarios con el ID en `_id` (texto).
+    Los IDs tienen el formato de un ObjectId y su orden es el de creación,
+    lo que permite paginar por cursor con cualquier implementación.
+
+    Attributes:
+        name (str): Nombre del backend, usado en el endpoint de readiness
+    """
+
+    name = ""
+
+    @abstractmethod
+    async def connect(self):
+        """
+        Abre la conexión con el almacenamiento.
+        """
+
+    @abstractmethod
+    async def close(self):
+        """
+        Cierra la conexión con el almacenamiento.
+        """
+
+    @abstractmethod
+    async def ping(self) -> float:
+        """
+        Mide la latencia de una consulta trivial.
+
+        Returns:
+            float: Latencia en milisegundos
+
+        Raises:
+            Exception: Si el almacenamiento no responde
+        """
+
+    def health(self) -> dict:
+        """
+        Obtiene información adicional para el endpoint de readiness.
+
+        Returns:
+            dict: Datos propios del backend
+        """
+        return {}
+
+    async def ensure_indexes(self):
+        """
+        Crea los índices que usan las búsquedas, si no existen.
+        """
+
+    def start_change_listener(self) -> Optional[asyncio.Task]:
+        """
+        Inicia la invalidación de cachés por cambios externos, si aplica.
+
+        Returns:
+            asyncio.Task: Tarea del listener o None
+        """
+        return None
+
+    def profile_cache_stats(self) -> Optional[dict]:
+        """
+        Obtiene los contadores de la caché de perfiles del backend, si tiene.
+
+        Returns:
+            dict: Contadores de la caché o None si el backend no usa caché
+        """
+        return None
+
+    @abstractmethod
+    async def create_profile(self, profile: dict) -> str:
+        """
+        Crea un perfil.
+
+        Args:
+            profile (dict): Datos del perfil
+
+        Returns:
+            str: ID del perfil creado
+
+        Raises:
+            DuplicateProfileError: Si ya existe un perfil con el mismo email
+            Exception: Si el perfil no se pudo crear
+        """
+
+    @abstractmethod
+    async def create_profiles(self, profiles: List[dict], chunk_size: int) -> List[dict]:
+        """
+        Crea varios perfiles; un error en uno no impide crear los demás.
+
+        Args:
+            profiles (List[dict]): Datos de los perfiles
+            chunk_size (int): Número máximo de perfiles por operación
+
+        Returns:
+            List[dict]: Un resultado por perfil, con `id` o `error`
+        """
+
+    @abstractmethod
+    async def get_profile(self, profile_id: str) -> Optional[dict]:
+        """
+        Obtiene un perfil por su ID.
+
+        Args:
+            profile_id (str): ID del perfil
+
+        Returns:
+            dict: Datos del perfil o None si no existe
+        """
+
+    @abstractmethod
+    async def list_profiles(self, limit: int, after: Optional[str] = None,
+                            fields: Optional[List[str]] = None) -> Tuple[list, Optional[str]]:
+        """
+        Obtiene una página de perfiles ordenados por ID.
+
+        Args:
+            limit (int): Número máximo de perfiles
+            after (str, optional): ID del último perfil de la página anterior
+            fields (List[str], optional): Campos a retornar; todos si es None
+
+        Returns:
+            tuple: Perfiles de la página e ID para pedir la siguiente, o None
+        """
+
+    @abstractmethod
+    async def search_profiles(self, limit: int, after: Optional[str] = None,
+                              fields: Optional[List[str]] = None,
+                              skills: Optional[List[str]] = None,
+                              language: Optional[str] = None,
+                              min_language_level: Optional[str] = None,
+                              location: Optional[str] = None) -> Tuple[list, Optional[str]]:
+        """
+        Busca perfiles por habilidades, idioma con nivel mínimo y prefijo de ubicación.
+
+        Returns:
+            tuple: Perfiles de la página e ID para pedir la siguiente, o None
+        """
+
+    @abstractmethod
+    def iter_profiles(self, batch_size: int, updated_since: Optional[datetime] = None,
+                      after: Optional[str] = None, ids: Optional[List[str]] = None,
+                      location: Optional[str] = None, limit: int = 0,
+                      fields: Optional[List[str]] = None) -> AsyncIterator[dict]:
+        """
+        Recorre los perfiles en orden de ID sin cargarlos todos en memoria.
+
+        Returns:
+            AsyncIterator[dict]: Flujo de perfiles
+        """
+
+    @abstractmethod
+    async def update_profile(self, profile_id: str, profile_data: dict) -> bool:
+        """
+        Actualiza los campos indicados de un perfil.
+
+        Args:
+            profile_id (str): ID del perfil
+            profile_data (dict): Campos a actualizar
+
+        Returns:
+            bool: True si el perfil existe y se actualizó
+
+        Raises:
+            DuplicateProfileError: Si el nuevo email ya es de otro perfil
+        """
+
+    @abstractmethod
+    async def push_item(self, profile_id: str, section: str, item: dict) -> bool:
+        """
+        Agrega un elemento al final de una sección del perfil.
+
+        Args:
+            profile_id (str): ID del perfil
+            section (str): Lista del perfil (p. ej. "experiences")
+            item (dict): Elemento validado
+
+        Returns:
+            bool: True si el perfil existe y se actualizó
+        """
+
+    @abstractmethod
+    async def replace_item(self, profile_id: str, section: str, index: int, item: dict,
+                           expected_items: Optional[list] = None) -> bool:
+        """
+        Reemplaza el elemento de una sección en la posición indicada.
+
+        Args:
+            expected_items (list, optional): Si se indica, el elemento solo se
+                reemplaza si la sección contiene exactamente estos elementos,
+                en la misma operación atómica; así la posición no puede
+                referirse a otro elemento tras una edición concurrente
+
+        Returns:
+            bool: True si el perfil y el elemento existen (y la sección no
+                cambió) y se actualizó
+        """
+
+    @abstractmethod
+    async def remove_item(self, profile_id: str, section: str, index: int,
+                          expected_items: Optional[list] = None) -> bool:
+        """
+        Elimina el elemento de una sección en la posición indicada.
+
+        Args:
+            expected_items (list, optional): Si se indica, el elemento solo se
+                elimina si la sección contiene exactamente estos elementos
+
+        Returns:
+            bool: True si el perfil y el elemento existían (y la sección no cambió)
+        """
+
+    @abstractmethod
+    async def delete_profile(self, profile_id: str) -> bool:
+        """
+        Elimina un perfil.
+
+        Args:
+            profile_id (str): ID del perfil
+
+        Returns:
+            bool: True si el perfil existía
+        """
+
+
+class MongoProfileRepository(ProfileRepository):
+    """
+    Repositorio sobre MongoDB, con la caché de perfiles y el agrupador de
+    escrituras de `db.database`.
+
+    `db.database` (y con él Motor y PyMongo) se importa al crear el
+    repositorio, de modo que con otro backend no se carga.
+    """
+
+    name = "mongo"
+
+    def __init__(self):
+        from db import database
+        self.database = database
+
+    async def connect(self):
+        await self.database.connect_to_mongo()
+
+    async def close(self):
+        await self.database.close_mongo_connection()
+
+    async def ping(self) -> float:
+        return await self.database.ping_database()
+
+    def health(self) -> dict:
+        return {"pool": self.database.pool_stats.stats()}
+
+    def profile_cache_stats(self) -> Optional[dict]:
+        cache = self.database.get_profile_cache()
+        return cache.stats() if cache is not None else None
+
+    async def ensure_indexes(self):
+        await self.database.ensure_indexes()
+
+    def start_change_listener(self) -> Optional[asyncio.Task]:
+        return self.database.start_profile_change_listener()
+
+    async def create_profile(self, profile: dict) -> str:
+        try:
+            return await self.database.create_profile_db(profile)
+        except self.database.DuplicateKeyError as e:
+            raise DuplicateProfileError(str(e)) from e
+
+    async def create_profiles(self, profiles: List[dict], chunk_size: int) -> List[dict]:
+        return await self.database.create_profiles_db(profiles, chunk_size)
+
+    async def get_profile(self, profile_id: str) -> Optional[dict]:
+        return await self.database.get_profile_by_id(profile_id)
+
+    async def list_profiles(self, limit, after=None, fields=None):
+        return await self.database.get_all_profiles(limit, after, fields)
+
+    async def search_profiles(self, limit, after=None, fields=None, skills=None,
+                              language=None, min_language_level=None, location=None):
+        return await self.database.search_profiles(
+            limit, after, fields,
+            skills=skills,
+            language=language,
+            min_language_level=min_language_level,
+            location=location
+        )
+
+    def iter_profiles(self, batch_size, updated_since=None, after=None, ids=None,
+                      location=None, limit=0, fields=None):
+        return self.database.iter_profiles(batch_size, updated_since, after, ids, location, limit, fields)
+
+    async def update_profile(self, profile_id: str, profile_data: dict) -> bool:
+        try:
+            return await self.database.update_profile_db(profile_id, profile_data)
+        except self.database.DuplicateKeyError as e:
+            raise DuplicateProfileError(str(e)) from e
+
+    async def delete_profile(self, profile_id: str) -> bool:
+        return await self.database.delete_profile_db(profile_id)
+
+    async def push_item(self, profile_id: str, section: str, item: dict) -> bool:
+        return await self.database.push_profile_item_db(profile_id, section, item)
+
+    async def replace_item(self, profile_id: str, section: str, index: int, item: dict,
+                           expected_items: Optional[list] = None) -> bool:
+        return await self.database.set_profile_item_db(profile_id, section, index, item, expected_items)
+
+    async def remove_item(self, profile_id: str, section: str, index: int,
+                          expected_items: Optional[list] = None) -> bool:
+        return await self.database.remove_profile_item_db(profile_id, section, index, expected_items)
+
+
+_repository = None
+
+
+def get_repository() -> ProfileRepository:
+    """
+    Obtiene el repositorio de perfiles configurado en `DATABASE_BACKEND`.
+
+    Returns:
+        ProfileRepository: Repositorio del proceso
+
+    Raises:
+        ValueError: Si el backend configurado no existe
+    """
+    global _repository
+    if _repository is None:
+        settings = get_settings()
+        if settings.database_backend == "mongo":
+            _repository = MongoProfileRepository()
+        elif settings.database_backend == "sqlite":
+            from db.sqlite import SqliteProfileRepository
+            _repository = SqliteProfileRepository(settings.sqlite_path)
+        else:
+            raise ValueError(f"Backend de base de datos no soportado: {settings.database_backend}")
+    return _repository
@@ -0,0 +1,425 @@
+"""
+Repositorio de perfiles sobre SQLite.
+
+Cada perfil se guarda como un documento JSON en una sola columna, con índices
+sobre expresiones `json_extract` para el correo (único) y la ubicación. Las
+consultas se ejecutan en un único hilo dedicado, de modo que el bucle de
+eventos nunca se bloquea y las escrituras quedan serializadas.
+
+Pensado para ejecuciones locales, pruebas de carga sin red y despliegues de
+un solo nodo. Con `SQLITE_PATH=:memory:` la base vive solo en el proceso.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+
+from bson import ObjectId
+
+from db.repository import DuplicateProfileError, ProfileRepository
+from models.user_models import LANGUAGE_LEVELS
+from utils.metrics import db_timer
+
+logger = logging.getLogger(__name__)
+
+# Campos de fecha que se guardan en ISO 8601 y se restauran como datetime
+DATETIME_FIELDS = ("created_at", "updated_at")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id TEXT PRIMARY KEY,
+    updated_at TEXT,
+    doc TEXT NOT NULL
+)
+"""
+
+INDEXES = [
+    "CREATE UNIQUE INDEX IF NOT EXISTS email_unique ON profiles (json_extract(doc, '$.email'))",
+    "CREATE INDEX IF NOT EXISTS updated_at ON profiles (updated_at)",
+    "CREATE INDEX IF NOT EXISTS location ON profiles (json_extract(doc, '$.location'))",
+]
+
+# Mayor carácter Unicode; delimita el rango de las búsquedas por prefijo
+_MAX_CHAR = "\U0010ffff"
+
+
+def _json_default(value):
+    """
+    Serializa los tipos que `json` no soporta de forma nativa.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _encode(profile: dict) -> str:
+    document = {key: value for key, value in profile.items() if key != "_id"}
+    return json.dumps(document, default=_json_default, ensure_ascii=False)
+
+
+def _decode(profile_id: str, doc: str, fields: Optional[List[str]] = None) -> dict:
+    document = json.loads(doc)
+    if fields:
+        document = {field: document[field] for field in fields if field in document}
+    for field in DATETIME_FIELDS:
+        if isinstance(document.get(field), str):
+            document[field] = datetime.fromisoformat(document[field])
+    return {"_id": profile_id, **document}
+
+
+def _updated_at(profile: dict) -> Optional[str]:
+    value = profile.get("updated_at")
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+class SqliteProfileRepository(ProfileRepository):
+    """
+    Repositorio de perfiles en un archivo SQLite.
+
+    Attributes:
+        path (str): Ruta del archivo de la base, o ":memory:"
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connection = None
+        self._executor = None
+
+    async def _run(self, function, *args):
+        """
+        Ejecuta una función que usa la conexión en el hilo de la base.
+        """
+        if self._connection is None:
+            raise RuntimeError("La base SQLite no está inicializada")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    async def connect(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        loop = asyncio.get_running_loop()
+        self._connection = await loop.run_in_executor(self._executor, self._open)
+        logger.info(f"Base SQLite abierta en {self.path}")
+
+    def _open(self) -> sqlite3.Connection:
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(SCHEMA)
+        connection.commit()
+        return connection
+
+    async def close(self):
+        if self._connection is not None:
+            await self._run(self._connection.close)
+            self._connection = None
+            logger.info("Base SQLite cerrada")
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def ping(self) -> float:
+        start = time.perf_counter()
+        await self._run(lambda: self._connection.execute("SELECT 1").fetchone())
+        return (time.perf_counter() - start) * 1000
+
+    def health(self) -> dict:
+        return {"path": self.path}
+
+    async def ensure_indexes(self):
+        def create():
+            for statement in INDEXES:
+                try:
+                    self._connection.execute(statement)
+                except sqlite3.Error as e:
+                    logger.error(f"Error al crear índice de SQLite: {str(e)}")
+            self._connection.commit()
+
+        await self._run(create)
+        logger.info("Índices de perfiles verificados en SQLite")
+
+    def _insert(self, profile: dict) -> str:
+        profile_id = str(ObjectId())
+        self._connection.execute(
+            "INSERT INTO profiles (id, updated_at, doc) VALUES (?, ?, ?)",
+            (profile_id, _updated_at(profile), _encode(profile))
+        )
+        return profile_id
+
+    async def create_profile(self, profile: dict) -> str:
+        def create():
+            try:
+                profile_id = self._insert(profile)
+                self._connection.commit()
+                return profile_id
+            except Exception:
+                self._connection.rollback()
+                raise
+
+        try:
+            with db_timer(self.name, "create_profile"):
+                profile["_id"] = await self._run(create)
+            logger.info(f"Perfil creado con ID: {profile['_id']}")
+            return profile["_id"]
+        except sqlite3.IntegrityError as e:
+            logger.warning(f"Email duplicado al crear perfil: {str(e)}")
+            raise DuplicateProfileError(str(e)) from e
+        except Exception as e:
+            logger.error(f"Error al crear perfil: {str(e)}")
+            raise
+
+    async def create_profiles(self, profiles: List[dict], chunk_size: int) -> List[dict]:
+        def create_chunk(chunk: List[dict]) -> List[dict]:
+            # Un error de restricción solo aborta su sentencia, no la transacción
+            results = []
+            for profile in chunk:
+                try:
+                    profile["_id"] = self._insert(profile)
+                    results.append({"id": profile["_id"]})
+                except sqlite3.Error as e:
+                    results.append({"error": str(e)})
+            self._connection.commit()
+            return results
+
+        results = []
+        for start in range(0, len(profiles), chunk_size):
+            with db_timer(self.name, "create_profiles"):
+                results.extend(await self._run(create_chunk, profiles[start:start + chunk_size]))
+        created = sum(1 for result in results if "id" in result)
+        logger.info(f"Creación masiva: {created} de {len(profiles)} perfiles creados")
+        return results
+
+    async def get_profile(self, profile_id: str) -> Optional[dict]:
+        def get():
+            return self._connection.execute(
+                "SELECT id, doc FROM profiles WHERE id = ?", (profile_id,)
+            ).fetchone()
+
+        try:
+            with db_timer(self.name, "get_profile"):
+                row = await self._run(get)
+            return _decode(*row) if row else None
+        except Exception as e:
+            logger.error(f"Error al obtener perfil {profile_id}: {str(e)}")
+            return None
+
+    def _select(self, conditions: List[str], params: list, after: Optional[str],
+                limit: int, fields: Optional[List[str]]) -> List[dict]:
+        """
+        Consulta perfiles ordenados por ID; se ejecuta en el hilo de la base.
+        """
+        conditions = list(conditions)
+        params = list(params)
+        if after:
+            conditions.append("id > ?")
+            params.append(after)
+        sql = "SELECT id, doc FROM profiles"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY id"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        rows = self._connection.execute(sql, params).fetchall()
+        return [_decode(profile_id, doc, fields) for profile_id, doc in rows]
+
+    async def _find_page(self, conditions: List[str], params: list, limit: int,
+                         after: Optional[str], fields: Optional[List[str]]) -> Tuple[list, Optional[str]]:
+        # Se pide un perfil extra para saber si existe una página siguiente
+        profiles = await self._run(self._select, conditions, params, after, limit + 1, fields)
+        next_cursor = None
+        if len(profiles) > limit:
+            profiles = profiles[:limit]
+            next_cursor = profiles[-1]["_id"]
+        return profiles, next_cursor
+
+    async def list_profiles(self, limit, after=None, fields=None):
+        try:
+            with db_timer(self.name, "list_profiles"):
+                return await self._find_page([], [], limit, after, fields)
+        except Exception as e:
+            logger.error(f"Error al obtener perfiles: {str(e)}")
+            return [], None
+
+    async def search_profiles(self, limit, after=None, fields=None, skills=None,
+                              language=None, min_language_level=None, location=None):
+        conditions, params = [], []
+        for skill in skills or []:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM json_each(doc, '$.skills') "
+                "WHERE json_extract(value, '$.name') = ?)"
+            )
+            params.append(skill)
+        if language:
+            condition = "json_extract(value, '$.name') = ?"
+            params.append(language)
+            if min_language_level:
+                levels = LANGUAGE_LEVELS[LANGUAGE_LEVELS.index(min_language_level):]
+                condition += f" AND json_extract(value, '$.level') IN ({', '.join('?' * len(levels))})"
+                params.extend(levels)
+            conditions.append(f"EXISTS (SELECT 1 FROM json_each(doc, '$.languages') WHERE {condition})")
+        if location:
+            # Un rango sobre la expresión indexada equivale a un prefijo sensible a mayúsculas
+            conditions.append("json_extract(doc, '$.location') >= ? AND json_extract(doc, '$.location') < ?")
+            params.extend([location, location + _MAX_CHAR])
+
+        try:
+            with db_timer(self.name, "search_profiles"):
+                return await self._find_page(conditions, params, limit, after, fields)
+        except Exception as e:
+            logger.error(f"Error al buscar perfiles: {str(e)}")
+            return [], None
+
+    async def iter_profiles(self, batch_size, updated_since=None, after=None, ids=None,
+                            location=None, limit=0, fields=None) -> AsyncIterator[dict]:
+        conditions, params = [], []
+        if updated_since:
+            conditions.append("updated_at >= ?")
+            params.append(updated_since.isoformat())
+        if ids is not None:
+            conditions.append(f"id IN ({', '.join('?' * len(ids))})")
+            params.extend(ids)
+        if location:
+            conditions.append("json_extract(doc, '$.location') = ?")
+            params.append(location)
+
+        # Cada lote es una consulta independiente que continúa desde el último ID
+        remaining = limit
+        try:
+            while True:
+                size = min(batch_size, remaining) if limit else batch_size
+                profiles = await self._run(self._select, conditions, params, after, size, fields)
+                for profile in profiles:
+                    yield profile
+                if limit:
+                    remaining -= len(profiles)
+                if len(profiles) < size or (limit and remaining <= 0):
+                    return
+                after = profiles[-1]["_id"]
+        except Exception as e:
+            logger.error(f"Error al recorrer perfiles: {str(e)}")
+            raise
+
+    async def update_profile(self, profile_id: str, profile_data: dict) -> bool:
+        profile_data["updated_at"] = datetime.now()
+
+        def update() -> bool:
+            row = self._connection.execute(
+                "SELECT doc FROM profiles WHERE id = ?", (profile_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            document = {**json.loads(row[0]), **json.loads(_encode(profile_data))}
+            try:
+                self._connection.execute(
+                    "UPDATE profiles SET updated_at = ?, doc = ? WHERE id = ?",
+                    (document["updated_at"], json.dumps(document, ensure_ascii=False), profile_id)
+                )
+                self._connection.commit()
+            except Exception:
+                self._connection.rollback()
+                raise
+            return True
+
+        try:
+            with db_timer(self.name, "update_profile"):
+                success = await self._run(update)
+            if success:
+                logger.info(f"Perfil {profile_id} actualizado exitosamente")
+            else:
+                logger.warning(f"No se encontró el perfil {profile_id} para actualizar")
+            return success
+        except sqlite3.IntegrityError as e:
+            logger.warning(f"Email duplicado al actualizar perfil {profile_id}: {str(e)}")
+            raise DuplicateProfileError(str(e)) from e
+        except Exception as e:
+            logger.error(f"Error al actualizar perfil {profile_id}: {str(e)}")
+            return False
+
+    async def delete_profile(self, profile_id: str) -> bool:
+        def delete() -> bool:
+            cursor = self._connection.execute("DELETE FROM profiles WHERE id = ?", (profile_id,))
+            self._connection.commit()
+            return cursor.rowcount > 0
+
+        try:
+            with db_timer(self.name, "delete_profile"):
+                success = await self._run(delete)
+            if success:
+                logger.info(f"Perfil {profile_id} eliminado exitosamente")
+            else:
+                logger.warning(f"No se encontró el perfil {profile_id} para eliminar")
+            return success
+        except Exception as e:
+            logger.error(f"Error al eliminar perfil {profile_id}: {str(e)}")
+            return False
+
+    async def _update_item(self, operation: str, profile_id: str, sql: str, params: tuple) -> bool:
+        """
+        Ejecuta una actualización de un elemento de una sección en una sola sentencia.
+        """
+        def update() -> bool:
+            cursor = self._connection.execute(sql, params)
+            self._connection.commit()
+            return cursor.rowcount > 0
+
+        try:
+            with db_timer(self.name, operation):
+                return await self._run(update)
+        except Exception as e:
+            logger.error(f"Error al editar una sección del perfil {profile_id}: {str(e)}")
+            return False
+
+    async def push_item(self, profile_id: str, section: str, item: dict) -> bool:
+        now = datetime.now().isoformat()
+        return await self._update_item(
+            "push_profile_item", profile_id,
+            "UPDATE profiles SET updated_at = ?, "
+            "doc = json_set(json_insert(doc, ?, json(?)), '$.updated_at', ?) WHERE id = ?",
+            (now, f"$.{section}[#]", _encode(item), now, profile_id)
+        )
+
+    @staticmethod
+    def _item_condition(section: str, expected_items: Optional[list]) -> Tuple[str, tuple]:
+        """
+        Condición SQL de que la sección contenga exactamente `expected_items`, si se indica.
+        """
+        if expected_items is None:
+            return "", ()
+        # json() normaliza ambos lados al mismo formato compacto
+        items = json.dumps(expected_items, default=_json_default, ensure_ascii=False)
+        return " AND json_extract(doc, ?) = json(?)", (f"$.{section}", items)
+
+    async def replace_item(self, profile_id: str, section: str, index: int, item: dict,
+                           expected_items: Optional[list] = None) -> bool:
+        now = datetime.now().isoformat()
+        path = f"$.{section}[{index}]"
+        condition, params = self._item_condition(section, expected_items)
+        return await self._update_item(
+            "set_profile_item", profile_id,
+            "UPDATE profiles SET updated_at = ?, "
+            "doc = json_set(doc, ?, json(?), '$.updated_at', ?) "
+            "WHERE id = ? AND json_type(doc, ?) IS NOT NULL" + condition,
+            (now, path, _encode(item), now, profile_id, path, *params)
+        )
+
+    async def remove_item(self, profile_id: str, section: str, index: int,
+                          expected_items: Optional[list] = None) -> bool:
+        now = datetime.now().isoformat()
+        path = f"$.{section}[{index}]"
+        condition, params = self._item_condition(section, expected_items)
+        return await self._update_item(
+            "remove_profile_item", profile_id,
+            "UPDATE profiles SET updated_at = ?, "
+            "doc = json_set(json_remove(doc, ?), '$.updated_at', ?) "
+            "WHERE id = ? AND json_type(doc, ?) IS NOT NULL" + condition,
+            (now, path, now, profile_id, path, *params)
+        )
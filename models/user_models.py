@@ -6,8 +6,9 @@ y la serialización/deserialización de los perfiles de CV.
 """
 
 from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
+from enum import Enum
 
 class Experience(BaseModel):
     """
@@ -54,6 +55,9 @@ class Skill(BaseModel):
     name: str = Field(..., min_length=2, max_length=50)
     level: str = Field(..., min_length=2, max_length=50)
 
+# Niveles del Marco Común Europeo, de menor a mayor
+LANGUAGE_LEVELS = ["A1", "A2", "B1", "B2", "C1", "C2"]
+
 class Language(BaseModel):
     """
     Modelo para idiomas.
@@ -108,3 +112,121 @@ class ProfileUpdate(BaseModel):
     education: Optional[List[Education]] = None
     skills: Optional[List[Skill]] = None
     languages: Optional[List[Language]] = None
+
+class ProfilePage(BaseModel):
+    """
+    Modelo para una página del listado de perfiles.
+
+    Attributes:
+        items (List[Dict[str, Any]]): Perfiles de la página, con los campos solicitados
+        next_cursor (str): Valor de `after` para obtener la siguiente página,
+            o None si no hay más perfiles
+    """
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+class BulkItemResult(BaseModel):
+    """
+    Modelo para el resultado de un perfil dentro de una creación masiva.
+
+    Attributes:
+        index (int): Posición del perfil en la petición
+        id (str): ID del perfil creado, si se creó
+        error (Any): Errores de validación o de inserción, si falló
+    """
+    index: int
+    id: Optional[str] = None
+    error: Optional[Any] = None
+
+class BulkCreateResponse(BaseModel):
+    """
+    Modelo para la respuesta de una creación masiva de perfiles.
+
+    Attributes:
+        created (int): Número de perfiles creados
+        failed (int): Número de perfiles que no se pudieron crear
+        results (List[BulkItemResult]): Resultado de cada perfil
+    """
+    created: int
+    failed: int
+    results: List[BulkItemResult]
+
+class CvBatchRequest(BaseModel):
+    """
+    Modelo para solicitar varios CVs en PDF empaquetados en un ZIP.
+
+    Se deben indicar los IDs de los perfiles o un filtro.
+
+    Attributes:
+        ids (List[str]): IDs de los perfiles a incluir
+        location (str): Incluir los perfiles con esta ubicación
+    """
+    ids: Optional[List[str]] = Field(None, min_length=1)
+    location: Optional[str] = Field(None, min_length=2, max_length=100)
+
+class ExportFormat(str, Enum):
+    """
+    Formatos disponibles para la exportación masiva de perfiles.
+    """
+    ndjson = "ndjson"
+    csv = "csv"
+
+class SuggestField(str, Enum):
+    """
+    Campos disponibles para el autocompletado.
+    """
+    skill = "skill"
+    position = "position"
+    company = "company"
+    location = "location"
+
+class ProfileSection(str, Enum):
+    """
+    Listas del perfil que se pueden editar elemento por elemento.
+    """
+    experiences = "experiences"
+    education = "education"
+    skills = "skills"
+    languages = "languages"
+
+# Modelo con el que se valida cada elemento de una sección
+SECTION_MODELS = {
+    ProfileSection.experiences: Experience,
+    ProfileSection.education: Education,
+    ProfileSection.skills: Skill,
+    ProfileSection.languages: Language,
+}
+
+class PdfJobStatus(str, Enum):
+    """
+    Estados de un trabajo de generación de PDF.
+    """
+    pending = "pending"
+    running = "running"
+    done = "done"
+    failed = "failed"
+
+class PdfJob(BaseModel):
+    """
+    Modelo para el estado de un trabajo de generación de PDF.
+
+    Attributes:
+        id (str): ID del trabajo
+        profile_id (str): ID del perfil cuyo CV se genera
+        status (PdfJobStatus): Estado del trabajo
+        created_at (datetime): Fecha de creación
+        started_at (datetime): Fecha en que un worker tomó el trabajo
+        finished_at (datetime): Fecha en que terminó, con éxito o con error
+        size (int): Tamaño del PDF generado en bytes
+        error (str): Motivo del fallo
+        download_url (str): URL de descarga cuando el PDF está listo
+    """
+    id: str
+    profile_id: str
+    status: PdfJobStatus
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    size: Optional[int] = None
+    error: Optional[str] = None
+    download_url: Optional[str] = None
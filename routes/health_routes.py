@@ -0,0 +1,65 @@
+"""
+Rutas de salud de la aplicación.
+
+Este módulo contiene los endpoints que usan los balanceadores y orquestadores
+para saber si la instancia puede recibir tráfico.
+"""
+
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse
+import logging
+
+from db.repository import get_repository
+
+logger = logging.getLogger(__name__)
+
+# Creamos el router de salud, sin el prefijo de la API
+router = APIRouter(
+    prefix="/health",
+    tags=["Health"]
+)
+
+@router.get("/ready",
+    response_model=dict,
+    summary="Readiness de la instancia",
+    description="Verifica la conexión a la base de datos y reporta la latencia del ping y el estado del pool")
+async def readiness():
+    """
+    Verifica que la instancia pueda atender peticiones.
+
+    Returns:
+        dict: Estado y, bajo el nombre del backend, latencia del ping en
+            milisegundos y datos propios (p. ej. contadores del pool de
+            MongoDB). Responde 503 si la base de datos no está disponible.
+    """
+    repository = get_repository()
+    try:
+        latency_ms = await repository.ping()
+    except Exception as e:
+        logger.error(f"Readiness fallida: {str(e)}")
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "unavailable", repository.name: {"error": str(e), **repository.health()}}
+        )
+    return {
+        "status": "ready",
+        repository.name: {"ping_ms": round(latency_ms, 3), **repository.health()}
+    }
+
+@router.get("/startup",
+    response_model=dict,
+    summary="Tiempos de arranque",
+    description="Reporta cuánto tardó la importación de cada módulo, la creación de la aplicación y su arranque")
+async def startup_report(request: Request):
+    """
+    Obtiene el reporte de arranque de la aplicación.
+
+    Args:
+        request (Request): Objeto de solicitud FastAPI
+
+    Returns:
+        dict: Milisegundos de importación por módulo (`imports_ms`), de cada
+            paso del ciclo de vida (`lifespan_ms`), de `create_app` y desde
+            la importación de `app` hasta que la aplicación quedó lista
+    """
+    return request.app.state.startup
@@ -0,0 +1,117 @@
+"""
+Ruta de métricas de la aplicación.
+
+Este módulo expone en `/metrics` las métricas de `utils.metrics` en el formato
+de texto de Prometheus, junto con los contadores de las cachés y del pool de
+conexiones, que se leen en el momento de cada consulta. Con varios workers se
+combinan las métricas de todos los procesos (ver `METRICS_MULTIPROCESS_DIR`).
+"""
+
+from typing import List
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+
+from config import get_settings
+from db.repository import get_repository
+from utils.metrics import CONTENT_TYPE, REGISTRY
+from utils.pdf_jobs import get_pdf_job_queue
+from utils.pdf_store import get_pdf_store
+from utils.suggest_index import get_suggestion_index
+
+# Creamos el router de métricas, sin el prefijo de la API
+router = APIRouter(tags=["Metrics"])
+
+
+def _cache_families(prefix: str, description: str, stats: dict) -> List[tuple]:
+    """
+    Construye las familias de aciertos, fallos y tasa de aciertos de una caché.
+
+    Args:
+        prefix (str): Prefijo de los nombres de las métricas
+        description (str): Nombre de la caché para las descripciones
+        stats (dict): Contadores de la caché, con `hits` y `misses`
+
+    Returns:
+        List[tuple]: Familias de las métricas, según `format_family`
+    """
+    lookups = stats["hits"] + stats["misses"]
+    return [
+        (f"{prefix}_hits_total", "counter", f"Aciertos de {description}", [("", [], stats["hits"])]),
+        (f"{prefix}_misses_total", "counter", f"Fallos de {description}", [("", [], stats["misses"])]),
+        (f"{prefix}_hit_ratio", "gauge", f"Tasa de aciertos de {description}",
+         [("", [], stats["hits"] / lookups if lookups else 0.0)]),
+        (f"{prefix}_entries", "gauge", f"Entradas de {description}", [("", [], stats["entries"])]),
+    ]
+
+
+def collect_state_families() -> List[tuple]:
+    """
+    Obtiene las métricas de estado de las cachés, el índice de sugerencias, la
+    cola de trabajos de PDF y el pool.
+
+    Returns:
+        List[tuple]: Familias de las métricas de los componentes habilitados,
+            según `format_family`
+    """
+    families = []
+    repository = get_repository()
+    stats = repository.profile_cache_stats()
+    if stats is not None:
+        families += _cache_families("profile_cache", "la caché de perfiles", stats)
+
+    # Los trabajos de PDF usan el almacén aunque `PDF_CACHE_ENABLED` esté desactivado
+    stats = get_pdf_store().stats()
+    families += _cache_families("pdf_store", "el almacén de PDFs", stats)
+    families.append(("pdf_store_bytes", "gauge", "Bytes ocupados por el almacén de PDFs",
+                     [("", [], stats["bytes"])]))
+
+    suggestion_index = get_suggestion_index()
+    if suggestion_index is not None:
+        stats = suggestion_index.stats()
+        families.append(("suggestion_index_values", "gauge", "Valores distintos del índice de sugerencias",
+                         [("", [("field", field)], count) for field, count in stats["values"].items()]))
+        families.append(("suggestion_index_memory_bytes", "gauge", "Memoria estimada del índice de sugerencias",
+                         [("", [], stats["memory_bytes"])]))
+
+    stats = get_pdf_job_queue().stats()
+    families.append(("pdf_jobs", "gauge", "Trabajos de generación de PDF sin terminar",
+                     [("", [("state", "pending")], stats["pending"]),
+                      ("", [("state", "running")], stats["running"])]))
+
+    if repository.name == "mongo":
+        stats = repository.health()["pool"]
+        families.append(("mongo_pool_connections", "gauge", "Conexiones del pool de MongoDB",
+                         [("", [("state", "in_use")], stats["in_use"]), ("", [("state", "idle")], stats["idle"])]))
+        families.append(("mongo_pool_checkout_failures_total", "counter",
+                         "Fallos al obtener una conexión del pool de MongoDB",
+                         [("", [], stats["checkout_failures"])]))
+    return families
+
+
+REGISTRY.register_collector(collect_state_families)
+
+
+@router.get("/metrics",
+    response_class=Response,
+    summary="Métricas de Prometheus",
+    description="Latencias por ruta y fase, operaciones de base de datos, generación de CVs y cachés")
+async def metrics():
+    """
+    Expone las métricas de la aplicación en el formato de texto de Prometheus.
+
+    Se generan en un hilo aparte: leen y escriben las instantáneas en disco y
+    consultan el almacén de PDFs.
+
+    Returns:
+        Response: Métricas en texto plano
+    """
+    settings = get_settings()
+    if settings.metrics_multiprocess_dir:
+        # Las instantáneas de los demás workers tienen como mucho tres intervalos
+        lines = await run_in_threadpool(REGISTRY.render_multiprocess, settings.metrics_multiprocess_dir,
+                                        3 * settings.metrics_snapshot_interval)
+    else:
+        lines = await run_in_threadpool(REGISTRY.render)
+    return Response(content="\n".join(lines) + "\n", media_type=CONTENT_TYPE)
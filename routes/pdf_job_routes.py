@@ -0,0 +1,202 @@
+"""
+Rutas de los trabajos de generación de PDF.
+
+Este módulo permite pedir el CV en PDF de un perfil sin mantener abierta la
+conexión mientras se genera: la petición registra un trabajo, el cliente
+consulta su estado y descarga el PDF cuando está listo.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import JSONResponse, Response
+import logging
+
+from db.repository import get_repository
+from models.user_models import PdfJob
+from utils.admission import admission
+from utils.pdf_jobs import PdfJobQueueFull, get_pdf_job_queue
+from utils.pdf_utils import content_disposition
+
+logger = logging.getLogger(__name__)
+
+# Segundos sugeridos al cliente entre consultas del estado de un trabajo
+POLL_INTERVAL_SECONDS = 1
+
+# Creamos el router de trabajos con el prefijo de la API
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["PDF Jobs"],
+    responses={404: {"description": "Recurso no encontrado"}}
+)
+
+
+def _job_response(request: Request, job: dict) -> PdfJob:
+    """
+    Construye la representación pública de un trabajo.
+
+    Args:
+        request (Request): Objeto de solicitud FastAPI
+        job (dict): Datos del trabajo
+
+    Returns:
+        PdfJob: Estado del trabajo, con la URL de descarga si está listo
+    """
+    download_url = None
+    if job["status"] == "done":
+        download_url = str(request.url_for("download_pdf_job", job_id=job["id"]))
+    return PdfJob(
+        id=job["id"],
+        profile_id=job["profile_id"],
+        status=job["status"],
+        created_at=job["created_at"],
+        started_at=job.get("started_at"),
+        finished_at=job.get("finished_at"),
+        size=job.get("size"),
+        error=job.get("error"),
+        download_url=download_url
+    )
+
+
+async def _get_job(job_id: str) -> dict:
+    """
+    Obtiene un trabajo o responde 404.
+
+    Raises:
+        HTTPException: Si el trabajo no existe o expiró
+    """
+    job = await get_pdf_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Trabajo no encontrado"
+        )
+    return job
+
+
+@router.post("/profiles/{profile_id}/pdf-jobs",
+    dependencies=[Depends(admission("crud"))],
+    response_model=PdfJob,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Solicitar CV en PDF",
+    description="Registra la generación del CV en PDF y retorna el trabajo sin esperar a que termine")
+async def create_pdf_job(profile_id: str, request: Request):
+    """
+    Registra un trabajo de generación del CV en PDF de un perfil.
+
+    Args:
+        profile_id (str): ID del perfil
+        request (Request): Objeto de solicitud FastAPI
+
+    Returns:
+        JSONResponse: Trabajo en estado pendiente, con su URL en `Location`
+
+    Raises:
+        HTTPException: Si el perfil no existe o la cola de trabajos está llena
+    """
+    profile = await get_repository().get_profile(profile_id)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Perfil no encontrado"
+        )
+
+    try:
+        job = await get_pdf_job_queue().submit(profile_id)
+    except PdfJobQueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="La cola de generación de PDFs está llena",
+            headers={"Retry-After": "5"}
+        )
+
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=_job_response(request, job).model_dump(mode="json"),
+        headers={
+            "Location": str(request.url_for("get_pdf_job", job_id=job["id"])),
+            "Retry-After": str(POLL_INTERVAL_SECONDS)
+        }
+    )
+
+
+@router.get("/pdf-jobs/{job_id}",
+    dependencies=[Depends(admission("crud"))],
+    response_model=PdfJob,
+    summary="Estado de un trabajo de PDF",
+    description="Retorna el estado del trabajo y, cuando termina, la URL de descarga")
+async def get_pdf_job(job_id: str, request: Request):
+    """
+    Obtiene el estado de un trabajo de generación de PDF.
+
+    Mientras el trabajo no termina, `Retry-After` indica cuándo volver a consultar.
+
+    Args:
+        job_id (str): ID del trabajo
+        request (Request): Objeto de solicitud FastAPI
+
+    Returns:
+        JSONResponse: Estado del trabajo
+
+    Raises:
+        HTTPException: Si el trabajo no existe o expiró
+    """
+    job = await _get_job(job_id)
+    headers = {}
+    if job["status"] in ("pending", "running"):
+        headers["Retry-After"] = str(POLL_INTERVAL_SECONDS)
+    return JSONResponse(
+        content=_job_response(request, job).model_dump(mode="json"),
+        headers=headers
+    )
+
+
+@router.get("/pdf-jobs/{job_id}/download",
+    dependencies=[Depends(admission("render"))],
+    response_class=Response,
+    summary="Descargar el PDF de un trabajo",
+    description="Descarga el CV en PDF generado por un trabajo terminado")
+async def download_pdf_job(job_id: str):
+    """
+    Descarga el PDF generado por un trabajo.
+
+    Args:
+        job_id (str): ID del trabajo
+
+    Returns:
+        Response: Archivo PDF del CV
+
+    Raises:
+        HTTPException: Si el trabajo no existe, no terminó o falló (409), o si
+            el perfil cambió o se eliminó y el PDF ya no está disponible (410)
+    """
+    job = await _get_job(job_id)
+    if job["status"] == "failed":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"El trabajo falló: {job['error']}"
+        )
+    if job["status"] != "done":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="El PDF aún no está listo",
+            headers={"Retry-After": str(POLL_INTERVAL_SECONDS)}
+        )
+
+    try:
+        pdf_bytes = await get_pdf_job_queue().result(job)
+    except Exception as e:
+        logger.error(f"Error al obtener el PDF del trabajo {job_id}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error al generar el PDF"
+        )
+    if pdf_bytes is None:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="El PDF ya no está disponible; el perfil cambió o se eliminó"
+        )
+
+    return Response(
+        content=pdf_bytes,
+        media_type="application/pdf",
+        headers={"Content-Disposition": content_disposition(job["filename"])}
+    )
@@ -5,35 +5,43 @@ Este módulo contiene todas las rutas relacionadas con el manejo de perfiles
 y la generación de CVs en diferentes formatos (HTML y PDF).
 """
 
-from fastapi import APIRouter, HTTPException, Request, status
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
-from models.user_models import Profile, ProfileUpdate
-from typing import List
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request, status
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from models.user_models import (
+    SECTION_MODELS,
+    BulkCreateResponse,
+    CvBatchRequest,
+    ExportFormat,
+    Profile,
+    ProfilePage,
+    ProfileSection,
+    ProfileUpdate,
+    SuggestField
+)
+from pydantic import ValidationError
+from typing import Any, Dict, List, Optional, Tuple
+from bson import ObjectId
 from uuid import uuid4
 import os
 import logging
-from fpdf import FPDF
 from datetime import datetime
 
-# Configuración del sistema de logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Obtenemos la ruta base del proyecto
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
 # Importamos las dependencias necesarias de la base de datos
-from db.database import (
-    get_all_profiles,
-    get_profile_by_id,
-    create_profile_db,
-    update_profile_db,
-    delete_profile_db
-)
-
-# Configuramos el sistema de templates
-templates = Jinja2Templates(directory=os.path.join(BASE_DIR, "templates"))
+from db.repository import DuplicateProfileError, get_repository
+
+from config import get_settings
+from utils.admission import admission
+from utils.export_utils import csv_chunks, ndjson_chunks
+from utils.http_cache import cache_headers, etag_matches, if_match, make_etag, not_modified
+from utils.json_response import FastJSONResponse, fast_json_enabled, profile_document
+from utils.pdf_store import get_pdf_store
+from utils.suggest_index import get_suggestion_index
+from utils.template_utils import render_html
+from utils.pdf_utils import content_disposition, cv_filename, get_cv_pdf
+from utils.zip_stream import zip_cv_stream
 
 # Creamos el router con la configuración de la API
 router = APIRouter(
@@ -42,7 +50,125 @@ router = APIRouter(
     responses={404: {"description": "Recurso no encontrado"}}
 )
 
+def _page_params(limit: Optional[int], after: Optional[str],
+                 fields: Optional[str]) -> Tuple[int, Optional[List[str]]]:
+    """
+    Valida los parámetros de paginación y proyección de los listados de perfiles.
+
+    Args:
+        limit (int, optional): Tamaño de página solicitado
+        after (str, optional): Cursor de la página anterior
+        fields (str, optional): Campos a retornar separados por comas
+
+    Returns:
+        tuple: Tamaño de página efectivo y lista de campos (None para todos)
+
+    Raises:
+        HTTPException: Si el cursor o los campos no son válidos
+    """
+    settings = get_settings()
+    limit = min(limit or settings.profiles_page_size, settings.profiles_max_page_size)
+    if after and not ObjectId.is_valid(after):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor de paginación no válido"
+        )
+
+    field_list = None
+    if fields:
+        field_list = [field.strip() for field in fields.split(",") if field.strip()]
+        invalid = [field for field in field_list if field not in Profile.model_fields]
+        if invalid:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Campos no válidos: {', '.join(invalid)}"
+            )
+    return limit, field_list
+
+def _validation_errors(error: ValidationError) -> List[dict]:
+    """
+    Resume los errores de validación de Pydantic para la respuesta.
+
+    Args:
+        error (ValidationError): Error de validación
+
+    Returns:
+        List[dict]: Ubicación, mensaje y tipo de cada error
+    """
+    return [
+        {"loc": list(item["loc"]), "msg": item["msg"], "type": item["type"]}
+        for item in error.errors()
+    ]
+
+def _section_item(section: ProfileSection, data: Dict[str, Any]) -> dict:
+    """
+    Valida un elemento de una sección del perfil con su modelo.
+
+    Args:
+        section (ProfileSection): Sección del perfil
+        data (Dict[str, Any]): Datos del elemento
+
+    Returns:
+        dict: Elemento validado
+
+    Raises:
+        HTTPException: Si el elemento no es válido para la sección
+    """
+    try:
+        return SECTION_MODELS[section](**data).dict()
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=_validation_errors(e)
+        )
+
+async def _profile_for_item_edit(request: Request, profile_id: str, section: ProfileSection, index: int) -> dict:
+    """
+    Obtiene el perfil cuyo elemento se va a modificar, verificando `If-Match`.
+
+    Los elementos se identifican por su posición, así que solo se modifican si
+    el cliente conoce la versión actual del perfil (el ETag de
+    `GET /profiles/{profile_id}`); de lo contrario la posición podría
+    corresponder a otro elemento tras una edición concurrente.
+
+    Raises:
+        HTTPException: Si falta `If-Match` (428), si el perfil o el elemento
+            no existen (404) o si el perfil cambió (412)
+    """
+    if "if-match" not in request.headers:
+        raise HTTPException(
+            status_code=status.HTTP_428_PRECONDITION_REQUIRED,
+            detail="Se requiere la cabecera If-Match con el ETag del perfil"
+        )
+    profile = await get_repository().get_profile(profile_id)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Perfil o elemento no encontrado"
+        )
+    if not if_match(request, make_etag(profile, "json")):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="El perfil cambió; obtenga la versión actual y reintente"
+        )
+    if index >= len(profile.get(section.value) or []):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Perfil o elemento no encontrado"
+        )
+    return profile
+
+def _single_item_profile(profile: Optional[dict], section: ProfileSection, index: int) -> Optional[dict]:
+    """
+    Obtiene el perfil parcial con solo el elemento indicado, para el índice de sugerencias.
+    """
+    items = (profile or {}).get(section.value) or []
+    if index >= len(items):
+        return None
+    return {section.value: [items[index]]}
+
 @router.post("/profiles", 
+    dependencies=[Depends(admission("crud"))],
     response_model=dict,
     status_code=status.HTTP_201_CREATED,
     summary="Crear un nuevo perfil",
@@ -58,12 +184,21 @@ async def create_profile(profile: Profile):
         dict: ID del perfil creado y mensaje de éxito
 
     Raises:
-        HTTPException: Si hay un error al crear el perfil
+        HTTPException: Si ya existe un perfil con el mismo email (409) o hay
+            un error al crear el perfil
     """
     try:
         profile_dict = profile.dict()
-        profile_id = await create_profile_db(profile_dict)
+        profile_id = await get_repository().create_profile(profile_dict)
+        suggestion_index = get_suggestion_index()
+        if suggestion_index is not None:
+            suggestion_index.add_profile(profile_dict)
         return {"id": profile_id, "message": "Perfil creado exitosamente"}
+    except DuplicateProfileError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Ya existe un perfil con ese email"
+        )
     except Exception as e:
         logger.error(f"Error al crear perfil: {str(e)}")
         raise HTTPException(
@@ -71,30 +206,317 @@ async def create_profile(profile: Profile):
             detail="Error al crear el perfil"
         )
 
+@router.post("/profiles:bulk",
+    dependencies=[Depends(admission("bulk"))],
+    response_model=BulkCreateResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Crear perfiles de forma masiva",
+    description="Valida y crea una lista de perfiles; los errores se reportan por perfil")
+async def create_profiles_bulk(profiles: List[Dict[str, Any]] = Body(...)):
+    """
+    Crea varios perfiles de CV en una sola petición.
+
+    Cada perfil se valida con el modelo Profile. Los perfiles válidos se
+    insertan por lotes; los que fallan en la validación o en la inserción se
+    reportan en su posición sin afectar al resto.
+
+    Args:
+        profiles (List[Dict[str, Any]]): Datos de los perfiles a crear
+
+    Returns:
+        BulkCreateResponse: Resultado de cada perfil
+
+    Raises:
+        HTTPException: Si la petición excede el número máximo de perfiles
+    """
+    settings = get_settings()
+    if len(profiles) > settings.bulk_max_profiles:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Se permiten como máximo {settings.bulk_max_profiles} perfiles por petición"
+        )
+
+    results = [None] * len(profiles)
+    valid_indexes = []
+    valid_profiles = []
+    for index, data in enumerate(profiles):
+        try:
+            valid_profiles.append(Profile(**data).dict())
+            valid_indexes.append(index)
+        except ValidationError as e:
+            results[index] = {"index": index, "error": _validation_errors(e)}
+
+    inserted = await get_repository().create_profiles(valid_profiles, settings.bulk_insert_chunk_size)
+    suggestion_index = get_suggestion_index()
+    for index, profile, result in zip(valid_indexes, valid_profiles, inserted):
+        results[index] = {"index": index, **result}
+        if suggestion_index is not None and "id" in result:
+            suggestion_index.add_profile(profile)
+
+    created = sum(1 for result in results if result.get("id"))
+    return {"created": created, "failed": len(results) - created, "results": results}
+
+@router.post("/profiles:zip",
+    dependencies=[Depends(admission("bulk"))],
+    response_class=StreamingResponse,
+    summary="Descargar varios CVs en un ZIP",
+    description="Genera en paralelo los PDFs de los perfiles indicados y los envía en un ZIP en flujo")
+async def download_cvs_zip(batch: CvBatchRequest):
+    """
+    Genera los CVs en PDF de varios perfiles y los empaqueta en un ZIP.
+
+    El ZIP se envía a medida que terminan los PDFs, por lo que la memoria
+    usada no depende del número de perfiles.
+
+    Args:
+        batch (CvBatchRequest): IDs de los perfiles o filtro a aplicar
+
+    Returns:
+        StreamingResponse: Archivo ZIP con los CVs
+
+    Raises:
+        HTTPException: Si la petición no indica perfiles, tiene IDs no válidos
+            o excede el número máximo de perfiles
+    """
+    settings = get_settings()
+    if batch.ids is None and batch.location is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Se deben indicar los IDs de los perfiles o un filtro"
+        )
+    if batch.ids is not None:
+        if len(batch.ids) > settings.zip_max_profiles:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Se permiten como máximo {settings.zip_max_profiles} perfiles por ZIP"
+            )
+        invalid = [profile_id for profile_id in batch.ids if not ObjectId.is_valid(profile_id)]
+        if invalid:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"IDs no válidos: {', '.join(invalid)}"
+            )
+
+    profiles = get_repository().iter_profiles(
+        settings.export_batch_size,
+        ids=batch.ids,
+        location=batch.location,
+        limit=settings.zip_max_profiles
+    )
+    concurrency = settings.zip_render_concurrency or settings.pdf_render_workers or os.cpu_count() or 1
+    return StreamingResponse(
+        zip_cv_stream(profiles, concurrency),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="cvs.zip"'}
+    )
+
 @router.get("/profiles", 
-    response_model=List[Profile],
+    dependencies=[Depends(admission("crud"))],
+    response_model=ProfilePage,
+    status_code=status.HTTP_200_OK,
+    summary="Obtener perfiles paginados",
+    description="Retorna una página de perfiles ordenados por ID, con los campos solicitados")
+async def get_profiles(
+    limit: Optional[int] = Query(None, ge=1, description="Número máximo de perfiles a retornar"),
+    after: Optional[str] = Query(None, description="Cursor `next_cursor` de la página anterior"),
+    fields: Optional[str] = Query(None, description="Campos a retornar separados por comas, p. ej. name,email,location")
+):
+    """
+    Obtiene una página de perfiles de CV.
+
+    Args:
+        limit (int, optional): Número máximo de perfiles a retornar
+        after (str, optional): Cursor de la página anterior
+        fields (str, optional): Campos a retornar separados por comas
+
+    Returns:
+        ProfilePage: Perfiles de la página y cursor de la siguiente
+
+    Raises:
+        HTTPException: Si el cursor o los campos no son válidos
+    """
+    limit, field_list = _page_params(limit, after, fields)
+    profiles, next_cursor = await get_repository().list_profiles(limit, after, field_list)
+    page = {"items": profiles, "next_cursor": next_cursor}
+    if fast_json_enabled("get_profiles"):
+        return FastJSONResponse(page)
+    return page
+
+@router.get("/profiles/search",
+    dependencies=[Depends(admission("crud"))],
+    response_model=ProfilePage,
     status_code=status.HTTP_200_OK,
-    summary="Obtener todos los perfiles",
-    description="Retorna una lista de todos los perfiles almacenados")
-async def get_profiles():
+    summary="Buscar perfiles",
+    description="Filtra perfiles por habilidades, idioma con nivel mínimo y ubicación, con paginación")
+async def search_profiles_route(
+    skill: Optional[List[str]] = Query(None, description="Habilidad requerida; se puede repetir"),
+    language: Optional[str] = Query(None, min_length=2, max_length=50, description="Idioma requerido"),
+    level: Optional[str] = Query(None, pattern="^[A-C][1-2]$", description="Nivel mínimo del idioma (A1-C2)"),
+    location: Optional[str] = Query(None, min_length=2, max_length=100, description="Prefijo de la ubicación"),
+    limit: Optional[int] = Query(None, ge=1, description="Número máximo de perfiles a retornar"),
+    after: Optional[str] = Query(None, description="Cursor `next_cursor` de la página anterior"),
+    fields: Optional[str] = Query(None, description="Campos a retornar separados por comas")
+):
     """
-    Obtiene todos los perfiles de CV.
+    Busca perfiles de CV, p. ej. `?skill=Python&language=Inglés&level=C1&location=Bogotá`.
+
+    Args:
+        skill (List[str], optional): Habilidades que el perfil debe tener todas
+        language (str, optional): Idioma requerido
+        level (str, optional): Nivel mínimo del idioma; requiere `language`
+        location (str, optional): Prefijo de la ubicación
+        limit (int, optional): Número máximo de perfiles a retornar
+        after (str, optional): Cursor de la página anterior
+        fields (str, optional): Campos a retornar separados por comas
 
     Returns:
-        List[Profile]: Lista de perfiles encontrados
+        ProfilePage: Perfiles de la página y cursor de la siguiente
+
+    Raises:
+        HTTPException: Si los parámetros no son válidos
     """
-    return await get_all_profiles()
+    if level and not language:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El nivel de idioma requiere indicar el idioma"
+        )
+    limit, field_list = _page_params(limit, after, fields)
+    profiles, next_cursor = await get_repository().search_profiles(
+        limit, after, field_list,
+        skills=skill,
+        language=language,
+        min_language_level=level,
+        location=location
+    )
+    page = {"items": profiles, "next_cursor": next_cursor}
+    if fast_json_enabled("search_profiles"):
+        return FastJSONResponse(page)
+    return page
+
+@router.get("/profiles/export",
+    dependencies=[Depends(admission("bulk"))],
+    response_class=StreamingResponse,
+    summary="Exportar todos los perfiles",
+    description="Exporta los perfiles en NDJSON o CSV leyendo directamente del cursor de la base de datos")
+async def export_profiles(
+    format: ExportFormat = Query(ExportFormat.ndjson, description="Formato de salida"),
+    batch_size: Optional[int] = Query(None, ge=1, le=10000, description="Documentos por lote del cursor"),
+    updated_since: Optional[datetime] = Query(None, description="Solo perfiles actualizados desde esta fecha"),
+    resume: Optional[str] = Query(None, description="`_id` del último perfil recibido, para reanudar la exportación")
+):
+    """
+    Exporta los perfiles como un flujo NDJSON o CSV.
+
+    Los perfiles se envían en orden de `_id`. Si la transferencia se
+    interrumpe, basta con repetir la petición con `resume` igual al `_id` del
+    último perfil recibido completo.
+
+    Args:
+        format (ExportFormat): Formato de salida (ndjson o csv)
+        batch_size (int, optional): Documentos por lote del cursor
+        updated_since (datetime, optional): Filtro sobre `updated_at`
+        resume (str, optional): Token de reanudación
+
+    Returns:
+        StreamingResponse: Flujo con los perfiles exportados
+
+    Raises:
+        HTTPException: Si el token de reanudación no es válido
+    """
+    if resume and not ObjectId.is_valid(resume):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Token de reanudación no válido"
+        )
+
+    profiles = get_repository().iter_profiles(
+        batch_size or get_settings().export_batch_size,
+        updated_since=updated_since,
+        after=resume
+    )
+    if format == ExportFormat.csv:
+        content, media_type = csv_chunks(profiles), "text/csv"
+    else:
+        content, media_type = ndjson_chunks(profiles), "application/x-ndjson"
+
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="profiles.{format.value}"'}
+    )
+
+@router.get("/cache/stats",
+    response_model=dict,
+    summary="Estadísticas de las cachés",
+    description="Retorna los contadores de la caché de perfiles y del almacén de PDFs")
+async def get_cache_stats():
+    """
+    Obtiene las estadísticas de las cachés del proceso.
+
+    El almacén de PDFs se reporta siempre: aunque `PDF_CACHE_ENABLED` esté
+    desactivado, los trabajos de PDF guardan en él sus resultados.
+
+    Returns:
+        dict: Contadores de la caché de perfiles y del almacén de PDFs; None
+            para las cachés deshabilitadas
+    """
+    suggestion_index = get_suggestion_index()
+    return {
+        "profile_cache": get_repository().profile_cache_stats(),
+        "pdf_store": await run_in_threadpool(get_pdf_store().stats),
+        "suggestion_index": suggestion_index.stats() if suggestion_index is not None else None
+    }
+
+@router.get("/suggest",
+    dependencies=[Depends(admission("crud"))],
+    response_model=dict,
+    summary="Autocompletar valores",
+    description="Sugiere habilidades, cargos, empresas o ubicaciones existentes que empiezan por un prefijo")
+async def suggest(
+    field: SuggestField = Query(..., description="Campo a autocompletar"),
+    prefix: str = Query(..., min_length=1, max_length=100, description="Texto escrito por el usuario"),
+    limit: Optional[int] = Query(None, ge=1, description="Número máximo de sugerencias")
+):
+    """
+    Sugiere valores ya presentes en los perfiles, ordenados por frecuencia.
+
+    Args:
+        field (SuggestField): Campo a autocompletar
+        prefix (str): Prefijo buscado
+        limit (int, optional): Número máximo de sugerencias
+
+    Returns:
+        dict: Campo, prefijo y lista de sugerencias con su frecuencia
+
+    Raises:
+        HTTPException: Si el autocompletado está deshabilitado
+    """
+    suggestion_index = get_suggestion_index()
+    if suggestion_index is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="El autocompletado está deshabilitado"
+        )
+    max_results = get_settings().suggest_max_results
+    suggestions = suggestion_index.suggest(field.value, prefix, min(limit or max_results, max_results))
+    return {"field": field.value, "prefix": prefix, "suggestions": suggestions}
 
 @router.get("/profiles/{profile_id}", 
+    dependencies=[Depends(admission("crud"))],
     response_model=Profile,
     summary="Obtener un perfil específico",
     description="Obtiene un perfil específico por su ID")
-async def get_profile(profile_id: str):
+async def get_profile(profile_id: str, request: Request, response: Response):
     """
     Obtiene un perfil específico por su ID.
 
+    Responde `304 Not Modified` si el cliente envía en `If-None-Match` el
+    ETag de la versión actual.
+
     Args:
         profile_id (str): ID del perfil a buscar
+        request (Request): Objeto de solicitud FastAPI
+        response (Response): Respuesta donde se agregan las cabeceras de caché
 
     Returns:
         Profile: Datos del perfil encontrado
@@ -102,15 +524,23 @@ async def get_profile(profile_id: str):
     Raises:
         HTTPException: Si el perfil no existe
     """
-    profile = await get_profile_by_id(profile_id)
+    profile = await get_repository().get_profile(profile_id)
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Perfil no encontrado"
         )
+
+    etag = make_etag(profile, "json")
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    if fast_json_enabled("get_profile"):
+        return FastJSONResponse(profile_document(profile), headers=cache_headers(etag))
+    response.headers.update(cache_headers(etag))
     return profile
 
 @router.put("/profiles/{profile_id}",
+    dependencies=[Depends(admission("crud"))],
     response_model=dict,
     summary="Actualizar un perfil",
     description="Actualiza un perfil existente por su ID")
@@ -126,7 +556,8 @@ async def update_profile(profile_id: str, profile_update: ProfileUpdate):
         dict: Mensaje de éxito
 
     Raises:
-        HTTPException: Si el perfil no existe o hay un error
+        HTTPException: Si el perfil no existe, si el nuevo email ya es de otro
+            perfil (409) o hay un error
     """
     profile_data = profile_update.dict(exclude_unset=True)
     if not profile_data:
@@ -134,17 +565,31 @@ async def update_profile(profile_id: str, profile_update: ProfileUpdate):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No hay datos para actualizar"
         )
-    
-    success = await update_profile_db(profile_id, profile_data)
+
+    # El perfil anterior se necesita para actualizar el índice de sugerencias
+    repository = get_repository()
+    suggestion_index = get_suggestion_index()
+    previous = await repository.get_profile(profile_id) if suggestion_index is not None else None
+
+    try:
+        success = await repository.update_profile(profile_id, profile_data)
+    except DuplicateProfileError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Ya existe un perfil con ese email"
+        )
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Perfil no encontrado"
         )
+    if previous is not None:
+        suggestion_index.replace_profile(previous, {**previous, **profile_data})
     
     return {"message": "Perfil actualizado exitosamente"}
 
 @router.delete("/profiles/{profile_id}",
+    dependencies=[Depends(admission("crud"))],
     response_model=dict,
     summary="Eliminar un perfil",
     description="Elimina un perfil existente por su ID")
@@ -161,15 +606,141 @@ async def delete_profile(profile_id: str):
     Raises:
         HTTPException: Si el perfil no existe
     """
-    success = await delete_profile_db(profile_id)
+    repository = get_repository()
+    suggestion_index = get_suggestion_index()
+    previous = await repository.get_profile(profile_id) if suggestion_index is not None else None
+
+    success = await repository.delete_profile(profile_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Perfil no encontrado"
         )
+    if previous is not None:
+        suggestion_index.remove_profile(previous)
     return {"message": "Perfil eliminado exitosamente"}
 
+@router.post("/profiles/{profile_id}/{section}",
+    dependencies=[Depends(admission("crud"))],
+    response_model=dict,
+    status_code=status.HTTP_201_CREATED,
+    summary="Agregar un elemento a una sección",
+    description="Agrega una experiencia, estudio, habilidad o idioma al final de la lista del perfil")
+async def add_section_item(profile_id: str, section: ProfileSection, item: Dict[str, Any] = Body(...)):
+    """
+    Agrega un elemento a una sección del perfil sin reenviar la lista completa.
+
+    Args:
+        profile_id (str): ID del perfil
+        section (ProfileSection): Sección a la que se agrega el elemento
+        item (Dict[str, Any]): Elemento, validado con el modelo de la sección
+
+    Returns:
+        dict: Mensaje de éxito
+
+    Raises:
+        HTTPException: Si el elemento no es válido o el perfil no existe
+    """
+    item_data = _section_item(section, item)
+    success = await get_repository().push_item(profile_id, section.value, item_data)
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Perfil no encontrado"
+        )
+    suggestion_index = get_suggestion_index()
+    if suggestion_index is not None:
+        suggestion_index.add_profile({section.value: [item_data]})
+    return {"message": "Elemento agregado exitosamente"}
+
+@router.put("/profiles/{profile_id}/{section}/{index}",
+    dependencies=[Depends(admission("crud"))],
+    response_model=dict,
+    summary="Reemplazar un elemento de una sección",
+    description="Reemplaza el elemento de la lista del perfil en la posición indicada")
+async def replace_section_item(request: Request, profile_id: str, section: ProfileSection,
+                               index: int = Path(..., ge=0, description="Posición del elemento en la lista"),
+                               item: Dict[str, Any] = Body(...)):
+    """
+    Reemplaza un elemento de una sección del perfil.
+
+    Requiere `If-Match` con el ETag actual del perfil.
+
+    Args:
+        request (Request): Objeto de solicitud FastAPI
+        profile_id (str): ID del perfil
+        section (ProfileSection): Sección del elemento
+        index (int): Posición del elemento en la lista
+        item (Dict[str, Any]): Nuevo elemento, validado con el modelo de la sección
+
+    Returns:
+        dict: Mensaje de éxito
+
+    Raises:
+        HTTPException: Si el elemento no es válido, si el perfil o la posición
+            no existen, si falta `If-Match` (428) o si el perfil cambió (412)
+    """
+    item_data = _section_item(section, item)
+    profile = await _profile_for_item_edit(request, profile_id, section, index)
+
+    success = await get_repository().replace_item(
+        profile_id, section.value, index, item_data, expected_items=profile[section.value]
+    )
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="El perfil cambió; obtenga la versión actual y reintente"
+        )
+    suggestion_index = get_suggestion_index()
+    previous_item = _single_item_profile(profile, section, index) if suggestion_index is not None else None
+    if previous_item is not None:
+        suggestion_index.replace_profile(previous_item, {section.value: [item_data]})
+    return {"message": "Elemento actualizado exitosamente"}
+
+@router.delete("/profiles/{profile_id}/{section}/{index}",
+    dependencies=[Depends(admission("crud"))],
+    response_model=dict,
+    summary="Eliminar un elemento de una sección",
+    description="Elimina el elemento de la lista del perfil en la posición indicada")
+async def remove_section_item(request: Request, profile_id: str, section: ProfileSection,
+                              index: int = Path(..., ge=0, description="Posición del elemento en la lista")):
+    """
+    Elimina un elemento de una sección del perfil.
+
+    Los elementos posteriores se desplazan una posición hacia atrás. Requiere
+    `If-Match` con el ETag actual del perfil.
+
+    Args:
+        request (Request): Objeto de solicitud FastAPI
+        profile_id (str): ID del perfil
+        section (ProfileSection): Sección del elemento
+        index (int): Posición del elemento en la lista
+
+    Returns:
+        dict: Mensaje de éxito
+
+    Raises:
+        HTTPException: Si el perfil o la posición no existen, si falta
+            `If-Match` (428) o si el perfil cambió (412)
+    """
+    profile = await _profile_for_item_edit(request, profile_id, section, index)
+
+    success = await get_repository().remove_item(
+        profile_id, section.value, index, expected_items=profile[section.value]
+    )
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="El perfil cambió; obtenga la versión actual y reintente"
+        )
+    suggestion_index = get_suggestion_index()
+    previous_item = _single_item_profile(profile, section, index) if suggestion_index is not None else None
+    if previous_item is not None:
+        suggestion_index.remove_profile(previous_item)
+    return {"message": "Elemento eliminado exitosamente"}
+
 @router.get("/profiles/{profile_id}/view", 
+    dependencies=[Depends(admission("render"))],
     response_class=HTMLResponse,
     summary="Ver CV en formato HTML",
     description="Genera una vista HTML del CV")
@@ -187,122 +758,63 @@ async def view_cv(request: Request, profile_id: str):
     Raises:
         HTTPException: Si el perfil no existe
     """
-    profile = await get_profile_by_id(profile_id)
+    profile = await get_repository().get_profile(profile_id)
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Perfil no encontrado"
         )
+
+    etag = make_etag(profile, "html")
+    if etag_matches(request, etag):
+        return not_modified(etag)
     
-    # Formatear experiencias
-    experiences_html = ""
-    for exp in profile["experiences"]:
-        experiences_html += f"""
-        <div class="mb-4">
-            <h4>{exp["position"]} - {exp["company"]}</h4>
-            <p class="text-muted">{exp["start_date"]} - {exp["end_date"]}</p>
-            <p>{exp["description"]}</p>
-        </div>
-        """
-    
-    # Formatear educación
-    education_html = ""
-    for edu in profile["education"]:
-        education_html += f"""
-        <div class="mb-4">
-            <h4>{edu["degree"]} en {edu["field"]}</h4>
-            <h5>{edu["institution"]}</h5>
-            <p class="text-muted">{edu["start_date"]} - {edu["end_date"]}</p>
-        </div>
-        """
-    
-    # Formatear habilidades y lenguajes
-    skills_html = ", ".join([f"{skill['name']} ({skill['level']})" for skill in profile["skills"]])
-    languages_html = ", ".join([f"{lang['name']} ({lang['level']})" for lang in profile["languages"]])
-    
-    return templates.TemplateResponse(
-        "cv_template.html",
-        {
-            "request": request,
-            "name": profile["name"],
-            "email": profile["email"],
-            "phone": profile["phone"],
-            "location": profile["location"],
-            "summary": profile["summary"],
-            "experiences": experiences_html,
-            "education": education_html,
-            "skills": skills_html,
-            "languages": languages_html
-        }
-    )
+    html_response = HTMLResponse(render_html(profile))
+    html_response.headers.update(cache_headers(etag))
+    return html_response
 
 @router.get("/profiles/{profile_id}/download",
-    response_class=FileResponse,
+    dependencies=[Depends(admission("render"))],
+    response_class=Response,
     summary="Descargar CV en PDF",
     description="Genera y descarga el CV en formato PDF")
-async def generate_cv(profile_id: str):
+async def generate_cv(profile_id: str, request: Request):
     """
     Genera y descarga el CV en formato PDF.
 
+    Si el cliente ya tiene la versión actual (`If-None-Match`), responde
+    `304 Not Modified` sin generar el PDF.
+
     Args:
         profile_id (str): ID del perfil a descargar
+        request (Request): Objeto de solicitud FastAPI
 
     Returns:
-        FileResponse: Archivo PDF del CV
+        Response: Archivo PDF del CV
 
     Raises:
         HTTPException: Si el perfil no existe o hay un error
     """
-    profile = await get_profile_by_id(profile_id)
+    profile = await get_repository().get_profile(profile_id)
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Perfil no encontrado"
         )
     
+    etag = make_etag(profile, "pdf")
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     try:
-        # Crear PDF
-        pdf = FPDF()
-        pdf.add_page()
-        
-        # Configurar fuentes
-        pdf.set_font("Arial", "B", 16)
-        
-        # Encabezado
-        pdf.cell(0, 10, profile["name"], ln=True, align="C")
-        pdf.set_font("Arial", "", 12)
-        pdf.cell(0, 10, f"Email: {profile['email']}", ln=True)
-        pdf.cell(0, 10, f"Teléfono: {profile['phone']}", ln=True)
-        pdf.cell(0, 10, f"Ubicación: {profile['location']}", ln=True)
-        
-        # Resumen
-        pdf.ln(10)
-        pdf.set_font("Arial", "B", 14)
-        pdf.cell(0, 10, "Resumen Profesional", ln=True)
-        pdf.set_font("Arial", "", 12)
-        pdf.multi_cell(0, 10, profile["summary"])
-        
-        # Experiencia
-        pdf.ln(10)
-        pdf.set_font("Arial", "B", 14)
-        pdf.cell(0, 10, "Experiencia Laboral", ln=True)
-        for exp in profile["experiences"]:
-            pdf.set_font("Arial", "B", 12)
-            pdf.cell(0, 10, f"{exp['position']} - {exp['company']}", ln=True)
-            pdf.set_font("Arial", "", 12)
-            pdf.cell(0, 10, f"{exp['start_date']} - {exp['end_date']}", ln=True)
-            pdf.multi_cell(0, 10, exp["description"])
-            pdf.ln(5)
-        
-        # Guardar PDF
-        pdf_path = os.path.join(BASE_DIR, "temp", f"cv_{profile_id}.pdf")
-        os.makedirs(os.path.dirname(pdf_path), exist_ok=True)
-        pdf.output(pdf_path)
-        
-        return FileResponse(
-            pdf_path,
+        pdf_bytes = await get_cv_pdf(profile)
+        return Response(
+            content=pdf_bytes,
             media_type="application/pdf",
-            filename=f"cv_{profile['name'].replace(' ', '_')}.pdf"
+            headers={
+                "Content-Disposition": content_disposition(cv_filename(profile)),
+                **cache_headers(etag)
+            }
         )
     except Exception as e:
         logger.error(f"Error al generar PDF: {str(e)}")
@@ -310,7 +822,3 @@ async def generate_cv(profile_id: str):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error al generar el PDF"
         )
-
-# Incluir las rutas en la aplicación principal
-from app import app
-app.include_router(router)
@@ -0,0 +1,109 @@
+"""
+Punto de entrada de producción de CV Generator API.
+
+Ejecuta la aplicación con uvicorn en varios procesos (`SERVER_WORKERS`), con
+uvloop y httptools cuando están instalados, y con los parámetros de
+conexiones de `config.py`. Al recibir SIGTERM o SIGINT cada proceso deja de
+aceptar conexiones, espera hasta `SERVER_GRACEFUL_TIMEOUT` segundos a que
+terminen las peticiones en curso y, en el apagado de la aplicación, a que
+terminen los PDFs en generación. Con varios procesos, las métricas se combinan
+en un directorio compartido (`METRICS_MULTIPROCESS_DIR`, temporal si no se
+indica), los trabajos de PDF se guardan en MongoDB (con el almacén en memoria
+cada worker solo conocería sus propios trabajos) y cada worker reconstruye su
+índice de autocompletado periódicamente para ver los perfiles escritos por los
+demás.
+
+Uso:
+    python server.py [--workers 4] [--port 8000]
+"""
+
+import argparse
+import importlib.util
+import os
+import tempfile
+
+import uvicorn
+
+from config import get_settings
+
+
+def _resolve(option: str, module: str, fallback: str) -> str:
+    """
+    Resuelve la opción "auto" a la implementación instalada.
+
+    Args:
+        option (str): Valor configurado
+        module (str): Módulo de la implementación rápida (uvloop o httptools)
+        fallback (str): Implementación de la biblioteca estándar
+
+    Returns:
+        str: Implementación a usar
+    """
+    if option != "auto":
+        return option
+    return module if importlib.util.find_spec(module) is not None else fallback
+
+
+def main():
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Servidor de producción de CV Generator API")
+    parser.add_argument("--host", default=settings.server_host)
+    parser.add_argument("--port", type=int, default=settings.server_port)
+    parser.add_argument("--workers", type=int, default=settings.server_workers,
+                        help="Procesos (0 = número de CPUs)")
+    args = parser.parse_args()
+
+    workers = args.workers or os.cpu_count() or 1
+    loop = _resolve(settings.server_loop, "uvloop", "asyncio")
+    http = _resolve(settings.server_http, "httptools", "h11")
+    # El logging lo configura cada worker (`setup_logging`); configurarlo aquí
+    # dejaría handlers en el logger raíz y la aplicación no usaría los suyos
+    print(f"Iniciando {workers} workers en {args.host}:{args.port} (loop {loop}, http {http})", flush=True)
+
+    if workers > 1 and settings.pdf_jobs_store == "memory":
+        # La consulta de un trabajo puede llegar a un worker distinto del que lo creó
+        if settings.database_backend != "mongo":
+            raise SystemExit(
+                "PDF_JOBS_STORE=memory no admite varios workers y PDF_JOBS_STORE=mongo "
+                "requiere DATABASE_BACKEND=mongo: use --workers 1 o MongoDB"
+            )
+        os.environ["PDF_JOBS_STORE"] = "mongo"
+        print("Trabajos de PDF compartidos entre workers en MongoDB (PDF_JOBS_STORE=mongo)", flush=True)
+
+    if workers > 1 and settings.suggest_enabled:
+        # Cada worker solo actualiza su índice con las escrituras que atiende
+        interval = float(os.environ.setdefault("SUGGEST_REFRESH_INTERVAL", "60"))
+        if interval > 0:
+            print(f"Índice de autocompletado reconstruido cada {interval:g} s en cada worker", flush=True)
+        else:
+            print("Aviso: con SUGGEST_REFRESH_INTERVAL=0 el autocompletado de cada worker "
+                  "no verá los perfiles escritos por los demás", flush=True)
+
+    if workers > 1 and settings.metrics_enabled:
+        from utils.metrics import clear_snapshots
+        # Los workers heredan el entorno y leen de él su configuración
+        metrics_dir = settings.metrics_multiprocess_dir or tempfile.mkdtemp(prefix="cv-metrics-")
+        os.environ["METRICS_MULTIPROCESS_DIR"] = metrics_dir
+        clear_snapshots(metrics_dir)
+        print(f"Métricas combinadas de los workers en {metrics_dir}", flush=True)
+
+    uvicorn.run(
+        "app:create_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        backlog=settings.server_backlog,
+        timeout_keep_alive=settings.server_keep_alive,
+        timeout_graceful_shutdown=settings.server_graceful_timeout,
+        # El registro de accesos JSON de la aplicación reemplaza al de uvicorn
+        access_log=not settings.access_log_enabled,
+        proxy_headers=True,
+        server_header=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
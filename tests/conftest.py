@@ -0,0 +1,62 @@
+"""
+Fixtures de las pruebas.
+
+`repository` entrega cada implementación de `ProfileRepository` lista para
+usar: MongoDB sobre mongomock-motor (sin servidor) y SQLite en memoria. Las
+pruebas que la usan se ejecutan una vez por backend.
+"""
+
+import pytest
+
+from config import Settings, set_settings
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def settings(monkeypatch):
+    """
+    Configuración por defecto, sin leer el archivo .env.
+    """
+    monkeypatch.setenv("WRITE_COALESCING_ENABLED", "false")
+    return set_settings(Settings())
+
+
+async def _mongo_repository():
+    from mongomock_motor import AsyncMongoMockClient
+
+    from db import database
+    from db.repository import MongoProfileRepository
+
+    client = AsyncMongoMockClient()
+    database.client = client
+    database.db = client.cv_database
+    database.profiles_collection = database.db.profiles
+    database._profile_cache = None
+    database._write_coalescer = None
+    repository = MongoProfileRepository()
+    await repository.ensure_indexes()
+    return repository
+
+
+async def _sqlite_repository():
+    from db.sqlite import SqliteProfileRepository
+
+    repository = SqliteProfileRepository(":memory:")
+    await repository.connect()
+    await repository.ensure_indexes()
+    return repository
+
+
+@pytest.fixture(params=["mongo", "sqlite"])
+async def repository(request, anyio_backend, settings):
+    if request.param == "mongo":
+        repository = await _mongo_repository()
+    else:
+        repository = await _sqlite_repository()
+    yield repository
+    if request.param == "sqlite":
+        await repository.close()
@@ -0,0 +1,281 @@
+"""
+Pruebas de contrato de `ProfileRepository`.
+
+Cada prueba se ejecuta contra MongoDB (mongomock-motor) y SQLite en memoria:
+ambos backends deben comportarse igual ante las operaciones que usan las rutas.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from db.repository import DuplicateProfileError
+
+pytestmark = pytest.mark.anyio
+
+MISSING_ID = "0" * 24
+
+
+def make_profile(number: int, **overrides) -> dict:
+    """
+    Construye un perfil válido con un email único.
+    """
+    now = datetime.now()
+    profile = {
+        "name": f"Perfil {number}",
+        "email": f"perfil{number}@example.com",
+        "phone": "+573001234567",
+        "location": "Bogotá, Colombia",
+        "summary": "Desarrollador con experiencia en Python y FastAPI.",
+        "experiences": [],
+        "education": [],
+        "skills": [{"name": "Python", "level": "Avanzado"}],
+        "languages": [{"name": "Inglés", "level": "B2"}],
+        "created_at": now,
+        "updated_at": now,
+    }
+    profile.update(overrides)
+    return profile
+
+
+async def create_many(repository, count: int, **overrides) -> list:
+    return [await repository.create_profile(make_profile(number, **overrides)) for number in range(count)]
+
+
+async def collect(iterator) -> list:
+    return [profile async for profile in iterator]
+
+
+async def test_create_and_get(repository):
+    profile_id = await repository.create_profile(make_profile(1))
+
+    profile = await repository.get_profile(profile_id)
+    assert profile["_id"] == profile_id
+    assert profile["name"] == "Perfil 1"
+    assert profile["skills"] == [{"name": "Python", "level": "Avanzado"}]
+    assert isinstance(profile["updated_at"], datetime)
+
+
+async def test_get_missing_profile(repository):
+    assert await repository.get_profile(MISSING_ID) is None
+
+
+async def test_create_duplicate_email(repository):
+    await repository.create_profile(make_profile(1))
+
+    with pytest.raises(DuplicateProfileError):
+        await repository.create_profile(make_profile(1, name="Otro"))
+
+
+async def test_create_profiles_reports_each_result(repository):
+    results = await repository.create_profiles(
+        [make_profile(1), make_profile(2), make_profile(1, name="Repetido")], chunk_size=2
+    )
+
+    assert [("id" in result, "error" in result) for result in results] == [(True, False), (True, False), (False, True)]
+    assert (await repository.get_profile(results[1]["id"]))["name"] == "Perfil 2"
+
+
+async def test_update_profile(repository):
+    old = datetime.now() - timedelta(days=1)
+    profile_id = await repository.create_profile(make_profile(1, created_at=old, updated_at=old))
+    before = await repository.get_profile(profile_id)
+
+    assert await repository.update_profile(profile_id, {"location": "Lima, Perú"})
+
+    profile = await repository.get_profile(profile_id)
+    assert profile["location"] == "Lima, Perú"
+    assert profile["name"] == "Perfil 1"
+    assert profile["updated_at"] > before["updated_at"]
+
+
+async def test_update_missing_profile(repository):
+    assert not await repository.update_profile(MISSING_ID, {"location": "Lima, Perú"})
+
+
+async def test_update_duplicate_email(repository):
+    await repository.create_profile(make_profile(1))
+    profile_id = await repository.create_profile(make_profile(2))
+
+    with pytest.raises(DuplicateProfileError):
+        await repository.update_profile(profile_id, {"email": "perfil1@example.com"})
+    assert (await repository.get_profile(profile_id))["email"] == "perfil2@example.com"
+
+
+async def test_delete_profile(repository):
+    profile_id = await repository.create_profile(make_profile(1))
+
+    assert await repository.delete_profile(profile_id)
+    assert await repository.get_profile(profile_id) is None
+    assert not await repository.delete_profile(profile_id)
+
+
+async def test_list_profiles_keyset_pagination(repository):
+    ids = await create_many(repository, 5)
+
+    seen, after = [], None
+    while True:
+        page, after = await repository.list_profiles(2, after)
+        seen.extend(profile["_id"] for profile in page)
+        if after is None:
+            break
+        assert len(page) == 2
+
+    assert seen == ids
+
+
+async def test_list_profiles_exact_page(repository):
+    ids = await create_many(repository, 2)
+
+    page, after = await repository.list_profiles(2)
+    assert [profile["_id"] for profile in page] == ids
+    assert after is None
+
+
+async def test_list_profiles_fields(repository):
+    await create_many(repository, 1)
+
+    page, _ = await repository.list_profiles(10, fields=["name", "email"])
+    assert set(page[0]) == {"_id", "name", "email"}
+
+
+async def test_search_by_skills(repository):
+    rust = await repository.create_profile(make_profile(1, skills=[
+        {"name": "Python", "level": "Avanzado"}, {"name": "Rust", "level": "Básico"}
+    ]))
+    await repository.create_profile(make_profile(2))
+
+    page, _ = await repository.search_profiles(10, skills=["Python", "Rust"])
+    assert [profile["_id"] for profile in page] == [rust]
+
+
+async def test_search_by_language_level(repository):
+    await repository.create_profile(make_profile(1, languages=[{"name": "Inglés", "level": "A2"}]))
+    fluent = await repository.create_profile(make_profile(2, languages=[{"name": "Inglés", "level": "C1"}]))
+    await repository.create_profile(make_profile(3, languages=[{"name": "Francés", "level": "C2"}]))
+
+    page, _ = await repository.search_profiles(10, language="Inglés", min_language_level="B2")
+    assert [profile["_id"] for profile in page] == [fluent]
+
+    page, _ = await repository.search_profiles(10, language="Inglés")
+    assert len(page) == 2
+
+
+async def test_search_by_location_prefix(repository):
+    bogota = await repository.create_profile(make_profile(1, location="Bogotá, Colombia"))
+    await repository.create_profile(make_profile(2, location="Medellín, Colombia"))
+
+    page, _ = await repository.search_profiles(10, location="Bogotá")
+    assert [profile["_id"] for profile in page] == [bogota]
+
+
+async def test_search_pagination(repository):
+    ids = await create_many(repository, 3)
+
+    first, after = await repository.search_profiles(2, skills=["Python"])
+    second, last = await repository.search_profiles(2, after=after, skills=["Python"])
+    assert [profile["_id"] for profile in first + second] == ids
+    assert last is None
+
+
+async def test_iter_profiles_in_id_order(repository):
+    ids = await create_many(repository, 5)
+
+    profiles = await collect(repository.iter_profiles(2))
+    assert [profile["_id"] for profile in profiles] == ids
+
+
+async def test_iter_profiles_after(repository):
+    ids = await create_many(repository, 5)
+
+    profiles = await collect(repository.iter_profiles(2, after=ids[1]))
+    assert [profile["_id"] for profile in profiles] == ids[2:]
+
+
+async def test_iter_profiles_updated_since(repository):
+    old = datetime.now() - timedelta(days=10)
+    await repository.create_profile(make_profile(1, created_at=old, updated_at=old))
+    recent = await repository.create_profile(make_profile(2))
+
+    profiles = await collect(repository.iter_profiles(10, updated_since=datetime.now() - timedelta(days=1)))
+    assert [profile["_id"] for profile in profiles] == [recent]
+
+
+async def test_iter_profiles_updated_since_and_after(repository):
+    old = datetime.now() - timedelta(days=10)
+    ids = await create_many(repository, 4)
+    await repository.create_profile(make_profile(9, created_at=old, updated_at=old))
+
+    profiles = await collect(repository.iter_profiles(
+        10, updated_since=datetime.now() - timedelta(days=1), after=ids[0]
+    ))
+    assert [profile["_id"] for profile in profiles] == ids[1:]
+
+
+async def test_iter_profiles_ids_location_and_limit(repository):
+    ids = await create_many(repository, 4)
+    lima = await repository.create_profile(make_profile(9, location="Lima, Perú"))
+
+    profiles = await collect(repository.iter_profiles(10, ids=[ids[3], ids[1], MISSING_ID]))
+    assert [profile["_id"] for profile in profiles] == [ids[1], ids[3]]
+
+    profiles = await collect(repository.iter_profiles(10, location="Lima, Perú"))
+    assert [profile["_id"] for profile in profiles] == [lima]
+
+    profiles = await collect(repository.iter_profiles(2, limit=3, fields=["name"]))
+    assert [profile["_id"] for profile in profiles] == ids[:3]
+    assert set(profiles[0]) == {"_id", "name"}
+
+
+async def test_push_item(repository):
+    profile_id = await repository.create_profile(make_profile(1))
+
+    assert await repository.push_item(profile_id, "skills", {"name": "Rust", "level": "Básico"})
+
+    profile = await repository.get_profile(profile_id)
+    assert [skill["name"] for skill in profile["skills"]] == ["Python", "Rust"]
+    assert not await repository.push_item(MISSING_ID, "skills", {"name": "Rust", "level": "Básico"})
+
+
+async def test_replace_item(repository):
+    profile_id = await repository.create_profile(make_profile(1, skills=[
+        {"name": "Python", "level": "Avanzado"}, {"name": "Go", "level": "Básico"}
+    ]))
+
+    assert await repository.replace_item(profile_id, "skills", 1, {"name": "Rust", "level": "Medio"})
+
+    profile = await repository.get_profile(profile_id)
+    assert profile["skills"] == [{"name": "Python", "level": "Avanzado"}, {"name": "Rust", "level": "Medio"}]
+    assert not await repository.replace_item(profile_id, "skills", 2, {"name": "C", "level": "Medio"})
+    assert not await repository.replace_item(MISSING_ID, "skills", 0, {"name": "C", "level": "Medio"})
+
+
+async def test_remove_item(repository):
+    profile_id = await repository.create_profile(make_profile(1, skills=[
+        {"name": "Python", "level": "Avanzado"}, {"name": "Go", "level": "Básico"}, {"name": "Rust", "level": "Medio"}
+    ]))
+
+    assert await repository.remove_item(profile_id, "skills", 1)
+
+    profile = await repository.get_profile(profile_id)
+    assert [skill["name"] for skill in profile["skills"]] == ["Python", "Rust"]
+    assert not await repository.remove_item(profile_id, "skills", 2)
+    assert not await repository.remove_item(MISSING_ID, "skills", 0)
+
+
+async def test_item_edits_with_expected_items(repository):
+    skills = [{"name": "Python", "level": "Avanzado"}, {"name": "Go", "level": "Básico"}]
+    profile_id = await repository.create_profile(make_profile(1, skills=skills))
+    seen = (await repository.get_profile(profile_id))["skills"]
+
+    assert await repository.replace_item(profile_id, "skills", 0, {"name": "Rust", "level": "Medio"},
+                                         expected_items=seen)
+    # La sección ya no es la que se vio: ninguna edición posterior se aplica
+    assert not await repository.replace_item(profile_id, "skills", 1, {"name": "C", "level": "Medio"},
+                                             expected_items=seen)
+    assert not await repository.remove_item(profile_id, "skills", 0, expected_items=seen)
+
+    current = (await repository.get_profile(profile_id))["skills"]
+    assert [skill["name"] for skill in current] == ["Rust", "Go"]
+    assert await repository.remove_item(profile_id, "skills", 0, expected_items=current)
+    assert [skill["name"] for skill in (await repository.get_profile(profile_id))["skills"]] == ["Go"]
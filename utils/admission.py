@@ -0,0 +1,148 @@
+"""
+Control de admisión de las rutas costosas.
+
+Cada clase de ruta (`render`: vista HTML y PDFs; `bulk`: creación masiva,
+exportación y ZIP; `crud`: el resto de operaciones sobre perfiles) tiene un
+límite de peticiones en curso por proceso, compartido por todas sus rutas.
+Cuando el límite está ocupado, las peticiones esperan en una cola acotada
+hasta `ADMISSION_<CLASE>_QUEUE_TIMEOUT` segundos; si la cola está llena o la
+espera vence, se responde `503` con `Retry-After`. Así, un pico de descargas
+de PDF se degrada por sí solo sin subir la latencia de las demás rutas.
+"""
+
+import asyncio
+import math
+import time
+from typing import Dict, Optional
+
+from fastapi import HTTPException, status
+
+from config import get_settings
+from utils.metrics import ADMISSION_IN_FLIGHT, ADMISSION_QUEUE_DEPTH, ADMISSION_REJECTIONS, ADMISSION_WAIT_SECONDS
+
+ROUTE_CLASSES = ("render", "bulk", "crud")
+
+
+class AdmissionLimiter:
+    """
+    Límite de concurrencia con cola de espera acotada.
+
+    Attributes:
+        route_class (str): Clase de ruta, usada en las métricas
+        max_concurrent (int): Peticiones en curso como máximo
+        max_queue (int): Peticiones esperando turno como máximo
+        queue_timeout (float): Segundos máximos de espera en la cola
+    """
+
+    def __init__(self, route_class: str, max_concurrent: int, max_queue: int, queue_timeout: float):
+        self.route_class = route_class
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    def _reject(self, reason: str):
+        """
+        Cuenta el rechazo y lanza la respuesta 503.
+
+        Raises:
+            HTTPException: Siempre, con `Retry-After`
+        """
+        ADMISSION_REJECTIONS.inc(route_class=self.route_class, reason=reason)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="El servidor está ocupado, intente de nuevo más tarde",
+            headers={"Retry-After": str(max(1, math.ceil(self.queue_timeout)))}
+        )
+
+    async def acquire(self):
+        """
+        Espera un turno libre.
+
+        Raises:
+            HTTPException: 503 si la cola está llena o la espera vence
+        """
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                self._reject("queue_full")
+            self.waiting += 1
+            ADMISSION_QUEUE_DEPTH.inc(route_class=self.route_class)
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self._reject("timeout")
+            finally:
+                self.waiting -= 1
+                ADMISSION_QUEUE_DEPTH.dec(route_class=self.route_class)
+            ADMISSION_WAIT_SECONDS.observe(time.perf_counter() - start, route_class=self.route_class)
+        else:
+            await self._semaphore.acquire()
+            ADMISSION_WAIT_SECONDS.observe(0.0, route_class=self.route_class)
+        ADMISSION_IN_FLIGHT.inc(route_class=self.route_class)
+
+    def release(self):
+        """
+        Libera el turno de una petición terminada.
+        """
+        ADMISSION_IN_FLIGHT.dec(route_class=self.route_class)
+        self._semaphore.release()
+
+
+_limiters: Dict[str, Optional[AdmissionLimiter]] = {}
+
+
+def get_limiter(route_class: str) -> Optional[AdmissionLimiter]:
+    """
+    Obtiene el límite de una clase de ruta con la configuración activa.
+
+    Args:
+        route_class (str): "render", "bulk" o "crud"
+
+    Returns:
+        AdmissionLimiter: Límite de la clase o None si no tiene límite
+    """
+    if route_class not in _limiters:
+        settings = get_settings()
+        max_concurrent = getattr(settings, f"admission_{route_class}_max_concurrent")
+        if not settings.admission_enabled or max_concurrent <= 0:
+            _limiters[route_class] = None
+        else:
+            _limiters[route_class] = AdmissionLimiter(
+                route_class,
+                max_concurrent,
+                getattr(settings, f"admission_{route_class}_max_queue"),
+                getattr(settings, f"admission_{route_class}_queue_timeout")
+            )
+    return _limiters[route_class]
+
+
+def admission(route_class: str):
+    """
+    Crea la dependencia que aplica el control de admisión de una clase de ruta.
+
+    El turno se libera cuando termina la respuesta, incluidas las respuestas
+    en streaming.
+
+    Args:
+        route_class (str): "render", "bulk" o "crud"
+
+    Returns:
+        Callable: Dependencia para `dependencies=[Depends(...)]`
+    """
+    if route_class not in ROUTE_CLASSES:
+        raise ValueError(f"Clase de ruta no soportada: {route_class}")
+
+    async def dependency():
+        limiter = get_limiter(route_class)
+        if limiter is None:
+            yield
+            return
+        await limiter.acquire()
+        try:
+            yield
+        finally:
+            limiter.release()
+
+    return dependency
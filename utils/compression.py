@@ -0,0 +1,195 @@
+"""
+Compresión de las respuestas HTTP.
+
+`CompressionMiddleware` comprime con brotli (si el paquete `brotli` está
+instalado) o gzip, según `Accept-Encoding`, las respuestas cuyo tipo de
+contenido está en `COMPRESSION_CONTENT_TYPES`. Las respuestas completas
+menores que `COMPRESSION_MIN_SIZE` se envían sin comprimir; las respuestas en
+streaming (exportaciones NDJSON/CSV) se comprimen fragmento a fragmento, sin
+acumularlas en memoria. Las respuestas que ya tienen `Content-Encoding` (los
+archivos precomprimidos de `/static/dist`) y los tipos que ya vienen
+comprimidos, como PDF o ZIP, se dejan intactos.
+"""
+
+import zlib
+from typing import Optional, Set
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from config import get_settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli es opcional
+    brotli = None
+
+
+def accepted_encodings(header: str) -> Set[str]:
+    """
+    Obtiene las codificaciones aceptadas en una cabecera Accept-Encoding.
+
+    Args:
+        header (str): Valor de la cabecera
+
+    Returns:
+        Set[str]: Codificaciones en minúsculas, sin las que tienen `q=0`
+    """
+    accepted = set()
+    for item in header.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        if name:
+            accepted.add(name)
+    return accepted
+
+
+class _GzipCompressor:
+    def __init__(self, level: int):
+        # wbits=31 produce el formato gzip (cabecera y CRC) en lugar de zlib
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        output = self._compressor.compress(data)
+        if flush:
+            output += self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return output
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        output = self._compressor.process(data)
+        if flush:
+            output += self._compressor.flush()
+        return output
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI que comprime las respuestas con brotli o gzip.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        settings = get_settings()
+        self.min_size = settings.compression_min_size
+        self.gzip_level = settings.compression_gzip_level
+        self.brotli_quality = settings.compression_brotli_quality
+        self.content_types = settings.compression_content_types
+
+    def _select_encoding(self, scope) -> Optional[str]:
+        """
+        Elige la codificación preferida entre las que acepta el cliente.
+        """
+        accepted = accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        if brotli is not None and ("br" in accepted or "*" in accepted):
+            return "br"
+        if "gzip" in accepted or "*" in accepted:
+            return "gzip"
+        return None
+
+    def _compressor(self, encoding: str):
+        if encoding == "br":
+            return _BrotliCompressor(self.brotli_quality)
+        return _GzipCompressor(self.gzip_level)
+
+    def _compressible(self, message: dict, headers: MutableHeaders) -> bool:
+        """
+        Indica si una respuesta se puede comprimir, según su estado y cabeceras.
+        """
+        if message["status"] < 200 or message["status"] in (204, 206, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return content_type in self.content_types
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._select_encoding(scope)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        # None mientras no se decide; False si la respuesta se envía sin comprimir
+        compressor = None
+
+        async def send_wrapper(message):
+            nonlocal start_message, compressor
+            if message["type"] == "http.response.start":
+                # Las cabeceras se envían junto con el primer fragmento del cuerpo
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                headers = MutableHeaders(scope=start_message)
+                if not self._compressible(start_message, headers):
+                    compressor = False
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body and len(body) < self.min_size:
+                    compressor = False
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = self._compressor(encoding)
+                headers["Content-Encoding"] = encoding
+                # El ETag identifica el contenido, no los bytes enviados
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+
+                if not more_body:
+                    body = compressor.compress(body, flush=False) + compressor.finish()
+                    headers["Content-Length"] = str(len(body))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+
+                if "content-length" in headers:
+                    del headers["Content-Length"]
+                await send(start_message)
+                await send({"type": "http.response.body", "body": compressor.compress(body, flush=True),
+                            "more_body": True})
+                return
+
+            if compressor is False:
+                await send(message)
+                return
+
+            if more_body:
+                body = compressor.compress(body, flush=True)
+            else:
+                body = compressor.compress(body, flush=False) + compressor.finish()
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,91 @@
+"""
+Serialización de perfiles para la exportación masiva.
+
+Este módulo convierte un flujo asíncrono de perfiles en fragmentos de texto
+NDJSON o CSV listos para enviarse con un StreamingResponse. Los fragmentos se
+acumulan solo hasta un tamaño máximo, de modo que la memoria usada no depende
+del número de perfiles exportados.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator
+
+from models.user_models import Profile
+
+# Tamaño aproximado de cada fragmento enviado al cliente
+CHUNK_SIZE = 64 * 1024
+
+# Columnas del CSV: el ID (usado como token de reanudación) y los campos del perfil
+CSV_COLUMNS = ["_id"] + list(Profile.model_fields)
+
+
+def _json_default(value):
+    """
+    Serializa los tipos que `json` no soporta de forma nativa.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _csv_value(value):
+    """
+    Convierte un valor del perfil en una celda de CSV.
+
+    Las listas (experiencias, educación, etc.) se codifican como JSON.
+    """
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=_json_default, ensure_ascii=False)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+async def ndjson_chunks(profiles: AsyncIterator[dict]) -> AsyncIterator[str]:
+    """
+    Convierte un flujo de perfiles en fragmentos NDJSON (un perfil por línea).
+
+    Args:
+        profiles (AsyncIterator[dict]): Perfiles a exportar
+
+    Yields:
+        str: Fragmentos de texto NDJSON
+    """
+    buffer = []
+    size = 0
+    async for profile in profiles:
+        line = json.dumps(profile, default=_json_default, ensure_ascii=False) + "\n"
+        buffer.append(line)
+        size += len(line)
+        if size >= CHUNK_SIZE:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+async def csv_chunks(profiles: AsyncIterator[dict]) -> AsyncIterator[str]:
+    """
+    Convierte un flujo de perfiles en fragmentos CSV con fila de encabezado.
+
+    Args:
+        profiles (AsyncIterator[dict]): Perfiles a exportar
+
+    Yields:
+        str: Fragmentos de texto CSV
+    """
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(CSV_COLUMNS)
+    async for profile in profiles:
+        writer.writerow([_csv_value(profile.get(column, "")) for column in CSV_COLUMNS])
+        if output.tell() >= CHUNK_SIZE:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+    if output.tell():
+        yield output.getvalue()
@@ -0,0 +1,110 @@
+"""
+Utilidades de caché HTTP para las representaciones de un perfil.
+
+Este módulo genera ETags fuertes a partir del contenido del perfil (y, para el
+HTML, de las plantillas y los archivos estáticos que enlaza) y resuelve
+las peticiones condicionales (`If-None-Match`), de modo que los clientes y los
+proxies que ya tienen la versión actual reciben un `304 Not Modified` sin
+cuerpo. `if_match` resuelve la precondición `If-Match` de las escrituras que
+no deben aplicarse sobre una versión distinta de la que vio el cliente.
+"""
+
+import hashlib
+
+from fastapi import Request, Response, status
+
+from config import get_settings
+from utils.pdf_store import profile_digest
+from utils.static_assets import manifest_version
+from utils.template_utils import templates_version
+
+
+def make_etag(profile: dict, variant: str) -> str:
+    """
+    Genera el ETag fuerte de una representación de un perfil.
+
+    El ETag del HTML incluye además la versión de las plantillas y del
+    manifiesto de archivos estáticos, para que un despliegue que los cambie
+    no siga respondiendo `304` con el HTML anterior. El del PDF ya incluye la
+    versión de su diseño (`PDF_LAYOUT_VERSION`).
+
+    Args:
+        profile (dict): Datos del perfil
+        variant (str): Representación (p. ej. "json", "html" o "pdf")
+
+    Returns:
+        str: ETag entre comillas
+    """
+    digest = profile_digest(profile)
+    if variant == "html":
+        payload = f"{digest}:{templates_version()}:{manifest_version()}"
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}-{variant}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Indica si la cabecera `If-None-Match` de la petición coincide con el ETag.
+
+    Args:
+        request (Request): Petición recibida
+        etag (str): ETag de la versión actual
+
+    Returns:
+        bool: True si el cliente ya tiene la versión actual
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match usa comparación débil: se ignora el prefijo W/
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return etag in candidates
+
+
+def if_match(request: Request, etag: str) -> bool:
+    """
+    Indica si la cabecera `If-Match` de la petición coincide con el ETag.
+
+    Se acepta la forma débil (`W/`) de los ETags porque el middleware de
+    compresión la usa al comprimir la respuesta, sin cambiar su contenido.
+
+    Args:
+        request (Request): Petición recibida
+        etag (str): ETag de la versión actual
+
+    Returns:
+        bool: True si el cliente modifica la versión actual
+    """
+    header = request.headers.get("if-match", "")
+    if header.strip() == "*":
+        return True
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return etag in candidates
+
+
+def cache_headers(etag: str) -> dict:
+    """
+    Construye las cabeceras de caché de una representación.
+
+    Args:
+        etag (str): ETag de la representación
+
+    Returns:
+        dict: Cabeceras ETag y Cache-Control
+    """
+    return {"ETag": etag, "Cache-Control": get_settings().http_cache_control}
+
+
+def not_modified(etag: str) -> Response:
+    """
+    Construye la respuesta `304 Not Modified` de una representación.
+
+    Args:
+        etag (str): ETag de la representación
+
+    Returns:
+        Response: Respuesta sin cuerpo
+    """
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag))
@@ -0,0 +1,88 @@
+"""
+Serialización rápida de las respuestas de perfiles.
+
+Los perfiles guardados ya se validaron con el modelo `Profile` al crearlos o
+actualizarlos, por lo que volver a validarlos con `response_model` en cada
+lectura (expresiones regulares, `EmailStr`, modelos anidados) y pasarlos por
+`jsonable_encoder` solo agrega tiempo. Las rutas habilitadas en
+`FAST_JSON_ROUTES` devuelven el documento directamente en un
+`FastJSONResponse`, codificado con orjson si está instalado.
+"""
+
+import json
+from datetime import datetime
+
+from fastapi.responses import JSONResponse
+
+from config import get_settings
+from models.user_models import Profile
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson es opcional
+    orjson = None
+
+# Campos que expone `response_model=Profile`, en su orden
+PROFILE_FIELDS = tuple(Profile.model_fields)
+
+
+def _json_default(value):
+    """
+    Serializa los tipos que `json` no soporta de forma nativa.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def dumps(content) -> bytes:
+    """
+    Codifica un valor como JSON compacto en UTF-8.
+
+    Args:
+        content: Valor a codificar
+
+    Returns:
+        bytes: JSON codificado
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=str)
+    return json.dumps(content, default=_json_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Respuesta JSON codificada con `dumps`, sin `jsonable_encoder`.
+    """
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+def fast_json_enabled(route: str) -> bool:
+    """
+    Indica si una ruta usa la serialización rápida.
+
+    Args:
+        route (str): Nombre de la ruta: get_profile, get_profiles o search_profiles
+
+    Returns:
+        bool: True si la ruta está en `FAST_JSON_ROUTES`
+    """
+    return route in get_settings().fast_json_routes
+
+
+def profile_document(profile: dict) -> dict:
+    """
+    Reduce un perfil guardado a los campos que expone el modelo `Profile`.
+
+    Equivale a la salida de `response_model=Profile` para un documento que
+    fue validado al escribirse, sin volver a validarlo.
+
+    Args:
+        profile (dict): Perfil leído de la base de datos
+
+    Returns:
+        dict: Perfil con solo los campos del modelo
+    """
+    return {field: profile[field] for field in PROFILE_FIELDS if field in profile}
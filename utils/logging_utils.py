@@ -0,0 +1,152 @@
+"""
+Configuración del logging y registro de accesos.
+
+Los logs se escriben a través de una cola (`QueueHandler`): el event loop
+solo encola el registro y un hilo (`QueueListener`) se encarga de formatearlo
+y escribirlo, de modo que la E/S de stdout o disco no bloquea las peticiones.
+
+El registro de accesos emite una línea JSON por petición (método, ruta,
+estado, duración y bytes). Las respuestas exitosas se muestrean según
+`ACCESS_LOG_SAMPLE_RATE`; los errores y las peticiones lentas se registran
+siempre.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import random
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+from config import get_settings
+from utils.metrics import route_template
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+access_logger = logging.getLogger("access")
+
+_listeners = []
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formatea los registros de acceso como una línea JSON.
+
+    Los campos de la petición se reciben en el atributo `access` del registro.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        entry.update(getattr(record, "access", None) or {"message": record.getMessage()})
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def _queue_handler(handler: logging.Handler) -> QueueHandler:
+    """
+    Crea un handler que encola los registros y arranca el hilo que los escribe.
+
+    Args:
+        handler (logging.Handler): Handler que escribe los registros
+
+    Returns:
+        QueueHandler: Handler para agregar a un logger
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+    return QueueHandler(log_queue)
+
+
+def setup_logging():
+    """
+    Configura el logging de la aplicación con handlers basados en colas.
+
+    El nivel de los logs de la aplicación es INFO con `DEBUG=True` y WARNING
+    en otro caso. Si el logger raíz ya tiene handlers (configurados por quien
+    ejecuta la aplicación) se respetan. Se puede llamar varias veces.
+    """
+    if _listeners:
+        return
+
+    root = logging.getLogger()
+    if not root.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        root.addHandler(_queue_handler(handler))
+        root.setLevel(logging.INFO if get_settings().debug else logging.WARNING)
+
+    if not access_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(JsonFormatter())
+        access_logger.addHandler(_queue_handler(handler))
+        access_logger.setLevel(logging.INFO)
+        access_logger.propagate = False
+
+    # Los registros pendientes en las colas se escriben al terminar el proceso
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """
+    Detiene los hilos de logging después de escribir los registros pendientes.
+    """
+    while _listeners:
+        _listeners.pop().stop()
+
+
+class AccessLogMiddleware:
+    """
+    Middleware ASGI que registra cada petición en el logger `access`.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        settings = get_settings()
+        self.sample_rate = settings.access_log_sample_rate
+        self.slow_seconds = settings.access_log_slow_ms / 1000
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        response_bytes = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, response_bytes
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            slow = duration >= self.slow_seconds
+            # Se decide antes de construir el registro para no pagar su costo
+            if status_code >= 400 or slow or random.random() < self.sample_rate:
+                access_logger.log(
+                    logging.WARNING if status_code >= 500 else logging.INFO,
+                    "access",
+                    extra={"access": {
+                        "method": scope["method"],
+                        "route": route_template(scope),
+                        "path": scope["path"],
+                        "status": status_code,
+                        "duration_ms": round(duration * 1000, 3),
+                        "bytes": response_bytes,
+                        "slow": slow,
+                        "sampled": status_code < 400 and not slow,
+                    }}
+                )
@@ -0,0 +1,528 @@
+"""
+Métricas de la aplicación en el formato de exposición de Prometheus.
+
+Este módulo implementa contadores, gauges e histogramas con etiquetas, un
+middleware ASGI que mide cada petición por plantilla de ruta y estado, y
+temporizadores para las operaciones de base de datos y la generación de HTML
+y PDF. Además de la duración total, cada petición se reparte en fases (`db`,
+`render` y `app`, el resto: validación, serialización y middlewares) para
+saber cuál domina la latencia.
+
+Con varios workers (`METRICS_MULTIPROCESS_DIR`), cada proceso guarda
+periódicamente una instantánea de sus métricas en ese directorio y `/metrics`
+las combina: los contadores, histogramas y gauges se suman entre procesos, y
+las métricas de estado propias de cada proceso (cachés, pool) se reportan con
+la etiqueta `pid`.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Límites de los histogramas de duración (segundos) y de tamaño (bytes)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# Starlette agrega "; charset=utf-8" a los tipos de texto
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# Prefijo de los archivos de instantáneas de cada proceso
+SNAPSHOT_PREFIX = "metrics-"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def format_family(name: str, metric_type: str, documentation: str,
+                  samples: Iterable[Tuple[str, Sequence[Tuple[str, str]], float]]) -> List[str]:
+    """
+    Formatea una familia de métricas en el formato de texto de Prometheus.
+
+    Args:
+        name (str): Nombre de la métrica
+        metric_type (str): Tipo ("counter", "gauge" o "histogram")
+        documentation (str): Descripción de la métrica
+        samples: Tuplas (sufijo, etiquetas, valor) de cada muestra
+
+    Returns:
+        List[str]: Líneas de la familia
+    """
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {metric_type}"]
+    for suffix, labels, value in samples:
+        lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+    return lines
+
+
+class _Metric:
+    """
+    Base de las métricas con etiquetas.
+
+    Los valores se protegen con un lock porque las métricas pueden
+    actualizarse desde hilos distintos al del event loop.
+    """
+
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @staticmethod
+    def _copy(value):
+        return value
+
+    @staticmethod
+    def _combine(current, value):
+        return current + value
+
+    def snapshot(self) -> list:
+        """
+        Obtiene una copia de los valores, serializable en JSON.
+
+        Returns:
+            list: Pares [valores de las etiquetas, valor]
+        """
+        with self._lock:
+            return [[list(key), self._copy(value)] for key, value in self._values.items()]
+
+    def _samples(self, values: dict):
+        for key, value in sorted(values.items()):
+            yield "", list(zip(self.labelnames, key)), value
+
+    def render_snapshots(self, snapshots: Iterable[list]) -> List[str]:
+        """
+        Formatea la combinación de varias instantáneas de la métrica.
+
+        Args:
+            snapshots: Resultados de `snapshot`, uno por proceso
+
+        Returns:
+            List[str]: Líneas de la familia
+        """
+        values = {}
+        for snapshot in snapshots:
+            for key, value in snapshot:
+                key = tuple(key)
+                values[key] = self._combine(values[key], value) if key in values else value
+        return format_family(self.name, self.metric_type, self.documentation, self._samples(values))
+
+    def render(self) -> List[str]:
+        return self.render_snapshots([self.snapshot()])
+
+
+class Counter(_Metric):
+    """
+    Valor que solo aumenta.
+    """
+
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """
+    Valor que puede subir y bajar.
+    """
+
+    metric_type = "gauge"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """
+    Distribución de observaciones en buckets acumulados.
+
+    Attributes:
+        buckets (tuple): Límites superiores de los buckets
+    """
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        """
+        Registra una observación.
+        """
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][index] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    @staticmethod
+    def _copy(value):
+        return [list(value[0]), value[1], value[2]]
+
+    @staticmethod
+    def _combine(current, value):
+        return [[a + b for a, b in zip(current[0], value[0])], current[1] + value[1], current[2] + value[2]]
+
+    def _samples(self, values: dict):
+        for key, (counts, total, count) in sorted(values.items()):
+            labels = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield "_bucket", labels + [("le", _format_value(bound))], cumulative
+            yield "_sum", labels, total
+            yield "_count", labels, count
+
+
+class MetricsRegistry:
+    """
+    Conjunto de métricas expuestas en `/metrics`.
+
+    Además de las métricas registradas, admite colectores: funciones que
+    calculan familias de métricas de estado en el momento de cada consulta,
+    como tuplas (nombre, tipo, descripción, muestras) según `format_family`.
+    """
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], List[tuple]]):
+        self._collectors.append(collector)
+
+    def collect(self) -> List[tuple]:
+        """
+        Obtiene las familias de los colectores registrados.
+        """
+        families = []
+        for collector in self._collectors:
+            families.extend(collector())
+        return families
+
+    def render(self) -> List[str]:
+        """
+        Obtiene las líneas de todas las métricas registradas y de los colectores.
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for family in self.collect():
+            lines.extend(format_family(*family))
+        return lines
+
+    def write_snapshot(self, directory: str, exiting: bool = False):
+        """
+        Guarda la instantánea de las métricas del proceso en el directorio compartido.
+
+        Args:
+            directory (str): Directorio de las instantáneas
+            exiting (bool): El proceso termina; sus gauges y métricas de
+                estado dejan de reportarse, sus contadores e histogramas se
+                conservan
+        """
+        data = {
+            "pid": os.getpid(),
+            "time": time.time(),
+            "live": not exiting,
+            "metrics": {metric.name: metric.snapshot() for metric in self._metrics},
+            "collected": [] if exiting else self.collect(),
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, os.path.join(directory, f"{SNAPSHOT_PREFIX}{os.getpid()}.json"))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def render_multiprocess(self, directory: str, max_age: float) -> List[str]:
+        """
+        Obtiene las líneas de las métricas combinadas de todos los procesos.
+
+        La instantánea del proceso actual se actualiza antes de leerlas. Las
+        de procesos que terminaron, o que no se actualizan hace más de
+        `max_age` segundos, solo aportan sus contadores e histogramas.
+
+        Args:
+            directory (str): Directorio de las instantáneas
+            max_age (float): Antigüedad máxima de una instantánea viva, en segundos
+
+        Returns:
+            List[str]: Líneas de las métricas
+        """
+        self.write_snapshot(directory)
+        snapshots = []
+        for name in os.listdir(directory):
+            if not (name.startswith(SNAPSHOT_PREFIX) and name.endswith(".json")):
+                continue
+            try:
+                with open(os.path.join(directory, name), encoding="utf-8") as f:
+                    snapshots.append(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Instantánea de métricas no válida {name}: {str(e)}")
+        now = time.time()
+        live = [snapshot for snapshot in snapshots if snapshot["live"] and now - snapshot["time"] <= max_age]
+
+        lines = []
+        for metric in self._metrics:
+            sources = live if metric.metric_type == "gauge" else snapshots
+            lines.extend(metric.render_snapshots(snapshot["metrics"].get(metric.name, []) for snapshot in sources))
+
+        families = {}
+        for snapshot in sorted(live, key=lambda snapshot: snapshot["pid"]):
+            pid = str(snapshot["pid"])
+            for name, metric_type, documentation, samples in snapshot["collected"]:
+                family = families.setdefault(name, (metric_type, documentation, []))
+                family[2].extend((suffix, list(labels) + [("pid", pid)], value) for suffix, labels, value in samples)
+        for name, (metric_type, documentation, samples) in families.items():
+            lines.extend(format_family(name, metric_type, documentation, samples))
+        return lines
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "Duración de las peticiones HTTP",
+    ["method", "route", "status"]
+))
+HTTP_REQUESTS_IN_PROGRESS = REGISTRY.register(Gauge(
+    "http_requests_in_progress", "Peticiones HTTP en curso", ["method"]
+))
+HTTP_PHASE_SECONDS = REGISTRY.register(Histogram(
+    "http_request_phase_duration_seconds",
+    "Tiempo de cada petición por fase: db, render y app (validación, serialización y middlewares)",
+    ["route", "phase"]
+))
+DB_OPERATION_SECONDS = REGISTRY.register(Histogram(
+    "db_operation_duration_seconds", "Duración de las operaciones de base de datos",
+    ["backend", "operation"]
+))
+DB_OPERATION_ERRORS = REGISTRY.register(Counter(
+    "db_operation_errors_total", "Operaciones de base de datos fallidas",
+    ["backend", "operation"]
+))
+RENDER_SECONDS = REGISTRY.register(Histogram(
+    "render_duration_seconds", "Duración de la generación de CVs", ["format"]
+))
+RENDER_OUTPUT_BYTES = REGISTRY.register(Histogram(
+    "render_output_bytes", "Tamaño de los CVs generados", ["format"], buckets=SIZE_BUCKETS
+))
+PDF_JOBS_FINISHED = REGISTRY.register(Counter(
+    "pdf_jobs_finished_total", "Trabajos de generación de PDF terminados", ["status"]
+))
+PDF_JOB_WAIT_SECONDS = REGISTRY.register(Histogram(
+    "pdf_job_wait_seconds", "Tiempo en cola de los trabajos de generación de PDF"
+))
+ADMISSION_IN_FLIGHT = REGISTRY.register(Gauge(
+    "admission_in_flight", "Peticiones en curso por clase de ruta con límite de concurrencia", ["route_class"]
+))
+ADMISSION_QUEUE_DEPTH = REGISTRY.register(Gauge(
+    "admission_queue_depth", "Peticiones esperando turno por clase de ruta", ["route_class"]
+))
+ADMISSION_WAIT_SECONDS = REGISTRY.register(Histogram(
+    "admission_wait_seconds", "Espera de las peticiones admitidas por clase de ruta", ["route_class"]
+))
+ADMISSION_REJECTIONS = REGISTRY.register(Counter(
+    "admission_rejections_total", "Peticiones rechazadas con 503 por clase de ruta y motivo",
+    ["route_class", "reason"]
+))
+
+def clear_snapshots(directory: str):
+    """
+    Elimina las instantáneas de una ejecución anterior del directorio.
+
+    Args:
+        directory (str): Directorio de las instantáneas
+    """
+    os.makedirs(directory, exist_ok=True)
+    for name in os.listdir(directory):
+        if name.startswith(SNAPSHOT_PREFIX):
+            os.remove(os.path.join(directory, name))
+
+
+async def snapshot_loop(directory: str, interval: float):
+    """
+    Guarda la instantánea de las métricas del proceso cada `interval` segundos,
+    en un hilo aparte para no bloquear el bucle de eventos con la escritura.
+
+    Args:
+        directory (str): Directorio de las instantáneas
+        interval (float): Segundos entre instantáneas
+    """
+    while True:
+        try:
+            await asyncio.to_thread(REGISTRY.write_snapshot, directory)
+        except Exception as e:
+            logger.error(f"Error al guardar la instantánea de métricas: {str(e)}")
+        await asyncio.sleep(interval)
+
+
+# Tiempo acumulado por fase de la petición en curso; None fuera de una petición
+_request_phases: ContextVar[Optional[dict]] = ContextVar("request_phases", default=None)
+
+
+def _add_phase(phase: str, seconds: float):
+    phases = _request_phases.get()
+    if phases is not None:
+        phases[phase] = phases.get(phase, 0.0) + seconds
+
+
+@contextmanager
+def db_timer(backend: str, operation: str):
+    """
+    Mide una operación de base de datos y cuenta sus errores.
+
+    Args:
+        backend (str): Backend de la base de datos ("mongo" o "sqlite")
+        operation (str): Nombre de la operación
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        DB_OPERATION_ERRORS.inc(backend=backend, operation=operation)
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        DB_OPERATION_SECONDS.observe(elapsed, backend=backend, operation=operation)
+        _add_phase("db", elapsed)
+
+
+@contextmanager
+def render_timer(output_format: str):
+    """
+    Mide la generación de un CV.
+
+    Args:
+        output_format (str): Formato generado ("html" o "pdf")
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        RENDER_SECONDS.observe(elapsed, format=output_format)
+        _add_phase("render", elapsed)
+
+
+# Plantilla de ruta de cada endpoint, construida con las rutas de la aplicación
+_route_paths = {}
+
+
+def route_template(scope) -> str:
+    """
+    Obtiene la plantilla de la ruta que atendió una petición.
+
+    Se usa la plantilla (p. ej. `/api/v1/profiles/{profile_id}`) y no la ruta
+    real para que el número de series y de valores distintos no dependa de los
+    IDs. Debe llamarse después de que el router procese la petición.
+
+    Args:
+        scope (dict): Scope ASGI de la petición
+
+    Returns:
+        str: Plantilla de la ruta, o "unmatched" si ninguna ruta coincidió
+    """
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return "unmatched"
+    if endpoint not in _route_paths:
+        # Starlette guarda en el scope el endpoint de la ruta, no su plantilla
+        _route_paths.update({
+            getattr(route, "endpoint", None) or getattr(route, "app", None): route.path
+            for route in scope["app"].routes
+        })
+        _route_paths.setdefault(endpoint, "unmatched")
+    return _route_paths[endpoint]
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que mide cada petición HTTP por plantilla de ruta y estado.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        phases = {}
+        token = _request_phases.set(phases)
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc(method=method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_REQUESTS_IN_PROGRESS.dec(method=method)
+            _request_phases.reset(token)
+            route = route_template(scope)
+            HTTP_REQUEST_SECONDS.observe(elapsed, method=method, route=route, status=status_code)
+            for phase in ("db", "render"):
+                HTTP_PHASE_SECONDS.observe(phases.get(phase, 0.0), route=route, phase=phase)
+            app_seconds = max(elapsed - phases.get("db", 0.0) - phases.get("render", 0.0), 0.0)
+            HTTP_PHASE_SECONDS.observe(app_seconds, route=route, phase="app")
@@ -0,0 +1,404 @@
+"""
+Cola de trabajos de generación de PDF.
+
+`POST /profiles/{id}/pdf-jobs` registra un trabajo y responde de inmediato;
+un grupo acotado de workers del event loop toma los trabajos de la cola y
+genera los PDFs en el pool de `utils.pdf_utils`, con el mismo diseño que la
+descarga directa. El resultado se guarda en el almacén de artefactos PDF
+(aunque `PDF_CACHE_ENABLED` esté desactivado) y el estado de cada trabajo en un almacén de trabajos: en memoria (por defecto) o
+en MongoDB, con lo que el estado se comparte entre workers y reinicios.
+
+Los trabajos pendientes viven en la cola del proceso que los recibió: si el
+proceso se detiene antes de procesarlos, quedan marcados como fallidos.
+"""
+
+import asyncio
+import logging
+import os
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import uuid4
+
+from starlette.concurrency import run_in_threadpool
+
+from config import get_settings
+from db.repository import get_repository
+from utils.metrics import PDF_JOB_WAIT_SECONDS, PDF_JOBS_FINISHED, db_timer
+from utils.pdf_store import get_pdf_store, profile_digest
+from utils.pdf_utils import cv_filename, render_cv_pdf_async
+
+logger = logging.getLogger(__name__)
+
+
+class PdfJobQueueFull(Exception):
+    """
+    La cola de trabajos alcanzó `PDF_JOBS_MAX_PENDING`.
+    """
+
+
+class PdfJobStore(ABC):
+    """
+    Almacenamiento del estado de los trabajos de generación de PDF.
+
+    Los trabajos se manejan como diccionarios con el ID en `id`.
+
+    Attributes:
+        name (str): Nombre del almacén
+    """
+
+    name = ""
+
+    async def setup(self):
+        """
+        Prepara el almacenamiento (p. ej. índices), si aplica.
+        """
+
+    @abstractmethod
+    async def create(self, job: dict):
+        """
+        Registra un trabajo nuevo.
+
+        Args:
+            job (dict): Datos del trabajo
+        """
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[dict]:
+        """
+        Obtiene un trabajo por su ID.
+
+        Args:
+            job_id (str): ID del trabajo
+
+        Returns:
+            dict: Datos del trabajo o None si no existe o expiró
+        """
+
+    @abstractmethod
+    async def update(self, job_id: str, fields: dict):
+        """
+        Actualiza los campos indicados de un trabajo.
+
+        Args:
+            job_id (str): ID del trabajo
+            fields (dict): Campos a actualizar
+        """
+
+
+class MemoryPdfJobStore(PdfJobStore):
+    """
+    Almacén de trabajos en memoria del proceso.
+
+    Los trabajos terminados se descartan al llegar a su `expires_at`.
+    """
+
+    name = "memory"
+
+    def __init__(self):
+        # ID -> trabajo
+        self._jobs = {}
+        # ID -> expiración de los trabajos terminados, en orden de expiración
+        # (todos usan el mismo TTL, así que es el orden en que terminaron)
+        self._expiring = OrderedDict()
+
+    def _purge(self, now: datetime):
+        """
+        Descarta los trabajos terminados que expiraron.
+
+        Los trabajos pendientes o en curso no tienen expiración y no detienen
+        el descarte de los que terminaron después.
+        """
+        while self._expiring:
+            job_id, expires_at = next(iter(self._expiring.items()))
+            if expires_at > now:
+                break
+            self._expiring.popitem(last=False)
+            self._jobs.pop(job_id, None)
+
+    async def create(self, job: dict):
+        self._purge(datetime.utcnow())
+        self._jobs[job["id"]] = dict(job)
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        if job["expires_at"] is not None and job["expires_at"] <= datetime.utcnow():
+            del self._jobs[job_id]
+            self._expiring.pop(job_id, None)
+            return None
+        return dict(job)
+
+    async def update(self, job_id: str, fields: dict):
+        job = self._jobs.get(job_id)
+        if job is not None:
+            job.update(fields)
+            if job["expires_at"] is not None:
+                self._expiring[job_id] = job["expires_at"]
+                self._expiring.move_to_end(job_id)
+
+
+class MongoPdfJobStore(PdfJobStore):
+    """
+    Almacén de trabajos en la colección `pdf_jobs` de MongoDB.
+
+    Un índice TTL sobre `expires_at` elimina los trabajos terminados.
+    """
+
+    name = "mongo"
+
+    @property
+    def collection(self):
+        from db import database
+        return database.db.pdf_jobs
+
+    async def setup(self):
+        try:
+            await self.collection.create_index("expires_at", expireAfterSeconds=0, name="expires_at_ttl")
+        except Exception as e:
+            logger.error(f"No se pudo crear el índice TTL de los trabajos de PDF: {str(e)}")
+
+    async def create(self, job: dict):
+        document = dict(job)
+        document["_id"] = document.pop("id")
+        with db_timer(self.name, "create_pdf_job"):
+            await self.collection.insert_one(document)
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        with db_timer(self.name, "get_pdf_job"):
+            document = await self.collection.find_one({"_id": job_id})
+        if document is None:
+            return None
+        # El índice TTL elimina los documentos con un retraso de hasta un minuto
+        if document.get("expires_at") is not None and document["expires_at"] <= datetime.utcnow():
+            return None
+        document["id"] = document.pop("_id")
+        return document
+
+    async def update(self, job_id: str, fields: dict):
+        with db_timer(self.name, "update_pdf_job"):
+            await self.collection.update_one({"_id": job_id}, {"$set": fields})
+
+
+class PdfJobQueue:
+    """
+    Cola acotada de trabajos de PDF atendida por un número fijo de workers.
+
+    Attributes:
+        store (PdfJobStore): Almacén del estado de los trabajos
+        workers (int): Número de trabajos que se procesan a la vez
+        ttl (float): Segundos que se conserva un trabajo terminado
+    """
+
+    def __init__(self, store: PdfJobStore, workers: int, max_pending: int, ttl: float):
+        self.store = store
+        self.workers = workers
+        self.ttl = ttl
+        self._queue = asyncio.Queue(maxsize=max_pending)
+        self._tasks = []
+        # Trabajos que los workers están procesando, por ID
+        self._running = {}
+
+    async def start(self):
+        """
+        Prepara el almacén y arranca los workers.
+        """
+        await self.store.setup()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        logger.info(f"Cola de trabajos de PDF: {self.workers} workers, almacén {self.store.name}")
+
+    async def stop(self, timeout: float = 0):
+        """
+        Detiene los workers y marca como fallidos los trabajos sin terminar.
+
+        Args:
+            timeout (float): Segundos que se espera a que se procesen los
+                trabajos en curso y en cola antes de detener los workers
+        """
+        if timeout > 0 and self._tasks:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Cola de trabajos de PDF detenida con {self._queue.qsize()} trabajos pendientes")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        unfinished = list(self._running)
+        self._running.clear()
+        while not self._queue.empty():
+            unfinished.append(self._queue.get_nowait()["id"])
+        for job_id in unfinished:
+            await self._finish(job_id, "failed", {"error": "El servidor se detuvo antes de terminar el trabajo"})
+
+    async def submit(self, profile_id: str) -> dict:
+        """
+        Registra un trabajo para generar el PDF de un perfil.
+
+        Args:
+            profile_id (str): ID del perfil
+
+        Returns:
+            dict: Datos del trabajo, en estado pendiente
+
+        Raises:
+            PdfJobQueueFull: Si la cola no admite más trabajos
+        """
+        if self._queue.full():
+            raise PdfJobQueueFull()
+        job = {
+            "id": uuid4().hex,
+            "profile_id": profile_id,
+            "status": "pending",
+            "created_at": datetime.utcnow(),
+            "started_at": None,
+            "finished_at": None,
+            "digest": None,
+            "filename": None,
+            "size": None,
+            "error": None,
+            "expires_at": None,
+        }
+        await self.store.create(job)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            # Otra petición llenó la cola mientras se registraba el trabajo
+            await self._finish(job["id"], "failed", {"error": "La cola de trabajos está llena"})
+            raise PdfJobQueueFull()
+        return job
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            self._running[job["id"]] = job
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+            # Si el worker se cancela, el trabajo queda en `_running` para que `stop` lo marque
+            self._running.pop(job["id"], None)
+
+    async def _run(self, job: dict):
+        """
+        Genera el PDF de un trabajo y registra el resultado.
+        """
+        started_at = datetime.utcnow()
+        PDF_JOB_WAIT_SECONDS.observe((started_at - job["created_at"]).total_seconds())
+        try:
+            await self.store.update(job["id"], {"status": "running", "started_at": started_at})
+            profile = await get_repository().get_profile(job["profile_id"])
+            if not profile:
+                await self._finish(job["id"], "failed", {"error": "Perfil no encontrado"})
+                return
+
+            digest = profile_digest(profile)
+            store = get_pdf_store()
+            pdf_bytes = await run_in_threadpool(store.get, job["profile_id"], digest)
+            if pdf_bytes is None:
+                pdf_bytes = await render_cv_pdf_async(profile)
+                await run_in_threadpool(store.put, job["profile_id"], digest, pdf_bytes)
+            await self._finish(job["id"], "done", {
+                "digest": digest,
+                "filename": cv_filename(profile),
+                "size": len(pdf_bytes),
+            })
+        except Exception as e:
+            logger.error(f"Error en el trabajo de PDF {job['id']}: {str(e)}")
+            await self._finish(job["id"], "failed", {"error": "Error al generar el PDF"})
+
+    async def _finish(self, job_id: str, status: str, fields: dict):
+        """
+        Marca un trabajo como terminado y fija su expiración.
+        """
+        now = datetime.utcnow()
+        fields = {**fields, "status": status, "finished_at": now, "expires_at": now + timedelta(seconds=self.ttl)}
+        try:
+            await self.store.update(job_id, fields)
+        except Exception as e:
+            logger.error(f"No se pudo actualizar el trabajo de PDF {job_id}: {str(e)}")
+        PDF_JOBS_FINISHED.inc(status=status)
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        """
+        Obtiene el estado de un trabajo.
+
+        Args:
+            job_id (str): ID del trabajo
+
+        Returns:
+            dict: Datos del trabajo o None si no existe o expiró
+        """
+        return await self.store.get(job_id)
+
+    async def result(self, job: dict) -> Optional[bytes]:
+        """
+        Obtiene el PDF de un trabajo terminado.
+
+        Si el almacén de artefactos ya no tiene el PDF (por ejemplo, porque lo
+        expulsó), se vuelve a generar siempre que el perfil no haya cambiado.
+
+        Args:
+            job (dict): Datos de un trabajo en estado `done`
+
+        Returns:
+            bytes: Contenido del PDF o None si el perfil cambió o se eliminó
+        """
+        store = get_pdf_store()
+        pdf_bytes = await run_in_threadpool(store.get, job["profile_id"], job["digest"])
+        if pdf_bytes is not None:
+            return pdf_bytes
+
+        profile = await get_repository().get_profile(job["profile_id"])
+        if not profile or profile_digest(profile) != job["digest"]:
+            return None
+        pdf_bytes = await render_cv_pdf_async(profile)
+        await run_in_threadpool(store.put, job["profile_id"], job["digest"], pdf_bytes)
+        return pdf_bytes
+
+    def stats(self) -> dict:
+        """
+        Obtiene el estado de la cola.
+
+        Returns:
+            dict: Trabajos pendientes y en curso, capacidad, workers y almacén
+        """
+        return {
+            "pending": self._queue.qsize(),
+            "running": len(self._running),
+            "max_pending": self._queue.maxsize,
+            "workers": self.workers,
+            "store": self.store.name,
+        }
+
+
+_job_queue = None
+
+
+def get_pdf_job_queue() -> PdfJobQueue:
+    """
+    Obtiene la cola de trabajos de PDF del proceso, con el almacén de `PDF_JOBS_STORE`.
+
+    Returns:
+        PdfJobQueue: Cola de trabajos
+
+    Raises:
+        ValueError: Si el almacén configurado no existe o requiere otra base de datos
+    """
+    global _job_queue
+    if _job_queue is None:
+        settings = get_settings()
+        if settings.pdf_jobs_store == "memory":
+            store = MemoryPdfJobStore()
+        elif settings.pdf_jobs_store == "mongo":
+            if settings.database_backend != "mongo":
+                raise ValueError("PDF_JOBS_STORE=mongo requiere DATABASE_BACKEND=mongo")
+            store = MongoPdfJobStore()
+        else:
+            raise ValueError(f"Almacén de trabajos de PDF no soportado: {settings.pdf_jobs_store}")
+        workers = settings.pdf_jobs_workers or settings.pdf_render_workers or os.cpu_count() or 1
+        _job_queue = PdfJobQueue(store, workers, settings.pdf_jobs_max_pending, settings.pdf_jobs_ttl)
+    return _job_queue
@@ -0,0 +1,289 @@
+"""
+Almacén de artefactos PDF direccionado por contenido.
+
+Este módulo guarda en disco los PDFs generados para cada perfil, identificados
+por el ID del perfil y un hash de su contenido. Así, mientras un perfil no
+cambie, las descargas repetidas reutilizan el mismo archivo en lugar de volver
+a generarlo. El almacén respeta un presupuesto máximo en disco y expulsa los
+archivos menos usados recientemente (LRU) cuando se supera.
+
+El directorio se comparte entre los workers de `server.py`: el presupuesto se
+aplica sobre todos los archivos del directorio, recorriéndolo bajo un bloqueo
+de archivo en cada escritura, y el orden LRU se guarda en la fecha de
+modificación de cada archivo, de modo que cualquier worker puede expulsar los
+artefactos escritos por los demás. Las entradas y bytes que reportan las
+estadísticas salen del último recorrido, de hace como mucho
+`_USAGE_MAX_AGE` segundos, para no recorrer el directorio en cada consulta.
+"""
+
+import contextlib
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+from config import get_settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows, sin bloqueo entre procesos
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Versión del diseño del PDF; cambiarla invalida todos los artefactos previos
+PDF_LAYOUT_VERSION = "1"
+
+# Caracteres permitidos en el ID de perfil usado como parte del nombre de archivo
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_-]+$")
+
+# Archivo de bloqueo que serializa las expulsiones entre procesos
+_LOCK_FILENAME = ".lock"
+
+# Segundos que se reutiliza el uso del directorio medido en el último recorrido
+_USAGE_MAX_AGE = 5.0
+
+
+def profile_digest(profile: dict) -> str:
+    """
+    Calcula un hash estable del contenido de un perfil.
+
+    Args:
+        profile (dict): Datos del perfil
+
+    Returns:
+        str: Hash SHA-256 en hexadecimal
+    """
+    payload = json.dumps(profile, sort_keys=True, default=str, separators=(",", ":"))
+    hasher = hashlib.sha256(PDF_LAYOUT_VERSION.encode("utf-8"))
+    hasher.update(payload.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class PdfArtifactStore:
+    """
+    Almacén LRU de PDFs en disco con presupuesto de tamaño.
+
+    El presupuesto y el orden LRU se calculan a partir del contenido del
+    directorio, compartido por todos los procesos que lo usan.
+
+    Attributes:
+        directory (str): Directorio donde se guardan los artefactos
+        max_bytes (int): Tamaño máximo total de los artefactos en disco
+        hits (int): Número de lecturas servidas desde el almacén
+        misses (int): Número de lecturas sin artefacto disponible
+        evictions (int): Número de artefactos expulsados
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # (instante del recorrido, entradas, bytes) según time.monotonic()
+        self._usage = None
+        os.makedirs(directory, exist_ok=True)
+        with self._lock, self._directory_lock():
+            entries = self._scan()
+            self._evict(entries)
+            self._record_usage(entries)
+
+    @contextlib.contextmanager
+    def _directory_lock(self):
+        """
+        Bloqueo exclusivo del directorio, compartido con los demás procesos.
+        """
+        with open(os.path.join(self.directory, _LOCK_FILENAME), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _scan(self) -> Dict[str, tuple]:
+        """
+        Recorre los artefactos del directorio.
+
+        Returns:
+            Dict[str, tuple]: Nombre de archivo -> (fecha de modificación,
+                tamaño), ordenado del menos al más usado
+        """
+        files = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".pdf"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            files.append((stat.st_mtime, name, stat.st_size))
+        return {name: (mtime, size) for mtime, name, size in sorted(files)}
+
+    @staticmethod
+    def _filename(profile_id: str, digest: str) -> str:
+        if not _SAFE_ID.match(profile_id):
+            raise ValueError(f"ID de perfil no válido: {profile_id}")
+        return f"{profile_id}-{digest}.pdf"
+
+    def get(self, profile_id: str, digest: str) -> Optional[bytes]:
+        """
+        Obtiene el PDF almacenado para una versión de un perfil.
+
+        Args:
+            profile_id (str): ID del perfil
+            digest (str): Hash del contenido del perfil
+
+        Returns:
+            bytes: Contenido del PDF o None si no está almacenado
+        """
+        name = self._filename(profile_id, digest)
+        path = os.path.join(self.directory, name)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        try:
+            # Actualizar la fecha de modificación conserva el orden LRU entre reinicios
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, profile_id: str, digest: str, data: bytes) -> bool:
+        """
+        Guarda el PDF de una versión de un perfil con escritura atómica.
+
+        Las versiones anteriores del mismo perfil se eliminan del almacén y,
+        si el directorio supera el presupuesto, se expulsan los artefactos
+        menos usados, incluidos los escritos por otros procesos.
+
+        Args:
+            profile_id (str): ID del perfil
+            digest (str): Hash del contenido del perfil
+            data (bytes): Contenido del PDF
+
+        Returns:
+            bool: True si el PDF quedó almacenado, False si excede el presupuesto
+        """
+        if len(data) > self.max_bytes:
+            logger.warning(f"PDF de {profile_id} excede el presupuesto del almacén")
+            return False
+
+        name = self._filename(profile_id, digest)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, os.path.join(self.directory, name))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock, self._directory_lock():
+            entries = self._scan()
+            stale = [
+                entry for entry in entries
+                if entry != name and entry.rsplit("-", 1)[0] == profile_id
+            ]
+            for entry in stale:
+                del entries[entry]
+                self._remove(entry)
+            self._evict(entries)
+            self._record_usage(entries)
+        return True
+
+    def _remove(self, name: str):
+        """
+        Elimina un artefacto del disco.
+        """
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self, entries: Dict[str, tuple]):
+        """
+        Expulsa los artefactos menos usados hasta respetar el presupuesto.
+        Requiere el bloqueo del directorio.
+
+        Args:
+            entries (Dict[str, tuple]): Resultado de `_scan`; se quitan los
+                artefactos expulsados
+        """
+        total_bytes = sum(size for _, size in entries.values())
+        for name, (_, size) in list(entries.items()):
+            if total_bytes <= self.max_bytes:
+                break
+            self._remove(name)
+            del entries[name]
+            total_bytes -= size
+            self.evictions += 1
+            logger.info(f"Artefacto PDF expulsado: {name}")
+
+    def _record_usage(self, entries: Dict[str, tuple]):
+        """
+        Guarda el uso del directorio medido en un recorrido. Requiere `self._lock`.
+        """
+        self._usage = (time.monotonic(), len(entries), sum(size for _, size in entries.values()))
+
+    def stats(self) -> dict:
+        """
+        Obtiene los contadores del almacén.
+
+        El directorio se vuelve a recorrer solo si el último recorrido tiene
+        más de `_USAGE_MAX_AGE` segundos.
+
+        Returns:
+            dict: Aciertos, fallos y expulsiones de este proceso, y entradas y
+                bytes ocupados en el directorio compartido
+        """
+        with self._lock:
+            usage = self._usage
+        if usage is None or time.monotonic() - usage[0] > _USAGE_MAX_AGE:
+            entries = self._scan()
+            with self._lock:
+                self._record_usage(entries)
+        with self._lock:
+            _, entries, total_bytes = self._usage
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": entries,
+                "bytes": total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_store = None
+
+
+def get_pdf_store() -> PdfArtifactStore:
+    """
+    Obtiene el almacén de PDFs del proceso, creándolo con la configuración activa.
+
+    Returns:
+        PdfArtifactStore: Almacén de artefactos PDF
+    """
+    global _store
+    if _store is None:
+        settings = get_settings()
+        _store = PdfArtifactStore(settings.pdf_cache_dir, settings.pdf_cache_max_bytes)
+    return _store
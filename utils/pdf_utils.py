@@ -0,0 +1,192 @@
+"""
+Generación del CV en formato PDF.
+
+Este módulo contiene el diseño del CV en PDF construido con FPDF. El PDF se
+genera completamente en memoria y se devuelve como bytes. Como la generación
+es trabajo de CPU síncrono, las rutas la ejecutan en un pool de procesos (o de
+hilos) para no bloquear el event loop.
+"""
+
+import asyncio
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import quote
+
+from config import get_settings
+from starlette.concurrency import run_in_threadpool
+from utils.metrics import RENDER_OUTPUT_BYTES, render_timer
+from utils.pdf_store import get_pdf_store, profile_digest
+
+# Caracteres no permitidos en los nombres de archivo generados
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w.-]")
+
+logger = logging.getLogger(__name__)
+
+
+def render_cv_pdf(profile: dict) -> bytes:
+    """
+    Genera el PDF del CV de un perfil.
+
+    Args:
+        profile (dict): Datos del perfil
+
+    Returns:
+        bytes: Contenido del PDF generado
+    """
+    # FPDF se importa en el primer uso, dentro del worker que genera el PDF
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.add_page()
+
+    # Configurar fuentes
+    pdf.set_font("Arial", "B", 16)
+
+    # Encabezado
+    pdf.cell(0, 10, profile["name"], ln=True, align="C")
+    pdf.set_font("Arial", "", 12)
+    pdf.cell(0, 10, f"Email: {profile['email']}", ln=True)
+    pdf.cell(0, 10, f"Teléfono: {profile['phone']}", ln=True)
+    pdf.cell(0, 10, f"Ubicación: {profile['location']}", ln=True)
+
+    # Resumen
+    pdf.ln(10)
+    pdf.set_font("Arial", "B", 14)
+    pdf.cell(0, 10, "Resumen Profesional", ln=True)
+    pdf.set_font("Arial", "", 12)
+    pdf.multi_cell(0, 10, profile["summary"])
+
+    # Experiencia
+    pdf.ln(10)
+    pdf.set_font("Arial", "B", 14)
+    pdf.cell(0, 10, "Experiencia Laboral", ln=True)
+    for exp in profile["experiences"]:
+        pdf.set_font("Arial", "B", 12)
+        pdf.cell(0, 10, f"{exp['position']} - {exp['company']}", ln=True)
+        pdf.set_font("Arial", "", 12)
+        pdf.cell(0, 10, f"{exp['start_date']} - {exp['end_date']}", ln=True)
+        pdf.multi_cell(0, 10, exp["description"])
+        pdf.ln(5)
+
+    # FPDF 1.7 devuelve el documento como cadena latin-1 con dest="S"
+    return pdf.output(dest="S").encode("latin-1")
+
+
+_executor = None
+
+
+def get_pdf_executor():
+    """
+    Obtiene el pool de workers que genera los PDFs, creándolo la primera vez.
+
+    Si el pool de procesos no puede crearse en el entorno actual se usa un
+    pool de hilos.
+
+    Returns:
+        Executor: Pool de procesos o de hilos
+    """
+    global _executor
+    if _executor is None:
+        settings = get_settings()
+        workers = settings.pdf_render_workers or os.cpu_count() or 1
+        if settings.pdf_render_executor == "process":
+            try:
+                _executor = ProcessPoolExecutor(max_workers=workers)
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"No se pudo crear el pool de procesos, se usan hilos: {str(e)}")
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pdf")
+        logger.info(f"Pool de generación de PDF: {type(_executor).__name__} con {workers} workers")
+    return _executor
+
+
+async def render_cv_pdf_async(profile: dict) -> bytes:
+    """
+    Genera el PDF del CV en el pool de workers sin bloquear el event loop.
+
+    Args:
+        profile (dict): Datos del perfil
+
+    Returns:
+        bytes: Contenido del PDF generado
+    """
+    loop = asyncio.get_running_loop()
+    with render_timer("pdf"):
+        pdf_bytes = await loop.run_in_executor(get_pdf_executor(), render_cv_pdf, profile)
+    RENDER_OUTPUT_BYTES.observe(len(pdf_bytes), format="pdf")
+    return pdf_bytes
+
+
+async def get_cv_pdf(profile: dict) -> bytes:
+    """
+    Obtiene el PDF del CV, reutilizando el almacén de artefactos si está habilitado.
+
+    Args:
+        profile (dict): Datos del perfil, incluido su `_id`
+
+    Returns:
+        bytes: Contenido del PDF
+    """
+    settings = get_settings()
+    if not settings.pdf_cache_enabled:
+        return await render_cv_pdf_async(profile)
+
+    store = get_pdf_store()
+    profile_id = str(profile["_id"])
+    digest = profile_digest(profile)
+    pdf_bytes = await run_in_threadpool(store.get, profile_id, digest)
+    if pdf_bytes is None:
+        pdf_bytes = await render_cv_pdf_async(profile)
+        await run_in_threadpool(store.put, profile_id, digest, pdf_bytes)
+    return pdf_bytes
+
+
+def cv_filename(profile: dict) -> str:
+    """
+    Construye el nombre del archivo PDF del CV de un perfil.
+
+    El nombre del perfil lo define el usuario, así que se reemplazan los
+    separadores de ruta y demás caracteres especiales por `_` y se eliminan
+    las secuencias `..`; el resultado es seguro como nombre de entrada de un
+    ZIP o de un archivo descargado.
+
+    Args:
+        profile (dict): Datos del perfil
+
+    Returns:
+        str: Nombre del archivo
+    """
+    name = _UNSAFE_FILENAME_CHARS.sub("_", profile['name'])
+    name = re.sub(r"\.{2,}", "_", name).strip(".")
+    return f"cv_{name}.pdf"
+
+
+def shutdown_pdf_executor():
+    """
+    Detiene el pool de workers esperando a que terminen los PDFs en curso.
+    """
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+def content_disposition(filename: str) -> str:
+    """
+    Construye la cabecera Content-Disposition para descargar un archivo.
+
+    Los nombres con caracteres no ASCII se codifican según RFC 5987, igual que
+    lo hace FileResponse.
+
+    Args:
+        filename (str): Nombre del archivo descargado
+
+    Returns:
+        str: Valor de la cabecera Content-Disposition
+    """
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
@@ -0,0 +1,245 @@
+"""
+Archivos estáticos con huella de contenido y variantes precomprimidas.
+
+`python -m utils.static_assets` copia los archivos de `static/` a
+`static/dist/` con un hash de su contenido en el nombre
+(`css/style.css` -> `css/style.3c1f9a2b7d10.css`), escribe junto a los
+archivos de texto sus variantes gzip y brotli (si el paquete `brotli` está
+instalado) y guarda la correspondencia en `static/dist/manifest.json`.
+
+Como el nombre cambia con el contenido, los archivos de `dist/` se sirven con
+`Cache-Control: immutable` y el navegador no los vuelve a pedir. Las
+plantillas obtienen las URLs con `static_url`; si no se ha ejecutado la
+construcción se usan las URLs originales. Las referencias dentro de los
+propios archivos (p. ej. `url()` en CSS) no se reescriben.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import shutil
+import stat
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from config import BASE_DIR, get_settings
+from utils.compression import accepted_encodings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli es opcional
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+STATIC_URL = "/static"
+DIST_NAME = "dist"
+MANIFEST_NAME = "manifest.json"
+
+# Cabecera de los archivos con hash: su contenido nunca cambia
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Extensiones que vale la pena comprimir; las imágenes PNG/JPEG ya lo están
+COMPRESSIBLE_EXTENSIONS = {".css", ".js", ".json", ".svg", ".xml", ".ico", ".txt", ".html", ".map", ".webmanifest"}
+
+# Variantes precomprimidas en orden de preferencia: (Content-Encoding, sufijo)
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# Una variante se guarda solo si ocupa menos que esta fracción del original
+MIN_COMPRESSION_RATIO = 0.9
+
+HASH_LENGTH = 12
+
+
+def _hashed_name(relative_path: str, data: bytes) -> str:
+    """
+    Agrega el hash del contenido al nombre de un archivo.
+    """
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    root, extension = os.path.splitext(relative_path)
+    return f"{root}.{digest}{extension}"
+
+
+def _compress(data: bytes, encoding: str) -> Optional[bytes]:
+    """
+    Comprime un archivo con la máxima compresión de cada formato.
+
+    Returns:
+        bytes: Contenido comprimido o None si el formato no está disponible
+    """
+    if encoding == "gzip":
+        # mtime=0 hace que el resultado dependa solo del contenido
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(data, quality=11)
+    return None
+
+
+def build_static_assets(source: str = STATIC_DIR) -> dict:
+    """
+    Genera `dist/` con las copias con hash, sus variantes y el manifiesto.
+
+    El directorio `dist/` anterior se reemplaza por completo.
+
+    Args:
+        source (str): Directorio de los archivos estáticos
+
+    Returns:
+        dict: Manifiesto: ruta original -> ruta con hash y codificaciones disponibles
+    """
+    output = os.path.join(source, DIST_NAME)
+    if os.path.isdir(output):
+        shutil.rmtree(output)
+
+    files = {}
+    for directory, subdirectories, filenames in os.walk(source):
+        if directory == source:
+            subdirectories[:] = [name for name in subdirectories if name != DIST_NAME]
+        for filename in sorted(filenames):
+            path = os.path.join(directory, filename)
+            relative_path = os.path.relpath(path, source).replace(os.sep, "/")
+            with open(path, "rb") as f:
+                data = f.read()
+
+            hashed_path = _hashed_name(relative_path, data)
+            target = os.path.join(output, *hashed_path.split("/"))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "wb") as f:
+                f.write(data)
+
+            encodings = []
+            if os.path.splitext(filename)[1].lower() in COMPRESSIBLE_EXTENSIONS:
+                for encoding, suffix in ENCODINGS:
+                    compressed = _compress(data, encoding)
+                    if compressed is not None and len(compressed) < len(data) * MIN_COMPRESSION_RATIO:
+                        with open(target + suffix, "wb") as f:
+                            f.write(compressed)
+                        encodings.append(encoding)
+            files[relative_path] = {"path": hashed_path, "encodings": encodings}
+
+    manifest = {"files": files}
+    with open(os.path.join(output, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+_manifest = None
+
+
+def get_manifest() -> dict:
+    """
+    Obtiene el manifiesto de `static/dist/`, leyéndolo la primera vez.
+
+    Returns:
+        dict: Archivos del manifiesto; vacío si no se ha ejecutado la construcción
+    """
+    global _manifest
+    if _manifest is None:
+        path = os.path.join(STATIC_DIR, DIST_NAME, MANIFEST_NAME)
+        try:
+            with open(path, encoding="utf-8") as f:
+                _manifest = json.load(f)["files"]
+        except FileNotFoundError:
+            _manifest = {}
+        except (ValueError, KeyError) as e:
+            logger.error(f"Manifiesto de archivos estáticos no válido: {str(e)}")
+            _manifest = {}
+    return _manifest
+
+
+def manifest_version() -> str:
+    """
+    Obtiene un hash del manifiesto de `static/dist/`.
+
+    Cambia cuando una construcción cambia algún archivo estático, por lo que
+    sirve para invalidar las representaciones que enlazan a esos archivos.
+
+    Returns:
+        str: Hash SHA-256 en hexadecimal del manifiesto
+    """
+    payload = json.dumps(get_manifest(), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def static_url(path: str) -> str:
+    """
+    Obtiene la URL de un archivo estático, con hash si existe en el manifiesto.
+
+    Args:
+        path (str): Ruta relativa a `static/`, p. ej. "css/style.css"
+
+    Returns:
+        str: URL del archivo
+    """
+    path = path.lstrip("/")
+    entry = get_manifest().get(path)
+    if entry is None:
+        return f"{STATIC_URL}/{path}"
+    return f"{STATIC_URL}/{DIST_NAME}/{entry['path']}"
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    `StaticFiles` que sirve las variantes precomprimidas de `dist/`.
+
+    Los archivos de `dist/` se envían con `Cache-Control: immutable` y, si el
+    cliente acepta brotli o gzip y existe la variante, con ella y su
+    `Content-Encoding`. El resto de los archivos usa `STATIC_CACHE_CONTROL`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = get_settings().static_cache_control
+        self._root = os.path.realpath(self.directory)
+        # Ruta con hash -> codificaciones disponibles, según el manifiesto
+        self._variants = {entry["path"]: entry["encodings"] for entry in get_manifest().values()}
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope,
+                      status_code: int = 200) -> Response:
+        relative_path = os.path.relpath(full_path, self._root).replace(os.sep, "/")
+        dist_prefix = f"{DIST_NAME}/"
+        if not relative_path.startswith(dist_prefix):
+            response = super().file_response(full_path, stat_result, scope, status_code)
+            response.headers["Cache-Control"] = self.cache_control
+            return response
+
+        request_headers = Headers(scope=scope)
+        encodings = self._variants.get(relative_path[len(dist_prefix):], [])
+        headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL}
+        if encodings:
+            headers["Vary"] = "Accept-Encoding"
+            accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+            for encoding, suffix in ENCODINGS:
+                if encoding in encodings and encoding in accepted:
+                    variant_path = f"{full_path}{suffix}"
+                    try:
+                        variant_stat = os.stat(variant_path)
+                    except FileNotFoundError:
+                        continue
+                    if stat.S_ISREG(variant_stat.st_mode):
+                        full_path, stat_result = variant_path, variant_stat
+                        headers["Content-Encoding"] = encoding
+                        break
+
+        media_type = mimetypes.guess_type(relative_path)[0] or "text/plain"
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result,
+                                method=scope["method"], media_type=media_type, headers=headers)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    result = build_static_assets()
+    compressed = sum(1 for entry in result["files"].values() if entry["encodings"])
+    logger.info(f"{len(result['files'])} archivos estáticos en {os.path.join(STATIC_DIR, DIST_NAME)} "
+                f"({compressed} con variantes comprimidas; brotli {'disponible' if brotli else 'no instalado'})")
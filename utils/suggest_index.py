@@ -0,0 +1,251 @@
+"""
+Índice de prefijos en memoria para el autocompletado.
+
+Este módulo mantiene, por cada campo sugerible (habilidades, cargos, empresas
+y ubicaciones), un arreglo ordenado de valores normalizados con su frecuencia.
+Las búsquedas por prefijo se resuelven con `bisect` sin consultar la base de
+datos. El índice se construye al iniciar la aplicación y se actualiza con cada
+creación, actualización o eliminación de perfiles en este proceso. Los cambios
+hechos por otros procesos (otros workers) se incorporan al reconstruirlo cada
+`SUGGEST_REFRESH_INTERVAL` segundos.
+"""
+
+import asyncio
+import bisect
+import heapq
+import logging
+import sys
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Campos del perfil que alimentan el índice
+SUGGEST_SOURCE_FIELDS = ["skills", "experiences", "location"]
+
+
+def _normalize(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+def extract_suggest_values(profile: dict) -> Dict[str, List[str]]:
+    """
+    Obtiene los valores sugeribles de un perfil, agrupados por campo.
+
+    Args:
+        profile (dict): Datos del perfil (puede ser parcial)
+
+    Returns:
+        Dict[str, List[str]]: Valores por campo
+    """
+    experiences = profile.get("experiences") or []
+    return {
+        "skill": [skill["name"] for skill in profile.get("skills") or []],
+        "position": [exp["position"] for exp in experiences],
+        "company": [exp["company"] for exp in experiences],
+        "location": [profile["location"]] if profile.get("location") else [],
+    }
+
+
+class PrefixIndex:
+    """
+    Arreglo ordenado de valores con su frecuencia, consultable por prefijo.
+
+    Los valores se comparan normalizados (sin distinguir mayúsculas ni
+    espacios repetidos) y se sugieren con la forma en que se vieron primero.
+    """
+
+    def __init__(self):
+        self._keys = []
+        self._counts = {}
+        self._display = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, value: str):
+        """
+        Agrega una ocurrencia de un valor.
+        """
+        key = _normalize(value)
+        if not key:
+            return
+        if key in self._counts:
+            self._counts[key] += 1
+            return
+        bisect.insort(self._keys, key)
+        self._counts[key] = 1
+        self._display[key] = value.strip()
+
+    def remove(self, value: str):
+        """
+        Elimina una ocurrencia de un valor.
+        """
+        key = _normalize(value)
+        count = self._counts.get(key)
+        if count is None:
+            return
+        if count > 1:
+            self._counts[key] = count - 1
+            return
+        del self._counts[key]
+        del self._display[key]
+        position = bisect.bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    def suggest(self, prefix: str, limit: int, scan_limit: int) -> List[dict]:
+        """
+        Obtiene los valores más frecuentes que empiezan por un prefijo.
+
+        Args:
+            prefix (str): Prefijo buscado
+            limit (int): Número máximo de sugerencias
+            scan_limit (int): Número máximo de valores revisados, para acotar
+                el tiempo de respuesta con prefijos muy cortos
+
+        Returns:
+            List[dict]: Sugerencias con su valor y frecuencia
+        """
+        key = _normalize(prefix)
+        start = bisect.bisect_left(self._keys, key)
+        matches = []
+        for candidate in self._keys[start:start + scan_limit]:
+            if not candidate.startswith(key):
+                break
+            matches.append(candidate)
+        best = heapq.nlargest(limit, matches, key=lambda candidate: self._counts[candidate])
+        return [{"value": self._display[candidate], "count": self._counts[candidate]} for candidate in best]
+
+    def memory_bytes(self) -> int:
+        """
+        Estima la memoria ocupada por el índice.
+
+        Returns:
+            int: Tamaño aproximado en bytes
+        """
+        # Copias: las métricas lo consultan desde otro hilo mientras el índice cambia
+        keys = list(self._keys)
+        values = list(self._display.values())
+        size = sys.getsizeof(self._keys) + sys.getsizeof(self._counts) + sys.getsizeof(self._display)
+        size += sum(sys.getsizeof(key) for key in keys)
+        size += sum(sys.getsizeof(value) for value in values)
+        return size
+
+
+class SuggestionIndex:
+    """
+    Conjunto de índices de prefijos, uno por campo sugerible.
+
+    Attributes:
+        ready (bool): True cuando el índice terminó de construirse
+    """
+
+    FIELDS = ("skill", "position", "company", "location")
+
+    def __init__(self):
+        self.ready = False
+        self._indexes = {field: PrefixIndex() for field in self.FIELDS}
+
+    async def build(self, profiles: AsyncIterator[dict]):
+        """
+        Construye el índice a partir de un flujo de perfiles.
+
+        Mientras se construye se sigue consultando el índice anterior, que se
+        reemplaza al terminar; si la lectura falla, se conserva.
+
+        Args:
+            profiles (AsyncIterator[dict]): Perfiles existentes
+        """
+        indexes = {field: PrefixIndex() for field in self.FIELDS}
+        count = 0
+        async for profile in profiles:
+            for field, values in extract_suggest_values(profile).items():
+                for value in values:
+                    indexes[field].add(value)
+            count += 1
+        self._indexes = indexes
+        self.ready = True
+        logger.info(f"Índice de sugerencias construido con {count} perfiles")
+
+    def add_profile(self, profile: dict):
+        """
+        Agrega los valores de un perfil al índice.
+        """
+        for field, values in extract_suggest_values(profile).items():
+            for value in values:
+                self._indexes[field].add(value)
+
+    def remove_profile(self, profile: dict):
+        """
+        Quita los valores de un perfil del índice.
+        """
+        for field, values in extract_suggest_values(profile).items():
+            for value in values:
+                self._indexes[field].remove(value)
+
+    def replace_profile(self, old_profile: dict, new_profile: dict):
+        """
+        Reemplaza los valores de un perfil actualizado.
+        """
+        self.remove_profile(old_profile)
+        self.add_profile(new_profile)
+
+    def suggest(self, field: str, prefix: str, limit: int) -> List[dict]:
+        """
+        Obtiene sugerencias de un campo para un prefijo.
+
+        Args:
+            field (str): Campo sugerible
+            prefix (str): Prefijo escrito por el usuario
+            limit (int): Número máximo de sugerencias
+
+        Returns:
+            List[dict]: Sugerencias ordenadas por frecuencia
+        """
+        return self._indexes[field].suggest(prefix, limit, get_settings().suggest_scan_limit)
+
+    def stats(self) -> dict:
+        """
+        Obtiene el tamaño del índice por campo y su memoria estimada.
+
+        Returns:
+            dict: Estado, valores distintos por campo y bytes aproximados
+        """
+        return {
+            "ready": self.ready,
+            "values": {field: len(index) for field, index in self._indexes.items()},
+            "memory_bytes": sum(index.memory_bytes() for index in self._indexes.values()),
+        }
+
+
+async def refresh_loop(build: Callable, interval: float):
+    """
+    Reconstruye el índice de sugerencias cada `interval` segundos.
+
+    Args:
+        build (Callable): Corrutina que reconstruye el índice con los perfiles guardados
+        interval (float): Segundos entre reconstrucciones
+    """
+    while True:
+        await asyncio.sleep(interval)
+        await build()
+
+
+_suggestion_index = None
+
+
+def get_suggestion_index() -> Optional[SuggestionIndex]:
+    """
+    Obtiene el índice de sugerencias si está habilitado en la configuración.
+
+    Returns:
+        SuggestionIndex: Índice de sugerencias o None si está deshabilitado
+    """
+    global _suggestion_index
+    if not get_settings().suggest_enabled:
+        return None
+    if _suggestion_index is None:
+        _suggestion_index = SuggestionIndex()
+    return _suggestion_index
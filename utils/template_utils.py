@@ -1,33 +1,85 @@
+import hashlib
+import os
+from typing import TYPE_CHECKING
+
+from config import BASE_DIR, get_settings
+from utils.metrics import RENDER_OUTPUT_BYTES, render_timer
+from utils.static_assets import static_url
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+TEMPLATES_DIR = os.path.join(BASE_DIR, "templates")
+
+_environment = None
+_templates_version = None
+
+
+def get_template_environment() -> "Environment":
+    """
+    Returns the process-wide Jinja environment, creating it on first use.
+
+    Templates are compiled once and kept in the environment cache. With
+    TEMPLATES_AUTO_RELOAD enabled, Jinja checks the template files on each
+    render and recompiles them when they change (useful during development).
+    Templates can call `static_url` to reference fingerprinted static assets.
+    Jinja itself is imported on first use to keep application startup fast.
+
+    Returns:
+        Environment: Jinja environment for the templates directory
+    """
+    global _environment
+    if _environment is None:
+        from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+        _environment = Environment(
+            loader=FileSystemLoader(TEMPLATES_DIR),
+            autoescape=select_autoescape(["html"]),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=get_settings().templates_auto_reload,
+        )
+        _environment.globals["static_url"] = static_url
+    return _environment
+
+
+def templates_version() -> str:
+    """
+    Returns a hash of the contents of every file in the templates directory.
+
+    The hash is computed once per process, or on every call when
+    TEMPLATES_AUTO_RELOAD is enabled, since templates may then change
+    while the process runs.
+
+    Returns:
+        str: Hex SHA-256 digest of the templates
+    """
+    global _templates_version
+    if _templates_version is None or get_settings().templates_auto_reload:
+        hasher = hashlib.sha256()
+        for root, dirs, files in os.walk(TEMPLATES_DIR):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                hasher.update(os.path.relpath(path, TEMPLATES_DIR).encode("utf-8"))
+                with open(path, "rb") as f:
+                    hasher.update(f.read())
+        _templates_version = hasher.hexdigest()
+    return _templates_version
+
+
 def render_html(profile: dict) -> str:
     """
     Renders the CV template with the provided profile data.
-    
+
     Args:
         profile (dict): Dictionary containing the user's profile information
-        
+
     Returns:
         str: Rendered HTML content
     """
-    with open("templates/cv_template.html", "r", encoding="utf-8") as f:
-        template = f.read()
-
-    experience_html = ''.join([
-        f"<li><b>{exp['title']}</b> en {exp['company']} ({exp['start_date']} - {exp.get('end_date', 'actual')}): {exp['description']}</li>"
-        for exp in profile['experiences']
-    ])
-
-    education_html = ''.join([
-        f"<li>{edu['degree']} - {edu['institution']} ({edu['year']})</li>"
-        for edu in profile['education']
-    ])
-
-    return template.format(
-        name=profile['name'],
-        email=profile['email'],
-        phone=profile['phone'],
-        location=profile['location'],
-        experiences=experience_html,
-        education=education_html,
-        skills=', '.join(profile['skills']),
-        languages=', '.join(profile['languages'])
-    )
+    template = get_template_environment().get_template("cv_template.html")
+    with render_timer("html"):
+        html = template.render(profile=profile, profile_id=profile["_id"])
+    RENDER_OUTPUT_BYTES.observe(len(html.encode("utf-8")), format="html")
+    return html
@@ -0,0 +1,95 @@
+"""
+Generación en flujo de archivos ZIP con los CVs en PDF.
+
+Este módulo construye un ZIP a medida que los PDFs se generan, de modo que los
+primeros bytes se envían al cliente antes de que termine el último PDF. Solo se
+mantienen en memoria los PDFs que se están generando en ese momento.
+"""
+
+import asyncio
+import logging
+import time
+import zipfile
+from typing import AsyncIterator
+
+from utils.pdf_utils import cv_filename, get_cv_pdf
+
+logger = logging.getLogger(__name__)
+
+
+class _ZipBuffer:
+    """
+    Archivo de solo escritura que acumula los bytes del ZIP hasta que se envían.
+
+    Al no soportar `seek`, zipfile escribe cada entrada con descriptor de datos
+    y no necesita volver atrás en el flujo.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        """
+        Retorna y descarta los bytes acumulados.
+        """
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+async def zip_cv_stream(profiles: AsyncIterator[dict], concurrency: int) -> AsyncIterator[bytes]:
+    """
+    Genera los PDFs de los perfiles en paralelo y los empaqueta en un ZIP en flujo.
+
+    Los PDFs se agregan al ZIP en el orden en que terminan. Si un PDF falla,
+    se agrega un archivo de texto con el error en su lugar.
+
+    Args:
+        profiles (AsyncIterator[dict]): Perfiles a incluir
+        concurrency (int): Número máximo de PDFs generándose a la vez
+
+    Yields:
+        bytes: Fragmentos del archivo ZIP
+    """
+    buffer = _ZipBuffer()
+    archive = zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_STORED)
+    pending = {}
+
+    def add_finished(done):
+        for task in done:
+            profile = pending.pop(task)
+            profile_id = profile["_id"]
+            date_time = time.localtime()[:6]
+            try:
+                name, content = f"{profile_id}_{cv_filename(profile)}", task.result()
+            except Exception as e:
+                logger.error(f"Error al generar PDF de {profile_id} para el ZIP: {str(e)}")
+                name, content = f"{profile_id}_error.txt", "Error al generar el PDF"
+            archive.writestr(zipfile.ZipInfo(name, date_time=date_time), content)
+
+    try:
+        async for profile in profiles:
+            pending[asyncio.ensure_future(get_cv_pdf(profile))] = profile
+            if len(pending) >= concurrency:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                add_finished(done)
+                yield buffer.drain()
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            add_finished(done)
+            yield buffer.drain()
+
+        archive.close()
+        yield buffer.drain()
+    finally:
+        # Si el cliente se desconecta se cancelan los PDFs que aún no terminan
+        for task in pending:
+            task.cancel()